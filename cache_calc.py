@@ -1,4 +1,44 @@
-from dataclasses import dataclass
+import sys
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+
+# Context sizes recommendations are rounded down to (sorted ascending)
+STANDARD_SIZES = [2048, 4096, 8192, 16384, 32768, 65536, 131072]
+
+# Extra bits per value spent on block scale metadata by llama.cpp KV cache types.
+# q8_0/q5_0/q4_0 store one fp16 scale per 32-value block; q5_1/q4_1 add an fp16 min.
+KV_SCALE_OVERHEAD_BPV = {
+    "f16": 0.0,
+    "q8_0": 0.5,
+    "q5_1": 1.0,
+    "q5_0": 0.5,
+    "q4_1": 1.0,
+    "q4_0": 0.5,
+}
+
+
+def _kv_pair(value):
+    """Split a shared value or a (K, V) tuple into a (K, V) pair."""
+    return tuple(value) if isinstance(value, (tuple, list)) else (value, value)
+
+
+@lru_cache(maxsize=256)
+def _kv_cache_bytes(
+    n_sliding_layers: int,
+    n_full_layers: int,
+    sliding_window: int,
+    context_length: int,
+    per_layer_per_token: float,
+) -> int:
+    """Memoized KV cache size; keyed on plain values so configs share entries."""
+    sliding_tokens = min(context_length, sliding_window)
+    sliding_bytes = int(n_sliding_layers * sliding_tokens * per_layer_per_token)
+    full_bytes = int(n_full_layers * context_length * per_layer_per_token)
+
+    return sliding_bytes + full_bytes
 
 
 @dataclass
@@ -10,16 +50,45 @@ class HybridModelConfig:
     sliding_window: int
     n_sliding_layers: int
     n_full_layers: int
+    _values_per_layer_token: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Values stored per layer per token in each of K and V (invariant across calls)
+        self._values_per_layer_token = self.n_kv_heads * self.head_dim
+
+    def per_layer_per_token_bytes(self, bytes_per_value=2.0, scale_overhead_bpv=0.0) -> float:
+        """Bytes of K plus V per layer per token.
+
+        bytes_per_value and scale_overhead_bpv (bits per value) each take either
+        one value shared by K and V or a (K, V) tuple, since runtimes often keep
+        K at higher precision than V (e.g. --cache-type-k q8_0 --cache-type-v q4_0).
+        """
+        k_bytes, v_bytes = _kv_pair(bytes_per_value)
+        k_overhead, v_overhead = _kv_pair(scale_overhead_bpv)
+        return self._values_per_layer_token * (
+            k_bytes + k_overhead / 8 + v_bytes + v_overhead / 8
+        )
     
-    def kv_cache_bytes(self, context_length: int, bytes_per_value: float = 2.0) -> int:
-        """Total KV cache size in bytes."""
-        per_layer_per_token = 2 * self.n_kv_heads * self.head_dim * bytes_per_value
-        
-        sliding_tokens = min(context_length, self.sliding_window)
-        sliding_bytes = int(self.n_sliding_layers * sliding_tokens * per_layer_per_token)
-        full_bytes = int(self.n_full_layers * context_length * per_layer_per_token)
-        
-        return sliding_bytes + full_bytes
+    def kv_cache_bytes(self, context_length: int, bytes_per_value=2.0, scale_overhead_bpv=0.0) -> int:
+        """Total KV cache size in bytes (see per_layer_per_token_bytes for arguments)."""
+        per_layer_per_token = self.per_layer_per_token_bytes(bytes_per_value, scale_overhead_bpv)
+        return _kv_cache_bytes(
+            self.n_sliding_layers, self.n_full_layers, self.sliding_window, context_length, per_layer_per_token
+        )
+
+    def max_context_for_budget(self, budget_bytes: float, bytes_per_value=2.0, scale_overhead_bpv=0.0) -> int:
+        """Largest context whose KV cache fits in budget_bytes (closed-form solve)."""
+        per_layer_per_token = self.per_layer_per_token_bytes(bytes_per_value, scale_overhead_bpv)
+
+        # Regime 1: context within the sliding window, every layer grows linearly
+        ctx = budget_bytes // ((self.n_sliding_layers + self.n_full_layers) * per_layer_per_token)
+
+        # Regime 2: sliding layers are capped at the window, only full layers grow
+        if ctx > self.sliding_window:
+            sliding_bytes = self.n_sliding_layers * self.sliding_window * per_layer_per_token
+            ctx = (budget_bytes - sliding_bytes) // (self.n_full_layers * per_layer_per_token)
+
+        return int(min(max(ctx, 1024), 131072))
 
 
 # Your model's config (extracted from JSON)
@@ -39,34 +108,26 @@ def estimate_max_context(
     config: HybridModelConfig,
     mmproj_size_mb: float = 0,
     vram_reserved_mb: int = 500,
-    kv_quant_factor: float = 1.0,  # 0.5 for Q8, 0.25 for Q4
+    kv_quant_factor=1.0,  # 0.5 for Q8, 0.25 for Q4; or a (K, V) tuple
+    kv_scale_overhead_bpv=0.0,  # see KV_SCALE_OVERHEAD_BPV; or a (K, V) tuple
 ) -> dict:
     """Estimate maximum context for hybrid attention model."""
+    bytes_per_value = tuple(2.0 * factor for factor in _kv_pair(kv_quant_factor))
     
     available_mb = vram_total_mb - vram_reserved_mb - model_size_mb - mmproj_size_mb
     available_bytes = available_mb * 1024 * 1024
     
-    # Binary search for max context that fits
-    low, high = 1024, 131072
-    max_context = low
-    
-    while low <= high:
-        mid = (low + high) // 2
-        kv_bytes = config.kv_cache_bytes(mid, bytes_per_value=2.0 * kv_quant_factor)
-        
-        if kv_bytes <= available_bytes:
-            max_context = mid
-            low = mid + 1
-        else:
-            high = mid - 1
+    # Solve directly for the max context that fits
+    max_context = config.max_context_for_budget(
+        available_bytes, bytes_per_value=bytes_per_value, scale_overhead_bpv=kv_scale_overhead_bpv
+    )
     
     # Round to standard sizes
-    standard_sizes = [2048, 4096, 8192, 16384, 32768, 65536, 131072]
-    recommended = max((s for s in standard_sizes if s <= max_context), default=2048)
-    conservative = max((s for s in standard_sizes if s <= max_context * 0.8), default=2048)
+    recommended = STANDARD_SIZES[max(bisect_right(STANDARD_SIZES, max_context) - 1, 0)]
+    conservative = STANDARD_SIZES[max(bisect_right(STANDARD_SIZES, max_context * 0.8) - 1, 0)]
     
     # Calculate actual memory at recommended size
-    kv_at_recommended = config.kv_cache_bytes(recommended, 2.0 * kv_quant_factor) / (1024**2)
+    kv_at_recommended = config.kv_cache_bytes(recommended, bytes_per_value, kv_scale_overhead_bpv) / (1024**2)
     
     return {
         "vram_total_mb": vram_total_mb,
@@ -80,38 +141,103 @@ def estimate_max_context(
     }
 
 
+def estimate_max_context_grid(
+    model_size_mb: float,
+    vram_totals_mb: list[int],
+    config: HybridModelConfig,
+    mmproj_size_mb: float = 0,
+    vram_reserved_mb: int = 500,
+    kv_quant_factors: tuple = (1.0,),
+    kv_scale_overhead_bpvs: tuple = None,
+) -> dict:
+    """Vectorized estimate_max_context over every (VRAM, KV quant) pair.
+
+    Each quant factor (and overhead, if given) may be shared or a (K, V) tuple,
+    as in estimate_max_context.
+    Returns arrays shaped (len(vram_totals_mb), len(kv_quant_factors)).
+    """
+    standard_sizes = np.array(STANDARD_SIZES)
+
+    vram = np.asarray(vram_totals_mb, dtype=np.float64)[:, None]
+    # (n_quants, 2) arrays of K/V bytes and scale overhead bits per value
+    bytes_per_value = 2.0 * np.array([_kv_pair(f) for f in kv_quant_factors], dtype=np.float64)
+    if kv_scale_overhead_bpvs is not None:
+        bytes_per_value += np.array([_kv_pair(o) for o in kv_scale_overhead_bpvs], dtype=np.float64) / 8
+    per_token = config._values_per_layer_token * bytes_per_value.sum(axis=1)[None, :]
+
+    available_mb = vram - vram_reserved_mb - model_size_mb - mmproj_size_mb
+    available_bytes = available_mb * 1024 * 1024
+
+    # Piecewise-linear solve, see HybridModelConfig.max_context_for_budget
+    ctx_small = available_bytes // ((config.n_sliding_layers + config.n_full_layers) * per_token)
+    ctx_large = (available_bytes - config.n_sliding_layers * config.sliding_window * per_token) // (
+        config.n_full_layers * per_token
+    )
+    max_context = np.clip(np.where(ctx_small > config.sliding_window, ctx_large, ctx_small), 1024, 131072)
+
+    # Round down to standard sizes (2048 floor)
+    recommended = standard_sizes[np.maximum(np.searchsorted(standard_sizes, max_context, side="right") - 1, 0)]
+    conservative = standard_sizes[np.maximum(np.searchsorted(standard_sizes, max_context * 0.8, side="right") - 1, 0)]
+
+    kv_at_recommended = (
+        config.n_sliding_layers * np.minimum(recommended, config.sliding_window) * per_token
+        + config.n_full_layers * recommended * per_token
+    ) / (1024**2)
+
+    return {
+        "available_for_kv_mb": np.broadcast_to(available_mb, max_context.shape),
+        "theoretical_max_context": max_context.astype(np.int64),
+        "recommended_context": recommended,
+        "conservative_context": conservative,
+        "kv_cache_at_recommended_mb": kv_at_recommended,
+    }
+
+
 if __name__ == "__main__":
     # Gemma 3 12B Q8_0 ≈ 12.5 GB, mmproj ≈ 0.6 GB
     model_mb = 12_500
     mmproj_mb = 600
+
+    # Build the whole report and write it once
+    lines = []
+    lines.append("\n" + "=" * 70)
+    lines.append("CONTEXT SIZE ESTIMATES FOR YOUR GEMMA 3 MODEL")
+    lines.append("=" * 70)
+    lines.append(f"Model: ~{model_mb/1024:.1f} GB | MMProj: ~{mmproj_mb/1024:.1f} GB")
+    lines.append(f"Architecture: {YOUR_MODEL.n_sliding_layers} sliding + {YOUR_MODEL.n_full_layers} full attention layers")
+    lines.append(f"Sliding window: {YOUR_MODEL.sliding_window} tokens")
+    lines.append("")
     
-    print("\n" + "=" * 70)
-    print("CONTEXT SIZE ESTIMATES FOR YOUR GEMMA 3 MODEL")
-    print("=" * 70)
-    print(f"Model: ~{model_mb/1024:.1f} GB | MMProj: ~{mmproj_mb/1024:.1f} GB")
-    print(f"Architecture: {YOUR_MODEL.n_sliding_layers} sliding + {YOUR_MODEL.n_full_layers} full attention layers")
-    print(f"Sliding window: {YOUR_MODEL.sliding_window} tokens")
-    print()
-    
-    for vram_gb in [16, 24, 32, 48]:
-        vram_mb = vram_gb * 1024
-        
-        print(f"\n{'─' * 70}")
-        print(f"GPU: {vram_gb} GB VRAM")
-        print(f"{'─' * 70}")
+    vram_gbs = [16, 24, 32, 48]
+    # (label, quant factor, llama.cpp cache type), with (K, V) tuples for mixed precision
+    kv_types = [
+        ("FP16", 1.0, "f16"),
+        ("Q8_0", 0.5, "q8_0"),
+        ("K=Q8_0, V=Q4_0", (0.5, 0.25), ("q8_0", "q4_0")),
+        ("Q4_0", 0.25, "q4_0"),
+    ]
+    grid = estimate_max_context_grid(
+        model_size_mb=model_mb,
+        vram_totals_mb=[gb * 1024 for gb in vram_gbs],
+        config=YOUR_MODEL,
+        mmproj_size_mb=mmproj_mb,
+        kv_quant_factors=[factor for _, factor, _ in kv_types],
+        kv_scale_overhead_bpvs=[
+            tuple(KV_SCALE_OVERHEAD_BPV[name] for name in _kv_pair(names)) for _, _, names in kv_types
+        ],
+    )
+
+    for i, vram_gb in enumerate(vram_gbs):
+        lines.append(f"\n{'─' * 70}")
+        lines.append(f"GPU: {vram_gb} GB VRAM")
+        lines.append(f"{'─' * 70}")
         
-        for kv_type, kv_factor in [("FP16", 1.0), ("Q8_0", 0.5), ("Q4_0", 0.25)]:
-            result = estimate_max_context(
-                model_size_mb=model_mb,
-                vram_total_mb=vram_mb,
-                config=YOUR_MODEL,
-                mmproj_size_mb=mmproj_mb,
-                kv_quant_factor=kv_factor,
-            )
-            
-            if result["available_for_kv_mb"] < 500:
-                print(f"  KV {kv_type}: ❌ Insufficient VRAM (need more headroom)")
+        for j, (kv_type, _, _) in enumerate(kv_types):
+            if grid["available_for_kv_mb"][i, j] < 500:
+                lines.append(f"  KV {kv_type}: ❌ Insufficient VRAM (need more headroom)")
             else:
-                print(f"  KV {kv_type}: recommended={result['recommended_context']:>6,} | "
-                      f"conservative={result['conservative_context']:>6,} | "
-                      f"KV cache={result['kv_cache_at_recommended_mb']:>5.0f} MB")
+                lines.append(f"  KV {kv_type}: recommended={grid['recommended_context'][i, j]:>6,} | "
+                             f"conservative={grid['conservative_context'][i, j]:>6,} | "
+                             f"KV cache={grid['kv_cache_at_recommended_mb'][i, j]:>5.0f} MB")
+
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -5,8 +5,19 @@ Debug script to compare scoring between direct score_job() and batch queue metho
 
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
+# Try to import orjson for C-level sanitization of the job dict
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dotenv import load_dotenv
@@ -18,28 +29,75 @@ from src.job_matcher.match_scorer import MatchScorer
 from src.core.storage import JobStorage
 
 
+# Per-type sanitizers, resolved once per concrete type and then reused
+_SANITIZERS = {}
+
+
+def _identity(value):
+    return value
+
+
+def _none_if_missing(value):
+    return None if pd.isna(value) else value
+
+
+def _sanitizer_for(value_type: type):
+    """Return the converter for a value type (cached by exact type)."""
+    converter = _SANITIZERS.get(value_type)
+    if converter is None:
+        if issubclass(value_type, np.ndarray):
+            converter = np.ndarray.tolist
+        elif issubclass(value_type, (np.integer, np.floating)):
+            converter = np.generic.item
+        elif issubclass(value_type, pd.Timestamp):
+            converter = pd.Timestamp.isoformat
+        elif issubclass(value_type, (float, np.generic, type(None), type(pd.NaT), type(pd.NA))):
+            converter = _none_if_missing
+        else:
+            converter = _identity
+        _SANITIZERS[value_type] = converter
+    return converter
+
+
+def _orjson_default(value):
+    """Convert the values orjson cannot serialize natively."""
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.ndarray):
+        # Object arrays (e.g. DuckDB list columns) fall through to here
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if pd.isna(value):
+        return None
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def sanitize_job(job: dict) -> dict:
+    """Make a DB row JSON-safe (native Python types, None for missing)."""
+    if ORJSON_AVAILABLE:
+        # One round-trip through orjson converts numpy/pandas values in C,
+        # including ones nested inside lists and dicts
+        try:
+            return orjson.loads(orjson.dumps(
+                job,
+                default=_orjson_default,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            ))
+        except orjson.JSONEncodeError:
+            pass
+
+    # Fallback: one dict lookup per field instead of an isinstance chain
+    return {key: _sanitizer_for(type(value))(value) for key, value in job.items()}
+
+
 def get_job():
     """Load the DraftKings job from DB."""
     storage = JobStorage()
     job = storage.get_job('https://www.indeed.com/viewjob?jk=65e4b37b7211d13d')
 
     # Sanitize like tune_matcher does
-    import numpy as np
-    import pandas as pd
-
-    sanitized = {}
-    for key, value in job.items():
-        if isinstance(value, np.ndarray):
-            sanitized[key] = value.tolist()
-        elif isinstance(value, (np.integer, np.floating)):
-            sanitized[key] = value.item()
-        elif isinstance(value, pd.Timestamp):
-            sanitized[key] = value.isoformat()
-        elif pd.isna(value):
-            sanitized[key] = None
-        else:
-            sanitized[key] = value
-    return sanitized
+    return sanitize_job(job)
 
 
 def main():
@@ -57,12 +115,25 @@ def main():
     job = get_job()
     print(f"\nJob: {job['title']} @ {job['company']}")
 
+    def progress(current, total, j):
+        pass
+
+    # Run both methods concurrently - they are independent and spend most of
+    # their time waiting on llama-server, so the second needn't queue behind
+    # the first. Each gets its own copy of the job.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future1 = executor.submit(scorer.score_job, job.copy(), use_hybrid_scoring=True)
+        future2 = executor.submit(
+            scorer.score_jobs_batch_queued, [job.copy()], progress, apply_pre_filters=False
+        )
+        result1 = future1.result()
+        results2 = future2.result()
+
     # Method 1: Direct score_job() - same as tune_matcher
     print("\n" + "-" * 60)
     print("METHOD 1: Direct score_job() [tune_matcher style]")
     print("-" * 60)
 
-    result1 = scorer.score_job(job.copy(), use_hybrid_scoring=True)
     if result1:
         breakdown1 = result1.get('scoring_breakdown', {})
         print(f"  Deterministic: {breakdown1.get('deterministic_score', 'N/A')}/40")
@@ -77,13 +148,6 @@ def main():
     print("METHOD 2: score_jobs_batch_queued() [API style]")
     print("-" * 60)
 
-    def progress(current, total, j):
-        pass
-
-    # Use a fresh copy of the job
-    jobs = [job.copy()]
-    results2 = scorer.score_jobs_batch_queued(jobs, progress, apply_pre_filters=False)
-
     if results2:
         result2 = results2[0]
         breakdown2 = result2.get('scoring_breakdown', {})
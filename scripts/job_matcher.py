@@ -18,10 +18,18 @@ import os
 import sys
 import json
 import argparse
+import asyncio
+import copy
+import functools
+import hashlib
+import threading
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterator
 from dotenv import load_dotenv
+import pandas as pd
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -38,23 +46,241 @@ from src.job_matcher import (
     EmailService,
     FailureTracker,
     ErrorType,
+    ResponseCache,
 )
+from src.job_matcher.llama_client import ASYNC_AVAILABLE
 from src.core.storage import JobStorage
 from src.core.database import get_database
+from src.utils import fast_json
+from src.utils.progress import ThrottledProgress
 
 load_dotenv()
 
+# Words ignored when building title keywords from target roles
+STOP_WORDS = frozenset({"and", "or", "the", "a", "an", "for", "to", "of", "in", "with"})
+
+# Source identifiers recognised in input filenames, checked in order
+JOB_SOURCES = ("indeed", "linkedin", "ziprecruiter", "glassdoor")
+
+# How run_full_pipeline treats an existing checkpoint when resuming is requested
+RESUME_POLICIES = ("auto", "prompt", "never")
+
+# Index of rendered reports by content hash, relative to the reports directory
+REPORT_CACHE_INDEX = Path(".cache") / "index.json"
+_REPORT_INDEX_LOCK = threading.Lock()
+
+# Rows fetched per DuckDB chunk when streaming jobs from the database
+DB_LOAD_BATCH_SIZE = 8192
+
+# Jobs table columns that need converting before they are JSON-friendly
+LIST_FIELDS = ("skills", "requirements", "benefits", "work_arrangements")
+TIMESTAMP_FIELDS = ("first_seen", "last_seen", "date_posted", "date_on_site", "applied_at")
+
+# Columns written back to the jobs table by save_matched_jobs
+MATCH_RESULT_COLUMNS = ["job_url", "match_score", "match_explanation", "is_relevant", "gap_analysis", "resume_suggestions"]
+
+# Component fields (and their defaults) that make up the stored JSON columns
+GAP_ANALYSIS_FIELDS = (("strengths", []), ("gaps", []), ("red_flags", []), ("assessment", ""))
+RESUME_SUGGESTION_FIELDS = (
+    ("keywords", []),
+    ("experience_highlights", []),
+    ("sections_to_expand", []),
+    ("cover_letter_points", []),
+    ("resume_summary", ""),
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _detect_source(filename: str) -> str:
+    """Source identifier for an input filename (see JobMatcherPipeline.detect_source_from_filename)"""
+    filename_lower = Path(filename).name.lower()
+
+    # First source identifier in the filename; default to indeed for backward compatibility
+    return next((source for source in JOB_SOURCES if source in filename_lower), "indeed")
+
+
+def _print_block(*lines: str):
+    """
+    Print several lines with one write
+
+    Status banners stay in one piece (one syscall on a line-buffered terminal)
+    and don't interleave with other threads' output when sources run concurrently.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _replace_by_url(jobs: List[Dict[str, Any]], updated: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Swap in updated copies of jobs (matched by job_url), keeping the original order"""
+    by_url = {job.get("job_url"): job for job in updated}
+    return [by_url.get(job.get("job_url"), job) for job in jobs]
+
+
+def _report_cache_key(
+    jobs: List[Dict[str, Any]], report_title: str, source_file: Optional[str], source: str
+) -> Optional[str]:
+    """
+    Content hash of everything a report is rendered from
+
+    Args:
+        jobs: Jobs going into the report
+        report_title: Report title
+        source_file: Source file recorded in the report metadata
+        source: Job source identifier
+
+    Returns:
+        Hex digest, or None if the jobs aren't JSON-serializable (report is not cached)
+    """
+    ordered = sorted(jobs, key=lambda job: str(job.get("job_url") or ""))
+    try:
+        payload = fast_json.dumps([report_title, source_file, source, ordered], sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_report_index(index_path: Path) -> Dict[str, str]:
+    """Load the report cache index ({content hash: report path}), empty if missing or unreadable"""
+    try:
+        index = fast_json.load_json_file(index_path)
+    except (ValueError, OSError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+@functools.lru_cache(maxsize=4)
+def _load_json_cached(path: str, mtime_ns: int) -> tuple:
+    """
+    Parse a JSON list file, memoized by (path, mtime)
+
+    A rewrite of the file changes its mtime, which invalidates the entry.
+
+    Args:
+        path: Path to the JSON file
+        mtime_ns: File modification time (os.stat().st_mtime_ns)
+
+    Returns:
+        Parsed items as a tuple (treat as read-only)
+    """
+    return tuple(fast_json.load_json_file(path))
+
+
+def _job_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert a jobs DataFrame (or chunk) from DuckDB into JSON-friendly dicts
+
+    Args:
+        df: Jobs DataFrame
+
+    Returns:
+        List of job dicts
+    """
+    # Convert array columns back to lists (DuckDB returns them as numpy arrays, NULL as NA)
+    for field in LIST_FIELDS:
+        if field in df.columns:
+            column = df[field]
+            empty_lists = pd.Series([[] for _ in range(len(df))], index=df.index, dtype=object)
+            df[field] = column.map(list, na_action='ignore').where(column.notna(), empty_lists)
+
+    # Convert timestamp columns to ISO strings for JSON serialization (same format as isoformat())
+    for field in TIMESTAMP_FIELDS:
+        if field in df.columns and pd.api.types.is_datetime64_any_dtype(df[field]):
+            column = df[field]
+            iso = column.dt.strftime('%Y-%m-%dT%H:%M:%S.%f').str.replace(r'\.000000$', '', regex=True)
+            df[field] = iso.astype(object).where(column.notna(), None)
+
+    return df.to_dict("records")
+
+
+def _column_or_default(df: pd.DataFrame, column: str, default: Any) -> List[Any]:
+    """Return a column as a list, with default for missing values (or a missing column)"""
+    if column not in df:
+        return [default] * len(df)
+    return [default if value is None else value for value in df[column].tolist()]
+
+
+def _compose_json_column(df: pd.DataFrame, column: str, fields: tuple) -> List[Any]:
+    """
+    Build a JSON text column, falling back to a dict assembled from component columns
+
+    Args:
+        df: Jobs DataFrame (missing values as None)
+        column: Column holding an existing value (dict or JSON string)
+        fields: (component column, default) pairs used when the value is missing
+
+    Returns:
+        List of JSON strings (or None where there is nothing to store)
+    """
+    count = len(df)
+    existing = df[column].tolist() if column in df else [None] * count
+    components = [df[name].tolist() if name in df else [None] * count for name, _ in fields]
+
+    values = []
+    for value, parts in zip(existing, zip(*components)):
+        if value is None and any(part is not None for part in parts):
+            value = {
+                name: default if part is None else part
+                for (name, default), part in zip(fields, parts)
+            }
+        values.append(fast_json.dumps(value) if isinstance(value, dict) else value)
+    return values
+
+
+# Background writer for JSON backups, so serialization overlaps DB/report work
+_WRITER = ThreadPoolExecutor(max_workers=2, thread_name_prefix="json-writer")
+
+
+def _write_json_backup(output_file: str, jobs: List[Dict[str, Any]]):
+    """Write a JSON backup file, reporting (not raising) failures from the writer thread"""
+    try:
+        fast_json.write_json_file(output_file, jobs)
+        # The consolidated file supersedes the per-stage journal
+        _journal_path(output_file).unlink(missing_ok=True)
+    except Exception as e:
+        print(f"[WARNING] Failed to write {output_file}: {e}")
+
+
+def _append_journal(output_file: str, jobs: List[Dict[str, Any]]):
+    """Append jobs to the matched-jobs journal, reporting (not raising) failures from the writer thread"""
+    try:
+        fast_json.append_jsonl_file(_journal_path(output_file), jobs)
+    except Exception as e:
+        print(f"[WARNING] Failed to append to {_journal_path(output_file)}: {e}")
+
+
+def _journal_path(output_file: str) -> Path:
+    """Path of the JSONL journal that holds per-stage saves for a matched jobs file"""
+    return Path(output_file).with_suffix(".jsonl")
+
+
+def _replay_journal(journal_file: Path) -> List[Dict[str, Any]]:
+    """
+    Rebuild the job list from a matched-jobs journal
+
+    Later lines for a job replace earlier ones; jobs keep the order they were first written in.
+    """
+    jobs: Dict[str, Dict[str, Any]] = {}
+    for job in fast_json.load_jsonl_file(journal_file):
+        jobs[job.get("job_url") or f"#{len(jobs)}"] = job
+    return list(jobs.values())
+
 
 class JobMatcherPipeline:
     """Main pipeline for job matching workflow"""
 
-    def __init__(self, enable_checkpoints: bool = True, enable_email: bool = None, use_batch_queue: bool = None):
+    def __init__(self, enable_checkpoints: bool = True, enable_email: bool = None, use_batch_queue: bool = None,
+                 use_llm_cache: bool = None, use_async: bool = None, use_pipelined: bool = None,
+                 use_fused: bool = None, resume_policy: Optional[str] = None):
         """Initialize all components
 
         Args:
             enable_checkpoints: Enable checkpoint/resume functionality
             enable_email: Override email config (None = use .env setting)
             use_batch_queue: Override batch queue mode (None = use .env setting)
+            use_llm_cache: Override LLM response caching (None = use .env setting)
+            use_async: Override async scoring mode (None = use .env setting)
+            use_pipelined: Override pipelined pass mode (None = use .env setting)
+            use_fused: Override fused single-call mode (None = use .env setting)
+            resume_policy: Checkpoint resume policy, one of RESUME_POLICIES (None = use .env setting)
         """
         print("Initializing Job Matcher Pipeline...")
 
@@ -77,8 +303,37 @@ class JobMatcherPipeline:
 
         self.tracker = JobTracker()
         self.client = LlamaClient()
+
+        # Reuse parsed LLM responses for prompts seen before (duplicate/reposted JDs),
+        # keyed on the loaded model so a model swap doesn't serve the old model's answers
+        self.use_llm_cache = use_llm_cache if use_llm_cache is not None else os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+        if self.use_llm_cache:
+            self.client.response_cache = ResponseCache(
+                profile_name=self.profile_name, model_id=self.client.get_model_id()
+            )
+
         self.analyzer = ResumeAnalyzer()
         self.analyzer.load_all()  # Load resume and requirements
+
+        # Title keywords for SQL pre-filtering (depend only on the loaded requirements)
+        candidate_profile = self.analyzer.candidate_profile
+        self._title_keywords_frozen = (
+            frozenset(
+                word
+                for role in candidate_profile.get("target_roles", [])
+                for word in role.lower().split()
+            )
+            | frozenset(k.lower() for k in candidate_profile.get("related_keywords", []))
+        ) - STOP_WORDS
+
+        # SQL filter toggles from .env (read once, not on every load)
+        self._filter_flags = {
+            name: os.getenv(f"FILTER_{name}_ENABLED", "true").lower() == "true"
+            for name in ("TITLE", "SALARY", "REMOTE", "JOB_TYPE", "LOCATION", "POSTING_AGE")
+        }
+        # Reuse content-filter verdicts between runs (only newly seen jobs are filtered)
+        self.use_filter_cache = os.getenv("SQL_FILTER_CACHE", "true").lower() == "true"
+
         self.scorer = MatchScorer(self.client, self.analyzer, self.checkpoint_manager, self.failure_tracker)
         self.gap_analyzer = GapAnalyzer(self.client, self.analyzer, self.checkpoint_manager, self.failure_tracker)
         self.optimizer = ResumeOptimizer(self.client, self.analyzer, self.checkpoint_manager, self.failure_tracker)
@@ -91,6 +346,24 @@ class JobMatcherPipeline:
         # Batch queue configuration (for constant GPU load)
         self.use_batch_queue = use_batch_queue if use_batch_queue is not None else os.getenv("BATCH_QUEUE_MODE", "true").lower() == "true"
 
+        # Async scoring mode (asyncio fan-out bounded by LLM_PARALLELISM; takes precedence over batch queue)
+        self.use_async = use_async if use_async is not None else os.getenv("LLM_ASYNC_MODE", "false").lower() == "true"
+
+        # Pipelined passes (score -> analyze -> optimize overlapped per job; full pipeline only)
+        self.use_pipelined = use_pipelined if use_pipelined is not None else os.getenv("LLM_PIPELINED_MODE", "false").lower() == "true"
+
+        # Fused mode (one LLM call per job for score + gap analysis + resume suggestions; full pipeline only)
+        self.use_fused = use_fused if use_fused is not None else os.getenv("FUSED_LLM", "false").lower() == "true"
+
+        # Checkpoint resume: "auto" resumes unattended if younger than the TTL, "prompt" asks, "never" starts fresh
+        self.resume_policy = (resume_policy or os.getenv("CHECKPOINT_RESUME_POLICY", "auto")).lower()
+        if self.resume_policy not in RESUME_POLICIES:
+            raise ValueError(f"Invalid resume policy '{self.resume_policy}' (expected one of {', '.join(RESUME_POLICIES)})")
+        self.checkpoint_ttl_hours = float(os.getenv("CHECKPOINT_TTL_HOURS", "24"))
+
+        # Run sources concurrently in process_all_sources (LLM requests share the client's slot limit)
+        self.parallel_sources = os.getenv("PARALLEL_SOURCES", "true").lower() == "true"
+
         # Email configuration
         self.email_enabled = enable_email if enable_email is not None else os.getenv("EMAIL_ENABLED", "false").lower() == "true"
         # Parse multiple email recipients (comma-separated)
@@ -99,6 +372,13 @@ class JobMatcherPipeline:
         self.email_send_on_completion = os.getenv("EMAIL_SEND_ON_COMPLETION", "true").lower() == "true"
         self.email_min_matches = int(os.getenv("EMAIL_MIN_MATCHES", "1"))
         self.email_subject_prefix = os.getenv("EMAIL_SUBJECT_PREFIX", "[Job Matcher]")
+        # Resolve email setup problems once; the configuration doesn't change during a run
+        if not self.email_recipients:
+            self._email_setup_problem = "Email recipients not configured. Run 'python setup_email.py'"
+        elif not self.email_service.is_configured():
+            self._email_setup_problem = "Email service not configured. Run 'python setup_email.py'"
+        else:
+            self._email_setup_problem = None
 
         # Job source detection
         self.job_source = "indeed"  # Default source
@@ -106,6 +386,21 @@ class JobMatcherPipeline:
         # SQL filter tracking (set by load_jobs_from_db when SQL filters are applied)
         self._sql_filters_applied = False
 
+        # Tracker filter tracking (set by load_jobs_from_db when processed jobs were excluded in SQL)
+        self._tracker_prefiltered = False
+
+        # Matched jobs file written by the last run_full_pipeline call
+        self._last_matched_file: Optional[str] = None
+
+        # Pending background JSON writes, keyed by output file
+        self._pending_writes: Dict[str, Future] = {}
+
+        # Field names of each job as last appended to the matched-jobs journal, keyed by job URL
+        self._journaled_fields: Dict[str, frozenset] = {}
+
+        # Clear the failure log at the start of each run (off for per-source copies; see _for_source)
+        self._reset_failures_per_run = True
+
         print("Pipeline initialized")
 
     def detect_source_from_filename(self, filename: str) -> str:
@@ -118,20 +413,29 @@ class JobMatcherPipeline:
         Returns:
             Source identifier (e.g., "indeed", "linkedin")
         """
-        filename_lower = Path(filename).name.lower()
-
-        # Check for source identifiers in filename
-        if "indeed" in filename_lower:
-            return "indeed"
-        elif "linkedin" in filename_lower:
-            return "linkedin"
-        elif "ziprecruiter" in filename_lower:
-            return "ziprecruiter"
-        elif "glassdoor" in filename_lower:
-            return "glassdoor"
-        else:
-            # Default to indeed for backward compatibility
-            return "indeed"
+        return _detect_source(filename)
+
+    def _for_source(self) -> "JobMatcherPipeline":
+        """
+        Create a copy of this pipeline for running one source alongside others
+
+        The copy shares the LLM client, storage, trackers and report/email services
+        (all safe to use from several threads), but gets its own checkpoint manager,
+        pass components and per-run state. It leaves the shared failure log alone;
+        process_all_sources clears that once for the whole run.
+
+        Returns:
+            Pipeline copy for a single source
+        """
+        pipeline = copy.copy(self)
+        pipeline.checkpoint_manager = CheckpointManager() if self.checkpoint_manager else None
+        pipeline.scorer = MatchScorer(self.client, self.analyzer, pipeline.checkpoint_manager, self.failure_tracker)
+        pipeline.gap_analyzer = GapAnalyzer(self.client, self.analyzer, pipeline.checkpoint_manager, self.failure_tracker)
+        pipeline.optimizer = ResumeOptimizer(self.client, self.analyzer, pipeline.checkpoint_manager, self.failure_tracker)
+        pipeline._pending_writes = {}
+        pipeline._journaled_fields = {}
+        pipeline._reset_failures_per_run = False
+        return pipeline
 
     def _process_pending_writes(self):
         """Process any pending database writes from previous failed saves."""
@@ -146,12 +450,13 @@ class JobMatcherPipeline:
         except Exception as e:
             print(f"[WARNING] Failed to process pending writes: {e}")
 
-    def load_jobs(self, input_file: str) -> List[Dict[str, Any]]:
+    def load_jobs(self, input_file: str, skip_processed: bool = False) -> List[Dict[str, Any]]:
         """
         Load jobs from DuckDB or JSON file
 
         Args:
             input_file: Path to JSON file or source identifier (e.g., "glassdoor")
+            skip_processed: Exclude already-tracked jobs in SQL when loading from DuckDB
 
         Returns:
             List of job dicts
@@ -159,13 +464,13 @@ class JobMatcherPipeline:
         # Check if input_file is a source identifier (not a file path)
         source_identifiers = ["indeed", "glassdoor", "linkedin", "ziprecruiter"]
         if input_file.lower() in source_identifiers:
-            return self.load_jobs_from_db(input_file.lower())
+            return self.load_jobs_from_db(input_file.lower(), skip_processed=skip_processed)
 
         # Check if it looks like a source pattern in the filename
         for source in source_identifiers:
             if source in input_file.lower():
                 print(f"\nLoading jobs from database (source: {source})...")
-                jobs = self.load_jobs_from_db(source)
+                jobs = self.load_jobs_from_db(source, skip_processed=skip_processed)
                 if jobs:
                     print(f"Loaded {len(jobs)} jobs from database")
                     return jobs
@@ -178,45 +483,67 @@ class JobMatcherPipeline:
         if not Path(input_file).exists():
             raise FileNotFoundError(f"Input file not found: {input_file}")
 
-        with open(input_file, "r", encoding="utf-8") as f:
-            jobs = json.load(f)
+        # Parse straight from bytes (orjson when available; NaN salaries fall back to json)
+        jobs = fast_json.load_json_file(input_file)
 
         # Mark that SQL filters were NOT applied (file loading doesn't use SQL)
         self._sql_filters_applied = False
+        self._tracker_prefiltered = False
 
         print(f"Loaded {len(jobs)} jobs from file")
         return jobs
 
-    def load_jobs_from_db(self, source: str, use_sql_filters: bool = True) -> List[Dict[str, Any]]:
+    def load_jobs_from_db(
+        self, source: str, use_sql_filters: bool = True, skip_processed: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Load unprocessed jobs from DuckDB with optional SQL-based pre-filtering
 
         Args:
             source: Job source identifier (e.g., "glassdoor", "indeed")
             use_sql_filters: If True, apply deterministic filters at SQL level (much faster)
+            skip_processed: If True (with SQL filters), exclude already-tracked jobs in the same query
 
         Returns:
             List of job dicts
         """
-        if use_sql_filters:
+        return list(self.iter_jobs_from_db(source, use_sql_filters, skip_processed))
+
+    def iter_jobs_from_db(
+        self,
+        source: str,
+        use_sql_filters: bool = True,
+        skip_processed: bool = False,
+        batch_size: int = DB_LOAD_BATCH_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream unprocessed jobs from DuckDB, converting one chunk at a time
+
+        Only a single DataFrame chunk is held alongside the yielded dicts, instead
+        of the full result set plus its record list.
+
+        Args:
+            source: Job source identifier (e.g., "glassdoor", "indeed")
+            use_sql_filters: If True, apply deterministic filters at SQL level (much faster)
+            skip_processed: If True (with SQL filters), exclude already-tracked jobs in the same query
+            batch_size: Approximate number of rows fetched per chunk
+
+        Yields:
+            Job dicts
+        """
+        if use_sql_filters and not skip_processed and not any(self._filter_flags.values()):
+            # Every filter disabled: plain scan, no keyword assembly or filter stats queries
+            print(f"\n🔍 All SQL filters disabled, loading every unprocessed job...")
+            self._sql_filters_applied = True
+            self._tracker_prefiltered = False
+            chunks = self.storage.iter_unprocessed_jobs(source, batch_size=batch_size)
+        elif use_sql_filters:
             # Extract filter parameters from analyzer
             candidate_profile = self.analyzer.candidate_profile
             preferences = self.analyzer.preferences
 
-            # Build title keywords from target roles and related keywords
-            title_keywords = []
-            target_roles = candidate_profile.get("target_roles", [])
-            related_keywords = candidate_profile.get("related_keywords", [])
-
-            # Extract individual words from target roles
-            for role in target_roles:
-                words = role.lower().split()
-                title_keywords.extend(words)
-            title_keywords.extend([k.lower() for k in related_keywords])
-
-            # Remove stop words and duplicates
-            stop_words = {"and", "or", "the", "a", "an", "for", "to", "of", "in", "with"}
-            title_keywords = list(set(k for k in title_keywords if k not in stop_words))
+            # Title keywords from target roles and related keywords (built once in __init__)
+            title_keywords = list(self._title_keywords_frozen)
 
             # Get exclude keywords
             title_exclude_keywords = candidate_profile.get("title_exclude_keywords", [])
@@ -229,24 +556,25 @@ class JobMatcherPipeline:
             locations = preferences.get("locations", [])
             max_job_age_days = preferences.get("max_job_age_days", 30)
 
-            # Check which filters are enabled via .env
-            if os.getenv('FILTER_TITLE_ENABLED', 'true').lower() != 'true':
+            # Check which filters are enabled (flags read from .env in __init__)
+            filter_flags = self._filter_flags
+            if not filter_flags["TITLE"]:
                 title_keywords = None
                 title_exclude_keywords = None
-            if os.getenv('FILTER_SALARY_ENABLED', 'true').lower() != 'true':
+            if not filter_flags["SALARY"]:
                 min_salary = None
                 max_salary = None
-            if os.getenv('FILTER_REMOTE_ENABLED', 'true').lower() != 'true':
+            if not filter_flags["REMOTE"]:
                 remote_only = False
-            if os.getenv('FILTER_JOB_TYPE_ENABLED', 'true').lower() != 'true':
+            if not filter_flags["JOB_TYPE"]:
                 job_types = None
-            if os.getenv('FILTER_LOCATION_ENABLED', 'true').lower() != 'true':
+            if not filter_flags["LOCATION"]:
                 locations = None
-            if os.getenv('FILTER_POSTING_AGE_ENABLED', 'true').lower() != 'true':
+            if not filter_flags["POSTING_AGE"]:
                 max_job_age_days = None
 
             print(f"\n🔍 Applying SQL-based filters to database...")
-            df, stats = self.storage.load_unprocessed_jobs_filtered(
+            chunks, stats = self.storage.iter_unprocessed_jobs_filtered(
                 source=source,
                 title_keywords=title_keywords if title_keywords else None,
                 title_exclude_keywords=title_exclude_keywords if title_exclude_keywords else None,
@@ -256,6 +584,9 @@ class JobMatcherPipeline:
                 job_types=job_types if job_types else None,
                 locations=locations if locations else None,
                 max_job_age_days=max_job_age_days,
+                exclude_tracked=skip_processed,
+                filter_cache=self.use_filter_cache,
+                batch_size=batch_size,
             )
 
             # Print filter stats
@@ -265,38 +596,14 @@ class JobMatcherPipeline:
 
             # Mark that SQL filtering was done (so Python filters can be skipped)
             self._sql_filters_applied = True
-
-            if df is None or df.empty:
-                return []
+            self._tracker_prefiltered = skip_processed
         else:
             self._sql_filters_applied = False
-            df = self.storage.load_unprocessed_jobs(source)
-            if df is None or df.empty:
-                return []
-
-        # Convert DataFrame to list of dicts
-        jobs = df.to_dict("records")
-
-        # Convert array columns back to lists (DuckDB returns them as numpy arrays)
-        list_fields = ['skills', 'requirements', 'benefits', 'work_arrangements']
-        for job in jobs:
-            for field in list_fields:
-                if field in job and job[field] is not None:
-                    # Convert numpy array or other iterable to list
-                    try:
-                        job[field] = list(job[field]) if job[field] is not None else []
-                    except (TypeError, ValueError):
-                        job[field] = []
-
-        # Convert timestamp fields to ISO strings for JSON serialization
-        timestamp_fields = ['first_seen', 'last_seen', 'date_posted', 'date_on_site', 'applied_at']
-        for job in jobs:
-            for field in timestamp_fields:
-                if field in job and job[field] is not None:
-                    if hasattr(job[field], 'isoformat'):
-                        job[field] = job[field].isoformat()
+            self._tracker_prefiltered = False
+            chunks = self.storage.iter_unprocessed_jobs(source, batch_size=batch_size)
 
-        return jobs
+        for df in chunks:
+            yield from _job_records(df)
 
     def filter_unprocessed_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -308,13 +615,16 @@ class JobMatcherPipeline:
         Returns:
             List of unprocessed jobs
         """
+        if self._tracker_prefiltered:
+            # Already excluded by the anti-join in load_jobs_from_db
+            return jobs
+
         print("\nFiltering already-processed jobs...")
 
-        unprocessed = []
-        for job in jobs:
-            job_url = job.get("job_url", "")
-            if not self.tracker.is_processed(job_url):
-                unprocessed.append(job)
+        processed_urls = self.tracker.get_processed_urls(
+            [job.get("job_url", "") for job in jobs]
+        )
+        unprocessed = [job for job in jobs if job.get("job_url", "") not in processed_urls]
 
         skipped = len(jobs) - len(unprocessed)
         print(f"{len(unprocessed)} unprocessed, {skipped} already processed")
@@ -339,18 +649,22 @@ class JobMatcherPipeline:
         """
         min_score = min_score or self.min_score
 
-        print(f"\n{'=' * 80}")
-        print("PASS 1: SCORING JOBS")
-        print(f"{'=' * 80}")
-        print(f"Minimum match score: {min_score}")
-        print(f"Jobs to score: {len(jobs)}")
-        print()
+        _print_block(
+            f"\n{'=' * 80}",
+            "PASS 1: SCORING JOBS",
+            f"{'=' * 80}",
+            f"Minimum match score: {min_score}",
+            f"Jobs to score: {len(jobs)}",
+            "",
+        )
 
         total_jobs = len(jobs)
 
+        progress = ThrottledProgress()
+
         def progress_callback(current, total, job):
             title = job.get("title", "Unknown")[:50]
-            print(f"[{current}/{total}] Scoring: {title}...")
+            progress.emit(f"[{current}/{total}] Scoring: {title}...", force=current == total)
             # Call API progress callback if provided
             if api_progress_callback:
                 api_progress_callback(current, total_jobs, f"Scoring job {current}/{total_jobs}: {title}")
@@ -360,12 +674,27 @@ class JobMatcherPipeline:
         if not apply_pre_filters:
             print("(SQL pre-filters already applied, skipping Python filters)")
 
-        print(f"Scoring jobs (batch queue mode: {self.use_batch_queue})...")
-        if self.use_batch_queue:
+        print(f"Scoring jobs (batch queue mode: {self.use_batch_queue}, async mode: {self.use_async})...")
+        if self.use_async:
+            scored_jobs = self.scorer.score_jobs_async(jobs, progress_callback, apply_pre_filters=apply_pre_filters)
+        elif self.use_batch_queue:
             scored_jobs = self.scorer.score_jobs_batch_queued(jobs, progress_callback, apply_pre_filters=apply_pre_filters)
         else:
             scored_jobs = self.scorer.score_jobs_batch(jobs, progress_callback, apply_pre_filters=apply_pre_filters)
 
+        return self._finish_scoring_pass(scored_jobs, min_score)
+
+    def _finish_scoring_pass(self, scored_jobs: List[Dict[str, Any]], min_score: int) -> List[Dict[str, Any]]:
+        """
+        Apply the score threshold and record Pass 1 results (exports, tracker, summary)
+
+        Args:
+            scored_jobs: Jobs returned by the scorer
+            min_score: Minimum score threshold
+
+        Returns:
+            List of matched jobs (score >= min_score)
+        """
         # Filter by minimum score
         print(f"\nFiltering jobs with score >= {min_score}...", flush=True)
         matched, rejected = self.scorer.filter_by_score(scored_jobs, min_score)
@@ -406,6 +735,9 @@ class JobMatcherPipeline:
         if rejected_file:
             print(f"   Rejected jobs saved to: {rejected_file}")
         print(f"   Failed: {len(failed_jobs)} jobs")
+        if self.client.response_cache is not None:
+            cache_stats = self.client.response_cache.get_stats()
+            print(f"   LLM Cache: {cache_stats['hits']} hits ({cache_stats['content_hits']} same posting, different prompt), {cache_stats['misses']} misses")
 
         return matched
 
@@ -422,18 +754,22 @@ class JobMatcherPipeline:
         Returns:
             List of analyzed jobs
         """
-        print(f"\n{'=' * 80}")
-        print("PASS 2: GAP ANALYSIS")
-        print(f"{'=' * 80}")
-        print(f"Jobs to analyze: {len(jobs)}")
-        print()
+        _print_block(
+            f"\n{'=' * 80}",
+            "PASS 2: GAP ANALYSIS",
+            f"{'=' * 80}",
+            f"Jobs to analyze: {len(jobs)}",
+            "",
+        )
 
         total_jobs = len(jobs)
 
+        progress = ThrottledProgress()
+
         def progress_callback(current, total, job):
             title = job.get("title", "Unknown")[:50]
             score = job.get("match_score", 0)
-            print(f"[{current}/{total}] Analyzing: {title} (Score: {score})...")
+            progress.emit(f"[{current}/{total}] Analyzing: {title} (Score: {score})...", force=current == total)
             # Call API progress callback if provided
             if api_progress_callback:
                 api_progress_callback(current, total_jobs, f"Analyzing job {current}/{total_jobs}: {title}")
@@ -443,6 +779,11 @@ class JobMatcherPipeline:
         else:
             analyzed_jobs = self.gap_analyzer.analyze_jobs_batch(jobs, progress_callback)
 
+        self._finish_analysis_pass(analyzed_jobs)
+        return analyzed_jobs
+
+    def _finish_analysis_pass(self, analyzed_jobs: List[Dict[str, Any]]):
+        """Export Pass 2 failures and print its summary"""
         # Export failed jobs
         failed_jobs = self.gap_analyzer.get_failed_jobs()
         if failed_jobs:
@@ -456,8 +797,6 @@ class JobMatcherPipeline:
         print(f"   Jobs with red flags: {stats['jobs_with_red_flags']}")
         print(f"   Failed: {len(failed_jobs)} jobs")
 
-        return analyzed_jobs
-
     def run_optimization_pass(
         self, jobs: List[Dict[str, Any]], api_progress_callback: Optional[callable] = None
     ) -> List[Dict[str, Any]]:
@@ -471,18 +810,22 @@ class JobMatcherPipeline:
         Returns:
             List of optimized jobs
         """
-        print(f"\n{'=' * 80}")
-        print("PASS 3: RESUME OPTIMIZATION")
-        print(f"{'=' * 80}")
-        print(f"Jobs to optimize: {len(jobs)}")
-        print()
+        _print_block(
+            f"\n{'=' * 80}",
+            "PASS 3: RESUME OPTIMIZATION",
+            f"{'=' * 80}",
+            f"Jobs to optimize: {len(jobs)}",
+            "",
+        )
 
         total_jobs = len(jobs)
 
+        progress = ThrottledProgress()
+
         def progress_callback(current, total, job):
             title = job.get("title", "Unknown")[:50]
             score = job.get("match_score", 0)
-            print(f"[{current}/{total}] Optimizing: {title} (Score: {score})...")
+            progress.emit(f"[{current}/{total}] Optimizing: {title} (Score: {score})...", force=current == total)
             # Call API progress callback if provided
             if api_progress_callback:
                 api_progress_callback(current, total_jobs, f"Optimizing job {current}/{total_jobs}: {title}")
@@ -492,6 +835,11 @@ class JobMatcherPipeline:
         else:
             optimized_jobs = self.optimizer.optimize_jobs_batch(jobs, progress_callback)
 
+        self._finish_optimization_pass(optimized_jobs)
+        return optimized_jobs
+
+    def _finish_optimization_pass(self, optimized_jobs: List[Dict[str, Any]]):
+        """Export Pass 3 failures and print its summary"""
         # Export failed jobs
         failed_jobs = self.optimizer.get_failed_jobs()
         if failed_jobs:
@@ -507,17 +855,228 @@ class JobMatcherPipeline:
                 print(f"     - {keyword}: appears in {count} jobs")
         print(f"   Failed: {len(failed_jobs)} jobs")
 
-        return optimized_jobs
+    def run_fused_pass(
+        self, jobs: List[Dict[str, Any]], min_score: Optional[int] = None,
+        api_progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Passes 1-3 with one LLM call per job
+
+        Each request returns the score together with the gap analysis and resume
+        recommendations, so the job description and resume are sent once. The
+        threshold still applies afterwards; matched jobs whose response lacked
+        a complete analysis/optimization group go through that pass as usual.
+
+        Args:
+            jobs: List of job dicts
+            min_score: Minimum score threshold (default: from config)
+            api_progress_callback: Optional callback for API progress updates
+
+        Returns:
+            Tuple of (matched jobs as scored, fully processed matched jobs)
+        """
+        min_score = min_score or self.min_score
+
+        _print_block(
+            f"\n{'=' * 80}",
+            "PASSES 1-3: FUSED (score + analysis + recommendations per request)",
+            f"{'=' * 80}",
+            f"Minimum match score: {min_score}",
+            f"Jobs to score: {len(jobs)}",
+            "",
+        )
+
+        total_jobs = len(jobs)
+
+        progress = ThrottledProgress()
+
+        def progress_callback(current, total, job):
+            title = job.get("title", "Unknown")[:50]
+            progress.emit(f"[{current}/{total}] Scoring + analyzing: {title}...", force=current == total)
+            if api_progress_callback:
+                api_progress_callback(current, total_jobs, f"Scoring job {current}/{total_jobs}: {title}")
+
+        # Skip Python pre-filters if SQL filters were already applied at load time
+        apply_pre_filters = not getattr(self, '_sql_filters_applied', False)
+        scored_jobs = self.scorer.score_jobs_async(
+            jobs, progress_callback, apply_pre_filters=apply_pre_filters, fused=True
+        )
+
+        matched = self._finish_scoring_pass(scored_jobs, min_score)
+        if not matched:
+            return [], []
+
+        # Redo only the stages the fused response didn't cover
+        analysis_fields = [name for name, _ in GAP_ANALYSIS_FIELDS]
+        processed = matched
+        incomplete = [job for job in processed if not all(name in job for name in analysis_fields)]
+        if incomplete:
+            print(f"\n{len(incomplete)} jobs need a separate gap analysis")
+            processed = _replace_by_url(processed, self.run_analysis_pass(incomplete))
+
+        optimization_fields = [name for name, _ in RESUME_SUGGESTION_FIELDS]
+        incomplete = [job for job in processed if not all(name in job for name in optimization_fields)]
+        if incomplete:
+            print(f"\n{len(incomplete)} jobs need separate resume recommendations")
+            processed = _replace_by_url(processed, self.run_optimization_pass(incomplete))
+
+        return matched, processed
+
+    def run_pipelined_passes(
+        self, jobs: List[Dict[str, Any]], min_score: Optional[int] = None,
+        api_progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Passes 1-3 as an overlapped dataflow
+
+        A job moves to gap analysis as soon as it is scored above the threshold,
+        and on to optimization as soon as it is analyzed, so the three stages
+        share llama-server's parallel slots instead of running back to back.
+        One semaphore (LLM_PARALLELISM, default: llama-server's slot count) caps
+        in-flight requests across stages.
+
+        Args:
+            jobs: List of job dicts
+            min_score: Minimum score threshold (default: from config)
+            api_progress_callback: Optional callback for API progress updates (scoring progress)
+
+        Returns:
+            Tuple of (matched jobs as scored, fully processed matched jobs)
+        """
+        min_score = min_score or self.min_score
+
+        if not ASYNC_AVAILABLE:
+            print("[WARNING] aiohttp not available - running passes sequentially")
+            matched = self.run_scoring_pass(jobs, min_score, api_progress_callback)
+            if not matched:
+                return [], []
+            return matched, self.run_optimization_pass(self.run_analysis_pass(matched))
+
+        parallelism = self.client.get_parallelism()
+
+        _print_block(
+            f"\n{'=' * 80}",
+            "PASSES 1-3: PIPELINED (score -> analyze -> optimize)",
+            f"{'=' * 80}",
+            f"Minimum match score: {min_score}",
+            f"Jobs to score: {len(jobs)}",
+            f"Parallel LLM requests: {parallelism}",
+            "",
+        )
+
+        # Skip Python pre-filters if SQL filters were already applied at load time
+        apply_pre_filters = not getattr(self, '_sql_filters_applied', False)
+        jobs_to_score = self.scorer.prepare_batch(jobs, apply_pre_filters)
+        self.gap_analyzer.failed_jobs = []
+        self.optimizer.failed_jobs = []
+
+        scored_jobs, optimized_jobs = asyncio.run(
+            self._run_pipelined_passes_async(jobs_to_score, min_score, parallelism, api_progress_callback)
+        )
+
+        matched = self._finish_scoring_pass(scored_jobs, min_score)
+        if matched:
+            self._finish_analysis_pass(optimized_jobs)
+            self._finish_optimization_pass(optimized_jobs)
+        return matched, optimized_jobs
+
+    async def _run_pipelined_passes_async(
+        self, jobs: List[Dict[str, Any]], min_score: int, parallelism: int,
+        api_progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Run stage workers connected by queues; returns (scored jobs, optimized jobs) in input order"""
+        import aiohttp
+
+        semaphore = asyncio.Semaphore(parallelism)
+        score_queue: asyncio.Queue = asyncio.Queue()
+        analysis_queue: asyncio.Queue = asyncio.Queue()
+        optimization_queue: asyncio.Queue = asyncio.Queue()
+
+        total = len(jobs)
+        scored_jobs: List[Optional[Dict[str, Any]]] = [None] * total
+        optimized: Dict[int, Dict[str, Any]] = {}
+        counts = {"scored": 0, "analyzed": 0, "optimized": 0}
+
+        for index, job in enumerate(jobs):
+            score_queue.put_nowait((index, job))
+
+        progress = ThrottledProgress()
+
+        def report(stage: str, verb: str, job: Dict[str, Any]):
+            counts[stage] += 1
+            title = job.get("title", "Unknown")[:50]
+            progress.emit(f"[{stage} {counts[stage]}] {verb}: {title} (Score: {job.get('match_score', 0)})")
+
+        async def score_worker(session):
+            while True:
+                index, job = await score_queue.get()
+                try:
+                    job_with_score = await self.scorer.score_job_async(session, job, semaphore)
+                    scored_jobs[index] = job_with_score
+                    report("scored", "Scored", job_with_score)
+                    if api_progress_callback:
+                        title = job.get("title", "Unknown")[:50]
+                        api_progress_callback(counts["scored"], total, f"Scoring job {counts['scored']}/{total}: {title}")
+                    # Threshold gate: only matches flow on to the next stage
+                    if job_with_score.get("match_score", 0) >= min_score:
+                        await analysis_queue.put((index, job_with_score))
+                finally:
+                    score_queue.task_done()
+
+        async def analysis_worker(session):
+            while True:
+                index, job = await analysis_queue.get()
+                try:
+                    analyzed_job = await self.gap_analyzer.analyze_job_async(session, job, semaphore)
+                    report("analyzed", "Analyzed", analyzed_job)
+                    await optimization_queue.put((index, analyzed_job))
+                finally:
+                    analysis_queue.task_done()
+
+        async def optimization_worker(session):
+            while True:
+                index, job = await optimization_queue.get()
+                try:
+                    optimized[index] = await self.optimizer.optimize_for_job_async(session, job, semaphore)
+                    report("optimized", "Optimized", optimized[index])
+                finally:
+                    optimization_queue.task_done()
+
+        connector = aiohttp.TCPConnector(limit=parallelism, limit_per_host=parallelism)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # Each stage gets enough workers to fill every slot; the shared
+            # semaphore keeps the total number of requests in flight bounded
+            workers = [
+                asyncio.create_task(worker(session))
+                for worker in (score_worker, analysis_worker, optimization_worker)
+                for _ in range(parallelism)
+            ]
+            try:
+                # Stages drain in order: once scoring is done nothing new enters analysis, etc.
+                await score_queue.join()
+                await analysis_queue.join()
+                await optimization_queue.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+        return scored_jobs, [optimized[index] for index in sorted(optimized)]
 
     def save_matched_jobs(
-        self, jobs: List[Dict[str, Any]], output_file: Optional[str] = None
+        self, jobs: List[Dict[str, Any]], output_file: Optional[str] = None, final: bool = True
     ) -> str:
         """
         Save matched jobs to DuckDB and optionally to JSON file
 
+        Intermediate saves (final=False) append only the jobs a pass changed to a
+        JSONL journal next to the JSON file; the final save writes the consolidated
+        JSON file once and removes the journal.
+
         Args:
             jobs: List of job dicts with match results
             output_file: Optional output filename for JSON backup
+            final: Write the consolidated JSON file (False = append changes to the journal)
 
         Returns:
             Path to saved JSON file (for report generation)
@@ -525,59 +1084,23 @@ class JobMatcherPipeline:
         # Update match results in DuckDB using batch operation
         print("\nUpdating match results in database...")
 
-        # Prepare jobs for batch update
-        jobs_to_update = []
-        for job in jobs:
-            job_url = job.get("job_url")
-            if not job_url:
-                continue
-
-            match_score = job.get("match_score")
-            if match_score is None:
-                continue
-
-            match_explanation = job.get("match_explanation", "")
-            is_relevant = job.get("is_relevant", True)
-
-            # Build gap_analysis from component fields if not already present
-            gap_analysis = job.get("gap_analysis")
-            if gap_analysis is None:
-                # Check if we have the component fields from GapAnalyzer
-                if any(job.get(field) is not None for field in ["strengths", "gaps", "red_flags", "assessment"]):
-                    gap_analysis = {
-                        "strengths": job.get("strengths", []),
-                        "gaps": job.get("gaps", []),
-                        "red_flags": job.get("red_flags", []),
-                        "assessment": job.get("assessment", ""),
-                    }
-
-            # Build resume_suggestions from component fields if not already present
-            resume_suggestions = job.get("resume_suggestions")
-            if resume_suggestions is None:
-                # Check if we have the component fields from ResumeOptimizer
-                if any(job.get(field) is not None for field in ["keywords", "experience_highlights", "sections_to_expand", "cover_letter_points", "resume_summary"]):
-                    resume_suggestions = {
-                        "keywords": job.get("keywords", []),
-                        "experience_highlights": job.get("experience_highlights", []),
-                        "sections_to_expand": job.get("sections_to_expand", []),
-                        "cover_letter_points": job.get("cover_letter_points", []),
-                        "resume_summary": job.get("resume_summary", ""),
-                    }
-
-            # Handle gap_analysis and resume_suggestions which might be dicts
-            if isinstance(gap_analysis, dict):
-                gap_analysis = json.dumps(gap_analysis)
-            if isinstance(resume_suggestions, dict):
-                resume_suggestions = json.dumps(resume_suggestions)
-
-            jobs_to_update.append({
-                "job_url": job_url,
-                "match_score": match_score,
-                "match_explanation": match_explanation,
-                "is_relevant": is_relevant,
-                "gap_analysis": gap_analysis,
-                "resume_suggestions": resume_suggestions,
-            })
+        # Prepare jobs for batch update, column by column
+        jobs_to_update = pd.DataFrame(columns=MATCH_RESULT_COLUMNS)
+        df = pd.DataFrame(jobs)
+        if "job_url" in df and "match_score" in df:
+            df = df.astype(object).where(df.notna(), None)
+            df = df[df["job_url"].map(bool) & df["match_score"].notna()]
+
+            # Build gap_analysis/resume_suggestions from component fields
+            # (GapAnalyzer/ResumeOptimizer) if not already present
+            jobs_to_update = pd.DataFrame({
+                "job_url": df["job_url"].tolist(),
+                "match_score": df["match_score"].tolist(),
+                "match_explanation": _column_or_default(df, "match_explanation", ""),
+                "is_relevant": _column_or_default(df, "is_relevant", True),
+                "gap_analysis": _compose_json_column(df, "gap_analysis", GAP_ANALYSIS_FIELDS),
+                "resume_suggestions": _compose_json_column(df, "resume_suggestions", RESUME_SUGGESTION_FIELDS),
+            }, columns=MATCH_RESULT_COLUMNS)
 
         # Batch update all jobs
         result = self.storage.update_match_results_batch(jobs_to_update)
@@ -598,10 +1121,20 @@ class JobMatcherPipeline:
         # Ensure data directory exists
         Path(output_file).parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(jobs, f, indent=2, ensure_ascii=False)
-
-        print(f"[INFO] Matched jobs also saved to: {output_file}")
+        if final:
+            self._write_json_in_background(output_file, jobs)
+            self._journaled_fields.clear()
+            print(f"[INFO] Matched jobs also saved to: {output_file}")
+        else:
+            # A pass adds fields to the jobs it processed; only those need re-writing
+            changed = [
+                job for job in jobs
+                if self._journaled_fields.get(job.get("job_url")) != frozenset(job)
+            ]
+            for job in changed:
+                self._journaled_fields[job.get("job_url")] = frozenset(job)
+            self._append_journal_in_background(output_file, changed)
+            print(f"[INFO] {len(changed)} changed jobs appended to: {_journal_path(output_file)}")
 
         # Update checkpoint with output file path
         if self.checkpoint_manager:
@@ -661,13 +1194,71 @@ class JobMatcherPipeline:
         # Ensure data directory exists
         Path(output_file).parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(rejected_jobs, f, indent=2, ensure_ascii=False)
+        self._write_json_in_background(output_file, rejected_jobs)
 
         print(f"\n[INFO] Rejected jobs (below threshold) saved to: {output_file}")
 
         return output_file
 
+    def _write_json_in_background(self, output_file: str, jobs: List[Dict[str, Any]]):
+        """
+        Queue a JSON file write on the background writer
+
+        Writes to the same file are kept in submission order.
+
+        Args:
+            output_file: Destination path
+            jobs: List of job dicts (shallow-copied so later passes can't race the writer)
+        """
+        pending = self._pending_writes.get(output_file)
+        if pending is not None:
+            pending.result()
+
+        snapshot = [dict(job) for job in jobs]
+        self._pending_writes[output_file] = _WRITER.submit(_write_json_backup, output_file, snapshot)
+
+    def _append_journal_in_background(self, output_file: str, jobs: List[Dict[str, Any]]):
+        """
+        Queue a journal append on the background writer, ordered with writes to the same file
+
+        Args:
+            output_file: Matched jobs file the journal belongs to
+            jobs: Jobs to append (shallow-copied so later passes can't race the writer)
+        """
+        pending = self._pending_writes.get(output_file)
+        if pending is not None:
+            pending.result()
+
+        snapshot = [dict(job) for job in jobs]
+        self._pending_writes[output_file] = _WRITER.submit(_append_journal, output_file, snapshot)
+
+    def _complete_stages(self, output_file: str, stages: List[str], matched_count: Optional[int] = None):
+        """
+        Mark stages complete in the checkpoint once their matched jobs file is on disk
+
+        The stage's save may still be queued on the background writer; a checkpoint
+        that claimed the stage before the file landed would resume from stale data.
+
+        Args:
+            output_file: Matched jobs file written for these stages
+            stages: Pipeline stages to mark complete
+            matched_count: Optional count of matched jobs (scoring stage)
+        """
+        if not self.checkpoint_manager:
+            return
+
+        pending = self._pending_writes.pop(output_file, None)
+        if pending is not None:
+            pending.result()
+
+        self.checkpoint_manager.mark_stages_completed(stages, matched_count)
+
+    def wait_for_writes(self):
+        """Block until all queued JSON writes have finished"""
+        for future in list(self._pending_writes.values()):
+            future.result()
+        self._pending_writes.clear()
+
     def load_checkpoint_data(self, input_file: str) -> Optional[List[Dict[str, Any]]]:
         """
         Load partial results from checkpoint
@@ -686,13 +1277,22 @@ class JobMatcherPipeline:
             return None
 
         # Load partial results from matched_jobs file
+        self.wait_for_writes()
         output_file = self.checkpoint_manager.get_output_file("matched_jobs")
+        # Interrupted mid-run: the journal holds the latest per-stage saves
+        if output_file and _journal_path(output_file).exists():
+            try:
+                return _replay_journal(_journal_path(output_file))
+            except (ValueError, TypeError, OSError) as e:
+                print(f"[WARNING] Failed to load checkpoint journal {_journal_path(output_file)}: {e}")
+                return None
         if output_file and Path(output_file).exists():
             try:
-                with open(output_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"[WARNING] Failed to load checkpoint data: {e}")
+                cached = _load_json_cached(str(output_file), os.stat(output_file).st_mtime_ns)
+                # Shallow-copy each job so later passes can't mutate the cached parse
+                return [dict(job) for job in cached]
+            except (ValueError, TypeError, OSError) as e:
+                print(f"[WARNING] Failed to load checkpoint data from {output_file}: {e}")
                 return None
 
         return None
@@ -706,14 +1306,7 @@ class JobMatcherPipeline:
         """
         print("\nUpdating job tracker...")
 
-        for job in jobs:
-            self.tracker.add_job(
-                job_url=job.get("job_url", ""),
-                job_title=job.get("title", "Unknown"),
-                company=job.get("company", "Unknown"),
-                location=job.get("location", "Unknown"),
-                match_score=job.get("match_score", 0),
-            )
+        self.tracker.add_jobs_batch(jobs, default_score=0)
 
         print("Job tracker updated")
 
@@ -749,71 +1342,104 @@ class JobMatcherPipeline:
         Returns:
             Path to generated report
         """
-        print(f"\n{'=' * 80}")
-        print("GENERATING REPORT")
-        print(f"{'=' * 80}")
+        _print_block(
+            f"\n{'=' * 80}",
+            "GENERATING REPORT",
+            f"{'=' * 80}",
+        )
 
         if not report_title:
             report_title = f"Job Match Report - {self.job_source.title()} - {datetime.now().strftime('%B %d, %Y')}"
 
+        # Reuse the previous report if the same jobs were already rendered under this title
+        cache_key = _report_cache_key(jobs, report_title, source_file, self.job_source)
+        index_path = Path(self.report_gen.output_dir) / REPORT_CACHE_INDEX
+        cached_path = _load_report_index(index_path).get(cache_key) if cache_key else None
+        if cached_path and Path(cached_path).exists():
+            print(f"\nReport unchanged, reusing: {cached_path}")
+            return cached_path
+
         report_path = self.report_gen.generate_report(jobs, report_title, source_file=source_file, source=self.job_source)
 
+        if cache_key:
+            # Re-read under the lock so concurrent sources don't drop each other's entries
+            with _REPORT_INDEX_LOCK:
+                index = _load_report_index(index_path)
+                # Drop entries for deleted reports or for a file this render just overwrote
+                index = {key: path for key, path in index.items() if path != report_path and Path(path).exists()}
+                index[cache_key] = report_path
+                try:
+                    index_path.parent.mkdir(parents=True, exist_ok=True)
+                    fast_json.write_json_file(index_path, index)
+                except OSError as e:
+                    print(f"Warning: Could not update report cache index: {e}")
+
         print(f"\nReport generated: {report_path}")
 
         return report_path
 
-    def send_email_report(
-        self, jobs: List[Dict[str, Any]], report_path: str
-    ) -> bool:
+    def _should_send_email(self, match_count: int, match_label: str = "matches") -> bool:
         """
-        Send email with job match report to all configured recipients
+        Check whether a completion email should be sent
 
         Args:
-            jobs: List of matched jobs
-            report_path: Path to HTML report
+            match_count: Number of matched jobs the email would contain
+            match_label: How to describe the count in the skip message
 
         Returns:
-            True if email sent successfully to at least one recipient, False otherwise
+            True if email is enabled and configured and there are enough matches
         """
-        # Check if email is enabled
         if not self.email_enabled or not self.email_send_on_completion:
             return False
 
-        # Check if we have enough matches
-        if len(jobs) < self.email_min_matches:
-            print(f"\n[INFO] Skipping email: Only {len(jobs)} matches (minimum: {self.email_min_matches})")
+        if match_count < self.email_min_matches:
+            print(f"\n[INFO] Skipping email: Only {match_count} {match_label} (minimum: {self.email_min_matches})")
             return False
 
-        # Check if recipients are configured
-        if not self.email_recipients:
-            print("\n[WARNING] Email recipients not configured. Run 'python setup_email.py'")
+        if self._email_setup_problem:
+            print(f"\n[WARNING] {self._email_setup_problem}")
             return False
 
-        # Check if email service is configured
-        if not self.email_service.is_configured():
-            print("\n[WARNING] Email service not configured. Run 'python setup_email.py'")
-            return False
+        return True
 
-        print(f"\n{'=' * 80}")
-        print("SENDING EMAIL REPORT")
-        print(f"{'=' * 80}")
-        print(f"Recipients: {', '.join(self.email_recipients)}")
-        print(f"Matches: {len(jobs)}")
-        print()
+    def send_email_report(
+        self, jobs: List[Dict[str, Any]], report_path: str, body_html: Optional[str] = None
+    ) -> bool:
+        """
+        Send email with job match report to all configured recipients
 
-        # Send email to each recipient
-        all_success = True
-        for recipient in self.email_recipients:
-            print(f"Sending to {recipient}...")
-            success = self.email_service.send_report(
-                recipient=recipient,
-                jobs=jobs,
-                report_path=report_path,
-                subject_prefix=self.email_subject_prefix,
-            )
+        Args:
+            jobs: List of matched jobs
+            report_path: Path to HTML report
+            body_html: Prebuilt email body (default: built when sending)
+
+        Returns:
+            True if email sent successfully to at least one recipient, False otherwise
+        """
+        if not self._should_send_email(len(jobs)):
+            return False
 
+        _print_block(
+            f"\n{'=' * 80}",
+            "SENDING EMAIL REPORT",
+            f"{'=' * 80}",
+            f"Recipients: {', '.join(self.email_recipients)}",
+            f"Matches: {len(jobs)}",
+            "",
+        )
+
+        # Build the email once and send it to each recipient
+        results = self.email_service.send_report_to_recipients(
+            recipients=self.email_recipients,
+            jobs=jobs,
+            report_path=report_path,
+            subject_prefix=self.email_subject_prefix,
+            body_html=body_html,
+        )
+
+        all_success = all(results.values())
+        for recipient, success in results.items():
             if not success:
-                all_success = False
                 print(f"  ✗ Failed to send to {recipient}")
             # Success message is printed by email_service
 
@@ -824,12 +1450,53 @@ class JobMatcherPipeline:
 
         return all_success
 
+    def _should_resume(self, input_file: str, policy: str) -> bool:
+        """
+        Decide whether to resume from an existing checkpoint for input_file
+
+        Args:
+            input_file: Path to jobs file (or source identifier) the checkpoint is keyed on
+            policy: One of RESUME_POLICIES
+
+        Returns:
+            True to resume; False to start fresh (a stale or declined checkpoint is cleared)
+        """
+        if policy == "never" or not self.checkpoint_manager.has_checkpoint(input_file):
+            return False
+
+        self.checkpoint_manager.load_checkpoint(input_file)
+        print("\n" + "=" * 80)
+        print("CHECKPOINT FOUND")
+        print("=" * 80)
+        print(self.checkpoint_manager.get_summary())
+        print("=" * 80)
+
+        # Unattended runs (cron, CI, web) can't answer a prompt
+        if policy == "prompt" and not sys.stdin.isatty():
+            policy = "auto"
+
+        if policy == "prompt":
+            response = input("\nResume from checkpoint? (y/n): ").strip().lower()
+            if response == 'y':
+                return True
+            print("Starting fresh pipeline...")
+        else:
+            age_hours = self.checkpoint_manager.get_age_hours()
+            if age_hours is None or age_hours <= self.checkpoint_ttl_hours:
+                print("\nResuming from checkpoint")
+                return True
+            print(f"\nCheckpoint is {age_hours:.1f}h old (limit: {self.checkpoint_ttl_hours:g}h), starting fresh pipeline...")
+
+        self.checkpoint_manager.clear_checkpoint()
+        return False
+
     def run_full_pipeline(
         self,
         input_file: str,
         min_score: Optional[int] = None,
         skip_processed: bool = True,
         resume_from_checkpoint: bool = False,
+        resume_policy: Optional[str] = None,
     ) -> str:
         """
         Run complete pipeline: load -> score -> analyze -> optimize -> report
@@ -839,6 +1506,7 @@ class JobMatcherPipeline:
             min_score: Minimum match score threshold
             skip_processed: Skip already-processed jobs
             resume_from_checkpoint: Resume from checkpoint if available
+            resume_policy: How to decide whether to resume (default: pipeline setting)
 
         Returns:
             Path to generated report
@@ -848,28 +1516,19 @@ class JobMatcherPipeline:
         # Check for existing checkpoint
         resuming = False
         if resume_from_checkpoint and self.checkpoint_manager:
-            if self.checkpoint_manager.has_checkpoint(input_file):
-                print("\n" + "=" * 80)
-                print("CHECKPOINT FOUND")
-                print("=" * 80)
-                print(self.checkpoint_manager.get_summary())
-                print("=" * 80)
-                response = input("\nResume from checkpoint? (y/n): ").strip().lower()
-                if response == 'y':
-                    resuming = True
-                else:
-                    print("Starting fresh pipeline...")
-                    self.checkpoint_manager.clear_checkpoint()
+            resuming = self._should_resume(input_file, resume_policy or self.resume_policy)
 
         print(f"\n{'=' * 80}")
         print("JOB MATCHER - FULL PIPELINE")
         if resuming:
             print("(RESUMING FROM CHECKPOINT)")
-        print(f"{'=' * 80}")
-        print(f"Input: {input_file}")
-        print(f"Min Score: {min_score}")
-        print(f"Skip Processed: {skip_processed}")
-        print(f"{'=' * 80}")
+        _print_block(
+            f"{'=' * 80}",
+            f"Input: {input_file}",
+            f"Min Score: {min_score}",
+            f"Skip Processed: {skip_processed}",
+            f"{'=' * 80}",
+        )
 
         # Detect job source from input filename
         self.job_source = self.detect_source_from_filename(input_file)
@@ -889,6 +1548,9 @@ class JobMatcherPipeline:
                 f"{self.client.server_url}?"
             )
         print("Connected to llama-server")
+        if self.client.response_cache is not None:
+            # The server may have been down at startup, or switched models since
+            self.client.response_cache.model_id = self.client.get_model_id(refresh=True)
 
         # Initialize or resume from checkpoint
         matched_jobs = []
@@ -910,7 +1572,7 @@ class JobMatcherPipeline:
                     self.checkpoint_manager.clear_checkpoint()
 
         # Load jobs
-        jobs = self.load_jobs(input_file)
+        jobs = self.load_jobs(input_file, skip_processed=skip_processed)
 
         # Filter already-processed jobs if requested
         if skip_processed:
@@ -925,12 +1587,21 @@ class JobMatcherPipeline:
             self.checkpoint_manager.create_checkpoint(input_file, min_score)
 
         # Clear previous run failures (start fresh for this pipeline)
-        if not resuming:
+        if not resuming and self._reset_failures_per_run:
             self.failure_tracker.reset()
 
-        # Pass 1: Scoring (skip if already completed in checkpoint)
-        if not resuming or not self.checkpoint_manager.is_stage_completed("scoring"):
-            matched_jobs = self.run_scoring_pass(jobs, min_score)
+        # Every pass prompt starts with the candidate block; process it once up front
+        if self.client.warm_prompt_cache(self.analyzer.get_candidate_context()):
+            print("Warmed llama-server prompt cache with candidate context")
+
+        if (self.use_fused or self.use_pipelined) and not resuming:
+            if self.use_fused:
+                # Passes 1-3 in one request per job
+                matched_jobs, optimized_jobs = self.run_fused_pass(jobs, min_score)
+            else:
+                # Passes 1-3 overlapped: each job moves on to analysis and optimization as soon as
+                # it's scored. Stages are marked complete together once the matched file is saved.
+                matched_jobs, optimized_jobs = self.run_pipelined_passes(jobs, min_score)
 
             if not matched_jobs:
                 print("\n[WARNING] No jobs met the minimum score threshold!")
@@ -938,51 +1609,70 @@ class JobMatcherPipeline:
                     self.checkpoint_manager.clear_checkpoint()
                 return ""
 
-            # Save matched jobs
-            matched_file = self.save_matched_jobs(matched_jobs, matched_file)
-
-            # Mark scoring stage as complete
-            if self.checkpoint_manager:
-                self.checkpoint_manager.mark_stage_completed("scoring", len(matched_jobs))
+            matched_file = self.save_matched_jobs(optimized_jobs, matched_file)
+            self._complete_stages(matched_file, ["scoring", "analysis", "optimization"], len(matched_jobs))
         else:
-            print(f"\nScoring already complete ({len(matched_jobs)} matched jobs)")
+            # Pass 1: Scoring (skip if already completed in checkpoint)
+            if not resuming or not self.checkpoint_manager.is_stage_completed("scoring"):
+                matched_jobs = self.run_scoring_pass(jobs, min_score)
 
-        # Pass 2: Gap Analysis (skip if already completed in checkpoint)
-        if not resuming or not self.checkpoint_manager.is_stage_completed("analysis"):
-            analyzed_jobs = self.run_analysis_pass(matched_jobs)
+                if not matched_jobs:
+                    print("\n[WARNING] No jobs met the minimum score threshold!")
+                    if self.checkpoint_manager:
+                        self.checkpoint_manager.clear_checkpoint()
+                    return ""
 
-            # Save updated jobs after analysis
-            self.save_matched_jobs(analyzed_jobs, matched_file)
+                # Save matched jobs
+                matched_file = self.save_matched_jobs(matched_jobs, matched_file, final=False)
 
-            # Mark analysis stage as complete
-            if self.checkpoint_manager:
-                self.checkpoint_manager.mark_stage_completed("analysis")
-        else:
-            analyzed_jobs = matched_jobs
-            print(f"\nAnalysis already complete ({len(analyzed_jobs)} jobs)")
+                # Mark scoring stage as complete
+                self._complete_stages(matched_file, ["scoring"], len(matched_jobs))
+            else:
+                print(f"\nScoring already complete ({len(matched_jobs)} matched jobs)")
 
-        # Pass 3: Resume Optimization (skip if already completed in checkpoint)
-        if not resuming or not self.checkpoint_manager.is_stage_completed("optimization"):
-            optimized_jobs = self.run_optimization_pass(analyzed_jobs)
+            # Pass 2: Gap Analysis (skip if already completed in checkpoint)
+            if not resuming or not self.checkpoint_manager.is_stage_completed("analysis"):
+                analyzed_jobs = self.run_analysis_pass(matched_jobs)
 
-            # Save final jobs after optimization
-            self.save_matched_jobs(optimized_jobs, matched_file)
+                # Save updated jobs after analysis
+                self.save_matched_jobs(analyzed_jobs, matched_file, final=False)
 
-            # Mark optimization stage as complete
-            if self.checkpoint_manager:
-                self.checkpoint_manager.mark_stage_completed("optimization")
-        else:
-            optimized_jobs = analyzed_jobs
-            print(f"\nOptimization already complete ({len(optimized_jobs)} jobs)")
+                # Mark analysis stage as complete
+                self._complete_stages(matched_file, ["analysis"])
+            else:
+                analyzed_jobs = matched_jobs
+                print(f"\nAnalysis already complete ({len(analyzed_jobs)} jobs)")
+
+            # Pass 3: Resume Optimization (skip if already completed in checkpoint)
+            if not resuming or not self.checkpoint_manager.is_stage_completed("optimization"):
+                optimized_jobs = self.run_optimization_pass(analyzed_jobs)
+
+                # Save final jobs after optimization
+                self.save_matched_jobs(optimized_jobs, matched_file)
+
+                # Mark optimization stage as complete
+                self._complete_stages(matched_file, ["optimization"])
+            else:
+                optimized_jobs = analyzed_jobs
+                print(f"\nOptimization already complete ({len(optimized_jobs)} jobs)")
 
         # Update tracker
         self.update_tracker(optimized_jobs)
 
-        # Generate report (pass source file for metadata reference)
-        report_path = self.generate_report(optimized_jobs, source_file=matched_file)
+        # Generate report (pass source file for metadata reference) in the background
+        # while the email body is built, then send once the report file exists
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            report_future = executor.submit(self.generate_report, optimized_jobs, source_file=matched_file)
+            email_body = None
+            if (
+                self.email_enabled and self.email_send_on_completion and not self._email_setup_problem
+                and len(optimized_jobs) >= self.email_min_matches
+            ):
+                email_body = self.email_service.build_report_body(optimized_jobs)
+            report_path = report_future.result()
 
         # Send email if enabled
-        self.send_email_report(optimized_jobs, report_path)
+        self.send_email_report(optimized_jobs, report_path, body_html=email_body)
 
         # Clear checkpoint after successful completion
         if self.checkpoint_manager:
@@ -992,12 +1682,14 @@ class JobMatcherPipeline:
         failure_stats = self.failure_tracker.get_failure_stats()
 
         # Final summary
-        print(f"\n{'=' * 80}")
-        print("PIPELINE COMPLETE")
-        print(f"{'=' * 80}")
-        print(f"Processed {len(jobs) if not resuming else len(optimized_jobs)} jobs")
-        print(f"Found {len(matched_jobs)} matches")
-        print(f"Report: {report_path}")
+        _print_block(
+            f"\n{'=' * 80}",
+            "PIPELINE COMPLETE",
+            f"{'=' * 80}",
+            f"Processed {len(jobs) if not resuming else len(optimized_jobs)} jobs",
+            f"Found {len(matched_jobs)} matches",
+            f"Report: {report_path}",
+        )
         if self.email_enabled and self.email_recipients:
             email_status = "sent" if len(optimized_jobs) >= self.email_min_matches else "skipped (too few matches)"
             print(f"Email: {email_status}")
@@ -1028,6 +1720,10 @@ class JobMatcherPipeline:
 
         print(f"{'=' * 80}\n")
 
+        # Make sure the matched jobs file is complete before handing back
+        self.wait_for_writes()
+        self._last_matched_file = matched_file
+
         return report_path
 
     def process_all_sources(
@@ -1047,87 +1743,133 @@ class JobMatcherPipeline:
         Returns:
             List of tuples: [(source, report_path, matched_jobs), ...]
         """
-        # First check DuckDB for available sources
-        source_files = []
-        for source in ["indeed", "glassdoor", "linkedin", "ziprecruiter"]:
-            job_count = self.storage.get_job_count(source)
-            if job_count > 0:
-                # Use source name as identifier (will be loaded from DB)
-                source_files.append((source, source))
-
-        # Also check for legacy JSON files if no DB sources found
+        sources = ("indeed", "glassdoor", "linkedin", "ziprecruiter")
+
+        # First check DuckDB for available sources (one grouped count for all of them)
+        job_counts = self.storage.get_job_counts_by_source()
+        # Use source name as identifier (will be loaded from DB)
+        source_files = [(source, source) for source in sources if job_counts.get(source, 0) > 0]
+
+        # Also check for legacy JSON files if no DB sources found (one directory listing)
         if not source_files:
             data_dir = Path("data")
-            for source in ["indeed", "glassdoor", "linkedin", "ziprecruiter"]:
-                source_file = data_dir / f"jobs_{source}_latest.json"
-                if source_file.exists():
-                    source_files.append((source, str(source_file)))
+            try:
+                with os.scandir(data_dir) as entries:
+                    file_names = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                file_names = set()
+            source_files = [
+                (source, str(data_dir / f"jobs_{source}_latest.json"))
+                for source in sources
+                if f"jobs_{source}_latest.json" in file_names
+            ]
 
         if not source_files:
             print("\n[WARNING] No source files found in data/ directory")
             print("   Expected: jobs_indeed_latest.json, jobs_glassdoor_latest.json, etc.")
             return []
 
-        print(f"\n{'=' * 80}")
-        print("MULTI-SOURCE PROCESSING")
-        print(f"{'=' * 80}")
-        print(f"Found {len(source_files)} source file(s):")
+        _print_block(
+            f"\n{'=' * 80}",
+            "MULTI-SOURCE PROCESSING",
+            f"{'=' * 80}",
+            f"Found {len(source_files)} source file(s):",
+        )
         for source, filepath in source_files:
             print(f"  - {source}: {filepath}")
         print(f"{'=' * 80}\n")
 
-        results = []
+        if self.parallel_sources and len(source_files) > 1:
+            print(f"Running {len(source_files)} sources concurrently "
+                  f"(at most {self.client.server_slots or 'unlimited'} LLM requests in flight)\n")
+
+            # Failures are logged per profile; clear once here instead of per source
+            if not resume_from_checkpoint:
+                self.failure_tracker.reset()
+
+            with ThreadPoolExecutor(max_workers=len(source_files), thread_name_prefix="source") as executor:
+                futures = [
+                    executor.submit(
+                        self._for_source()._process_source,
+                        source, filepath, min_score, skip_processed, resume_from_checkpoint,
+                    )
+                    for source, filepath in source_files
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [
+                self._process_source(source, filepath, min_score, skip_processed, resume_from_checkpoint)
+                for source, filepath in source_files
+            ]
 
-        for source, filepath in source_files:
-            print(f"\n{'#' * 80}")
-            print(f"# Processing {source.upper()}")
-            print(f"{'#' * 80}\n")
+        return [result for result in results if result is not None]
 
-            try:
-                # Run full pipeline for this source
-                report_path = self.run_full_pipeline(
-                    filepath,
-                    min_score=min_score,
-                    skip_processed=skip_processed,
-                    resume_from_checkpoint=resume_from_checkpoint,
-                )
-
-                if report_path:
-                    # Load matched jobs from DuckDB
-                    df = self.storage.load_matched_jobs(source, min_score or self.min_score)
-                    if df is not None and not df.empty:
-                        matched_jobs = df.to_dict("records")
-                        # Convert timestamp fields to ISO strings for JSON serialization
-                        for job in matched_jobs:
-                            for field in ['first_seen', 'last_seen']:
-                                if field in job and job[field] is not None:
-                                    if hasattr(job[field], 'isoformat'):
-                                        job[field] = job[field].isoformat()
-                    else:
-                        # Fallback to JSON file if DB is empty
-                        matched_file = f"data/jobs_{source}_matched_{datetime.now().strftime('%Y%m%d')}_*.json"
-                        import glob
-                        matched_files = glob.glob(matched_file)
-
-                        matched_jobs = []
-                        if matched_files:
-                            # Get most recent matched file
-                            latest_matched = max(matched_files, key=lambda f: Path(f).stat().st_mtime)
-                            with open(latest_matched, 'r', encoding='utf-8') as f:
-                                matched_jobs = json.load(f)
-
-                    results.append((source, report_path, matched_jobs))
-                    print(f"\n[SUCCESS] {source.upper()} processing complete")
-                else:
-                    print(f"\n[WARNING] {source.upper()} processing returned no results")
-
-            except Exception as e:
-                print(f"\n[ERROR] Error processing {source}: {e}")
-                import traceback
-                traceback.print_exc()
-                continue
-
-        return results
+    def _process_source(
+        self,
+        source: str,
+        filepath: str,
+        min_score: Optional[int],
+        skip_processed: bool,
+        resume_from_checkpoint: bool,
+    ) -> Optional[tuple]:
+        """
+        Run the full pipeline for one source and collect its matched jobs
+
+        Args:
+            source: Source identifier
+            filepath: Source identifier (DuckDB) or path to a legacy JSON file
+            min_score: Minimum match score threshold
+            skip_processed: Skip already-processed jobs
+            resume_from_checkpoint: Resume from checkpoint if available
+
+        Returns:
+            (source, report_path, matched_jobs) tuple, or None if the source produced no report
+        """
+        _print_block(
+            f"\n{'#' * 80}",
+            f"# Processing {source.upper()}",
+            f"{'#' * 80}\n",
+        )
+
+        try:
+            # Run full pipeline for this source
+            report_path = self.run_full_pipeline(
+                filepath,
+                min_score=min_score,
+                skip_processed=skip_processed,
+                resume_from_checkpoint=resume_from_checkpoint,
+            )
+
+            if report_path:
+                # Load matched jobs from DuckDB (already JSON-friendly records)
+                matched_jobs = self.storage.load_matched_job_records(source, min_score or self.min_score)
+                if not matched_jobs:
+                    # Fallback to the JSON file this run wrote (jobs not stored in DuckDB, e.g. legacy JSON input)
+                    matched_jobs = []
+                    if self._last_matched_file:
+                        try:
+                            matched_jobs = fast_json.load_json_file(self._last_matched_file)
+                        except (OSError, ValueError) as e:
+                            print(f"[WARNING] Could not read {self._last_matched_file}: {e}")
+
+                print(f"\n[SUCCESS] {source.upper()} processing complete")
+                return (source, report_path, matched_jobs)
+
+            print(f"\n[WARNING] {source.upper()} processing returned no results")
+
+        except Exception as e:
+            print(f"\n[ERROR] Error processing {source}: {e}")
+            trace = traceback.format_exc()
+            sys.stderr.write(trace)
+            # Keep the stack where --failure-stats can show it
+            self.failure_tracker.record_failure(
+                {"job_url": f"source:{source}", "title": f"{source} pipeline", "company": "-"},
+                "pipeline",
+                ErrorType.UNKNOWN_ERROR,
+                trace,
+            )
+
+        return None
 
     def send_multi_source_email_report(
         self,
@@ -1142,33 +1884,19 @@ class JobMatcherPipeline:
         Returns:
             True if email sent successfully to at least one recipient, False otherwise
         """
-        # Check if email is enabled
-        if not self.email_enabled or not self.email_send_on_completion:
-            return False
-
         # Calculate total matches across all sources
         total_matches = sum(len(jobs) for _, _, jobs in source_results)
 
-        # Check if we have enough matches
-        if total_matches < self.email_min_matches:
-            print(f"\n[INFO] Skipping email: Only {total_matches} total matches (minimum: {self.email_min_matches})")
-            return False
-
-        # Check if recipients are configured
-        if not self.email_recipients:
-            print("\n[WARNING] Email recipients not configured. Run 'python setup_email.py'")
+        if not self._should_send_email(total_matches, "total matches"):
             return False
 
-        # Check if email service is configured
-        if not self.email_service.is_configured():
-            print("\n[WARNING] Email service not configured. Run 'python setup_email.py'")
-            return False
-
-        print(f"\n{'=' * 80}")
-        print("SENDING MULTI-SOURCE EMAIL REPORT")
-        print(f"{'=' * 80}")
-        print(f"Recipients: {', '.join(self.email_recipients)}")
-        print(f"Total Matches: {total_matches}")
+        _print_block(
+            f"\n{'=' * 80}",
+            "SENDING MULTI-SOURCE EMAIL REPORT",
+            f"{'=' * 80}",
+            f"Recipients: {', '.join(self.email_recipients)}",
+            f"Total Matches: {total_matches}",
+        )
         for source, _, jobs in source_results:
             print(f"  - {source}: {len(jobs)} matches")
         print()
@@ -1184,19 +1912,17 @@ class JobMatcherPipeline:
                 job['_email_source'] = source
                 all_jobs.append(job)
 
-        # Send email to each recipient
-        all_success = True
-        for recipient in self.email_recipients:
-            print(f"Sending to {recipient}...")
-            success = self.email_service.send_multi_source_report(
-                recipient=recipient,
-                jobs_by_source=[(source, jobs) for source, _, jobs in source_results],
-                report_paths=report_paths,
-                subject_prefix=self.email_subject_prefix,
-            )
+        # Build the email once and send it to each recipient
+        results = self.email_service.send_multi_source_report_to_recipients(
+            recipients=self.email_recipients,
+            jobs_by_source=[(source, jobs) for source, _, jobs in source_results],
+            report_paths=report_paths,
+            subject_prefix=self.email_subject_prefix,
+        )
 
+        all_success = all(results.values())
+        for recipient, success in results.items():
             if not success:
-                all_success = False
                 print(f"  ✗ Failed to send to {recipient}")
 
         if all_success:
@@ -1207,8 +1933,8 @@ class JobMatcherPipeline:
         return all_success
 
 
-def main():
-    """Main entry point"""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser"""
     parser = argparse.ArgumentParser(
         description="AI-Powered Job Matching and Resume Optimization"
     )
@@ -1262,6 +1988,13 @@ def main():
         help="Resume from checkpoint if available",
     )
 
+    parser.add_argument(
+        "--resume-policy",
+        choices=RESUME_POLICIES,
+        default=None,
+        help="With --resume: resume automatically if the checkpoint is recent (auto), ask (prompt), or start fresh (never) (default: from .env)",
+    )
+
     parser.add_argument(
         "--email",
         action="store_true",
@@ -1311,7 +2044,72 @@ def main():
         help="Disable batch queue mode (use sequential processing)",
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--async-llm",
+        action="store_true",
+        help="Score with concurrent async requests (LLM_PARALLELISM or llama-server's slot count in flight, default: from .env)",
+    )
+    parser.add_argument(
+        "--fused",
+        action="store_true",
+        help="Score, analyze and optimize with one LLM request per job in full pipeline mode (default: from .env)",
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="Overlap scoring, gap analysis and optimization per job in full pipeline mode (default: from .env)",
+    )
+
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Disable reuse of cached LLM responses (default: from .env)",
+    )
+
+    return parser
+
+
+def _print_tracker_stats(tracker: JobTracker):
+    """Print job tracker statistics (--stats)"""
+    stats = tracker.get_stats()
+    print("\n[INFO] Job Tracker Statistics:")
+    print(f"   Total jobs tracked: {stats['total_jobs']}")
+    print(f"   Average score: {stats['avg_score']}")
+    print(f"   High matches (≥80): {stats['high_matches']}")
+    print(f"   Medium matches (70-79): {stats['medium_matches']}")
+    print(f"   Low matches (<70): {stats['low_matches']}")
+    print(f"   Reposted jobs: {stats['reposted_jobs']}")
+
+
+def _print_failure_stats(failure_tracker: FailureTracker):
+    """Print detailed failure statistics (--failure-stats)"""
+    failure_stats = failure_tracker.get_failure_stats()
+    print("\n[WARNING] Failure Statistics:")
+    print(f"   Total failures: {failure_stats['total_failures']}")
+
+    if failure_stats['total_failures'] > 0:
+        print(f"\n   By Stage:")
+        for stage, count in failure_stats['by_stage'].items():
+            print(f"     - {stage}: {count} failures")
+
+        print(f"\n   By Error Type:")
+        for error_type, count in failure_stats['by_error_type'].items():
+            print(f"     - {error_type}: {count} failures")
+
+        print(f"\n   Multiple Failures: {failure_stats['multiple_failures']} jobs")
+
+        if failure_stats['top_failures']:
+            print(f"\n   Most Problematic Jobs:")
+            for i, failure in enumerate(failure_stats['top_failures'], 1):
+                print(f"     {i}. {failure['job_title']} ({failure['stage']}): {failure['failure_count']} attempts")
+                print(f"        URL: {failure['job_url']}")
+    else:
+        print("   No failures recorded!")
+
+
+def main():
+    """Main entry point"""
+    args = _build_parser().parse_args()
 
     # Determine email setting
     email_override = None
@@ -1327,53 +2125,35 @@ def main():
     elif args.no_batch_queue:
         batch_queue_override = False
 
+    pipeline = None
     try:
-        pipeline = JobMatcherPipeline(enable_email=email_override, use_batch_queue=batch_queue_override)
-
-        # Show stats if requested
+        # Read-only stats commands only need their tracker, not the full pipeline
+        # (LLM client, resume loading, pending-write replay, email service)
         if args.stats:
-            stats = pipeline.tracker.get_stats()
-            print("\n[INFO] Job Tracker Statistics:")
-            print(f"   Total jobs tracked: {stats['total_jobs']}")
-            print(f"   Average score: {stats['avg_score']}")
-            print(f"   High matches (≥80): {stats['high_matches']}")
-            print(f"   Medium matches (70-79): {stats['medium_matches']}")
-            print(f"   Low matches (<70): {stats['low_matches']}")
-            print(f"   Reposted jobs: {stats['reposted_jobs']}")
+            _print_tracker_stats(JobTracker())
             return
-
-        # Show failure stats if requested
         if args.failure_stats:
-            failure_stats = pipeline.failure_tracker.get_failure_stats()
-            print("\n[WARNING] Failure Statistics:")
-            print(f"   Total failures: {failure_stats['total_failures']}")
-
-            if failure_stats['total_failures'] > 0:
-                print(f"\n   By Stage:")
-                for stage, count in failure_stats['by_stage'].items():
-                    print(f"     - {stage}: {count} failures")
-
-                print(f"\n   By Error Type:")
-                for error_type, count in failure_stats['by_error_type'].items():
-                    print(f"     - {error_type}: {count} failures")
-
-                print(f"\n   Multiple Failures: {failure_stats['multiple_failures']} jobs")
-
-                if failure_stats['top_failures']:
-                    print(f"\n   Most Problematic Jobs:")
-                    for i, failure in enumerate(failure_stats['top_failures'], 1):
-                        print(f"     {i}. {failure['job_title']} ({failure['stage']}): {failure['failure_count']} attempts")
-                        print(f"        URL: {failure['job_url']}")
-            else:
-                print("   No failures recorded!")
+            _print_failure_stats(FailureTracker())
             return
 
+        pipeline = JobMatcherPipeline(
+            enable_email=email_override,
+            use_batch_queue=batch_queue_override,
+            use_llm_cache=False if args.no_llm_cache else None,
+            use_async=True if args.async_llm else None,
+            use_pipelined=True if args.pipelined else None,
+            use_fused=True if args.fused else None,
+            resume_policy=args.resume_policy,
+        )
+
         # Retry failed jobs if requested
         if args.retry_failed:
             stage = args.retry_failed
-            print(f"\n{'=' * 80}")
-            print(f"RETRYING FAILED JOBS - {stage.upper()} STAGE")
-            print(f"{'=' * 80}")
+            _print_block(
+                f"\n{'=' * 80}",
+                f"RETRYING FAILED JOBS - {stage.upper()} STAGE",
+                f"{'=' * 80}",
+            )
 
             # Get failed jobs from tracker
             failed_records = pipeline.failure_tracker.get_failed_jobs(stage=stage)
@@ -1414,8 +2194,9 @@ def main():
             print(f"\nRetrying {len(jobs_to_retry)} jobs...")
 
             # Retry based on stage
+            result_jobs = []
             if stage == "scoring":
-                matched_jobs = pipeline.run_scoring_pass(jobs_to_retry, args.min_score)
+                matched_jobs = result_jobs = pipeline.run_scoring_pass(jobs_to_retry, args.min_score)
                 if matched_jobs:
                     output_file = pipeline.save_matched_jobs(matched_jobs)
                     pipeline.update_tracker(matched_jobs)
@@ -1423,14 +2204,14 @@ def main():
                     print(f"   Saved to: {output_file}")
 
             elif stage == "analysis":
-                analyzed_jobs = pipeline.run_analysis_pass(jobs_to_retry)
+                analyzed_jobs = result_jobs = pipeline.run_analysis_pass(jobs_to_retry)
                 if analyzed_jobs:
                     output_file = pipeline.save_matched_jobs(analyzed_jobs)
                     print(f"\n[SUCCESS] Successfully retried! {len(analyzed_jobs)} jobs analyzed")
                     print(f"   Saved to: {output_file}")
 
             elif stage == "optimization":
-                optimized_jobs = pipeline.run_optimization_pass(jobs_to_retry)
+                optimized_jobs = result_jobs = pipeline.run_optimization_pass(jobs_to_retry)
                 if optimized_jobs:
                     output_file = pipeline.save_matched_jobs(optimized_jobs)
                     print(f"\n[SUCCESS] Successfully retried! {len(optimized_jobs)} jobs optimized")
@@ -1443,9 +2224,11 @@ def main():
                 os.environ["LLAMA_MAX_TOKENS"] = original_tokens
 
             # Mark successful retries as resolved
-            successful_urls = {job.get("job_url") for job in (matched_jobs if stage == "scoring" else analyzed_jobs if stage == "analysis" else optimized_jobs) if job.get("match_score", 0) > 0 or stage != "scoring"}
-            for job_url in successful_urls:
-                pipeline.failure_tracker.mark_resolved(job_url, stage)
+            successful_urls = [
+                job.get("job_url") for job in result_jobs
+                if stage != "scoring" or job.get("match_score", 0) > 0
+            ]
+            pipeline.failure_tracker.mark_resolved_bulk(successful_urls, stage)
 
             print(f"\n[SUCCESS] Retry complete! Check failure stats to see remaining failures.")
             return
@@ -1499,7 +2282,7 @@ def main():
 
         # Default: just run scoring pass
         pipeline.analyzer.load_all()
-        jobs = pipeline.load_jobs(args.input)
+        jobs = pipeline.load_jobs(args.input, skip_processed=not args.no_skip_processed)
 
         if not args.no_skip_processed:
             jobs = pipeline.filter_unprocessed_jobs(jobs)
@@ -1515,10 +2298,12 @@ def main():
         sys.exit(1)
     except Exception as e:
         print(f"\n[ERROR] Error: {e}")
-        import traceback
-
-        traceback.print_exc()
+        sys.stderr.write(traceback.format_exc())
         sys.exit(1)
+    finally:
+        # Flush background JSON writes before exiting
+        if pipeline is not None:
+            pipeline.wait_for_writes()
 
 
 if __name__ == "__main__":
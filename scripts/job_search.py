@@ -5,7 +5,10 @@ Reads job titles and locations from .env file and scrapes Indeed for all combina
 Saves results to CSV/JSON with deduplication.
 
 Usage:
-    python run_job_search.py
+    python run_job_search.py [--yes]
+
+    --yes/-y skips the confirmation prompt (also skipped when CI is set or
+    stdin is not a terminal, e.g. cron)
 
 Configuration:
     Edit .env file to set:
@@ -14,18 +17,23 @@ Configuration:
     - RESULTS_PER_SEARCH: Number of results per search (default: 50)
     - OUTPUT_FORMAT: csv, json, or both (default: both)
     - DEDUPLICATE: Remove duplicate jobs (default: true)
+    - SEARCH_CONCURRENCY: Searches to run at once (default: 4)
+    - SEARCH_INTERVAL: Minimum seconds between search starts (default: 3)
 """
 
 import os
+import sys
 import ast
+import argparse
 import time
-import yaml
+import random
+import asyncio
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
 from dotenv import load_dotenv
-from src.core import scrape_jobs
-from src.core.storage import JobStorage
 from src.utils.profile_manager import ProfilePaths
+from src.utils.fast_yaml import load_yaml_file
 
 # Load environment variables
 load_dotenv()
@@ -54,26 +62,53 @@ def parse_env_list(env_var: str, default: list = None) -> list:
         return [item.strip() for item in value.split(",")]
 
 
-def load_jobs_from_requirements(profile_name: str = None) -> list:
+# Separator line around each search's progress header
+_RULE = "─" * 80
+
+# Jobs buffered before each save_jobs_batch call
+SAVE_BATCH_SIZE = 500
+
+# Default minimum seconds between search starts
+SEARCH_INTERVAL = 3.0
+
+
+def _load_requirements(profile_name: str = None) -> dict:
     """
-    Load job search terms from requirements.yaml
+    Load and parse requirements.yaml (cached while the file is unchanged)
 
     Args:
         profile_name: Profile name (default: from .env ACTIVE_PROFILE)
 
     Returns:
-        List of job titles to search, or None if not found
+        Parsed requirements, or None if the file doesn't exist
+
+    Raises:
+        Exception: If the file can't be read or parsed
     """
     # Get profile paths
     paths = ProfilePaths(profile_name)
     requirements_path = Path(os.getenv("REQUIREMENTS_PATH", str(paths.requirements_path)))
 
-    if not requirements_path.exists():
+    try:
+        return load_yaml_file(requirements_path) or {}
+    except FileNotFoundError:
         return None
 
+
+def load_jobs_from_requirements(profile_name: str = None) -> list:
+    """
+    Load job search terms from requirements.yaml
+
+    Args:
+        profile_name: Profile name (default: from .env ACTIVE_PROFILE)
+
+    Returns:
+        List of job titles to search, or None if not found
+    """
     try:
-        with open(requirements_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data = _load_requirements(profile_name)
+        if data is None:
+            return None
 
         job_requirements = data.get('job_requirements', {})
         search_jobs = job_requirements.get('search_jobs', [])
@@ -94,16 +129,10 @@ def load_locations_from_requirements(profile_name: str = None) -> list:
     Returns:
         List of locations to search, or None if not found
     """
-    # Get profile paths
-    paths = ProfilePaths(profile_name)
-    requirements_path = Path(os.getenv("REQUIREMENTS_PATH", str(paths.requirements_path)))
-
-    if not requirements_path.exists():
-        return None
-
     try:
-        with open(requirements_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data = _load_requirements(profile_name)
+        if data is None:
+            return None
 
         # Read from preferences.locations (single source of truth)
         preferences = data.get('preferences', {})
@@ -115,8 +144,246 @@ def load_locations_from_requirements(profile_name: str = None) -> list:
         return None
 
 
-def main():
-    """Main job search execution"""
+def _clean_search_terms(values) -> list:
+    """
+    Strip search terms and drop blanks, non-strings and repeats
+
+    Repeats are matched case-insensitively (the search is); the first spelling is kept.
+
+    Args:
+        values: Job titles or locations from requirements.yaml or .env
+
+    Returns:
+        Unique, non-empty terms in their original order
+    """
+    if isinstance(values, str):
+        values = [values]
+
+    terms = {}
+    for value in values or []:
+        if isinstance(value, str) and value.strip():
+            terms.setdefault(value.strip().casefold(), value.strip())
+    return list(terms.values())
+
+
+def _run_search(
+    job_title: str,
+    location: str,
+    rotation_label: str,
+    search_number: int,
+    total_searches: int,
+    scraper,
+    results_per_search: int,
+    use_proxy: bool,
+    rotate_ips: bool,
+) -> list:
+    """
+    Run one job/location search
+
+    Args:
+        job_title: Search term
+        location: Search location
+        rotation_label: IP rotation suffix for the progress header ("" without rotation)
+        search_number: 1-based position of this search (for progress output)
+        total_searches: Total number of searches in the run
+        scraper: IndeedScraper to reuse (its TLS session stays open between searches)
+        results_per_search: Number of results to request
+        use_proxy: Whether to route through the proxy
+        rotate_ips: Use a fresh proxy session (exit IP) for this search
+
+    Returns:
+        List of JobPost objects (empty if nothing was found)
+    """
+    print(
+        f"\n{_RULE}\nSearch {search_number}/{total_searches}\n"
+        f"Job: '{job_title}' | Location: '{location}'{rotation_label}\n{_RULE}\n"
+    )
+
+    # Deferred like the other core imports (see main); cached after the first search
+    from src.core.scraper import scrape_jobs
+
+    # Generate unique session ID for IP rotation (only if using proxy)
+    proxy_session = scraper._generate_session_id() if rotate_ips else None
+
+    if proxy_session:
+        print(f"[INFO] Using proxy session: {proxy_session}")
+
+    # Scrape jobs
+    start_time = time.time()
+
+    found = scrape_jobs(
+        site_name="indeed",
+        search_term=job_title,
+        location=location,
+        results_wanted=results_per_search,
+        use_proxies=use_proxy,
+        proxy_session=proxy_session,
+        indeed_scraper=scraper,
+        as_objects=True,
+    )
+
+    elapsed = time.time() - start_time
+
+    if not found:
+        print(f"[WARNING] No jobs found for '{job_title}' in '{location}' ({elapsed:.1f}s)")
+    else:
+        print(f"Found {len(found)} jobs for '{job_title}' in '{location}' ({elapsed:.1f}s)")
+    return found
+
+
+class _SearchPacer:
+    """Spaces out search starts without sleeping when enough time has already passed"""
+
+    def __init__(self, min_interval: float):
+        """
+        Initialize _SearchPacer
+
+        Args:
+            min_interval: Minimum seconds between search starts (plus up to 50% jitter)
+        """
+        self.min_interval = min_interval
+        self._next_start = 0.0
+
+    async def wait(self):
+        """Wait until this caller's start slot; only the residual time is slept"""
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        # Reserve the slot before sleeping so concurrent callers queue up behind it
+        self._next_start = start + self.min_interval + random.uniform(0, self.min_interval / 2)
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+async def _run_searches(
+    searches: list,
+    max_concurrency: int,
+    on_result: Callable[[list], None],
+    use_proxy: bool,
+    min_interval: float = SEARCH_INTERVAL,
+    **search_kwargs,
+) -> int:
+    """
+    Run searches on worker threads, at most max_concurrency at a time
+
+    Search starts are spaced at least min_interval apart across all workers
+    (be nice to Indeed API); a search that starts after a slow one doesn't wait.
+
+    Args:
+        searches: (job_title, location, rotation_label) tuples
+        max_concurrency: Maximum searches in flight
+        on_result: Called on the event loop with each search's JobPost list as it completes
+        use_proxy: Whether to route through the proxy
+        min_interval: Minimum seconds between search starts
+        **search_kwargs: Passed through to _run_search
+
+    Returns:
+        Number of searches that completed without an error
+    """
+    from src.core.scrapers.indeed import IndeedScraper
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    pacer = _SearchPacer(min_interval)
+    total_searches = len(searches)
+
+    # One scraper per worker, reused across searches so connections stay warm;
+    # only the proxy session ID changes between IP rotations
+    idle_scrapers = [IndeedScraper(use_proxies=use_proxy) for _ in range(min(max_concurrency, total_searches))]
+
+    async def run_one(search_number: int, job_title: str, location: str, rotation_label: str) -> bool:
+        async with semaphore:
+            await pacer.wait()
+            scraper = idle_scrapers.pop()
+            try:
+                found = await asyncio.to_thread(
+                    _run_search,
+                    job_title,
+                    location,
+                    rotation_label,
+                    search_number,
+                    total_searches,
+                    scraper,
+                    use_proxy=use_proxy,
+                    **search_kwargs,
+                )
+            except Exception as e:
+                print(f"[ERROR] Error during search '{job_title}' in '{location}': {e}")
+                return False
+            finally:
+                idle_scrapers.append(scraper)
+
+            on_result(found)
+            return True
+
+    try:
+        completed = await asyncio.gather(
+            *(run_one(number, *search) for number, search in enumerate(searches, 1))
+        )
+    finally:
+        for scraper in idle_scrapers:
+            scraper.close()
+    return sum(completed)
+
+
+class _BatchedJobWriter:
+    """Collects search results and saves them to storage every flush_every jobs"""
+
+    def __init__(self, storage, deduplicate: bool, flush_every: int = SAVE_BATCH_SIZE):
+        """
+        Initialize _BatchedJobWriter
+
+        Args:
+            storage: JobStorage to save jobs to
+            deduplicate: Keep only the first job seen for each job_url
+            flush_every: Number of buffered jobs that triggers a save
+        """
+        self.storage = storage
+        self.deduplicate = deduplicate
+        self.flush_every = flush_every
+        self.buffer = []
+        self.seen_urls = set()
+        self.collected = 0
+        self.duplicates = 0
+        self.saved = 0
+        self.updated = 0
+
+    def add(self, jobs: list):
+        """Buffer one search's jobs, saving once the buffer is full"""
+        for job in jobs:
+            # IP rotations and overlapping locations return many of the same postings
+            if self.deduplicate and job.job_url:
+                if job.job_url in self.seen_urls:
+                    self.duplicates += 1
+                    continue
+                self.seen_urls.add(job.job_url)
+            self.buffer.append(job)
+            self.collected += 1
+
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Save any buffered jobs in one batch"""
+        if not self.buffer:
+            return
+
+        # Use batch save for much better performance (single DB connection)
+        result = self.storage.save_jobs_batch(
+            jobs=self.buffer,
+            source="indeed",  # Indeed is the only active scraper
+        )
+        self.saved += result.get("saved", 0)
+        self.updated += result.get("updated", 0)
+        print(f"[INFO] Saved {len(self.buffer)} jobs ({self.collected} collected so far)")
+        self.buffer = []
+
+
+def main(assume_yes: bool = False):
+    """
+    Main job search execution
+
+    Args:
+        assume_yes: Start searching without asking for confirmation
+    """
 
     # Get active profile
     profile_name = os.getenv("ACTIVE_PROFILE", "default")
@@ -148,14 +415,20 @@ def main():
     deduplicate = os.getenv("DEDUPLICATE", "true").lower() == "true"
     use_proxy = os.getenv("USE_PROXY", "true").lower() == "true"
     proxy_rotation_count = max(1, int(os.getenv("PROXY_ROTATION_COUNT", "1")))
+    search_concurrency = max(1, int(os.getenv("SEARCH_CONCURRENCY", "4")))
+    search_interval = max(0.0, float(os.getenv("SEARCH_INTERVAL", str(SEARCH_INTERVAL))))
+
+    # Drop blank and repeated entries up front so they don't cost a search each
+    jobs = _clean_search_terms(jobs)
+    locations = _clean_search_terms(locations)
 
     # Validate configuration
-    if not jobs or all(not j.strip() for j in jobs if isinstance(j, str)):
+    if not jobs:
         print("[ERROR] No valid jobs defined!")
         print("   Please add search_jobs to templates/requirements.yaml or JOBS to .env")
         return
 
-    if not locations or all(not loc.strip() for loc in locations if isinstance(loc, str)):
+    if not locations:
         print("[ERROR] No valid locations defined!")
         print("   Please add locations to preferences section in templates/requirements.yaml or LOCATIONS to .env")
         return
@@ -170,6 +443,7 @@ def main():
         print(f"   IP rotation: {proxy_rotation_count} different IPs per search")
     print(f"   Output format: {output_format}")
     print(f"   Deduplication: {'enabled' if deduplicate else 'disabled'}")
+    print(f"   Concurrent searches: {search_concurrency}")
     print(f"   Total searches: {len(jobs) * len(locations) * proxy_rotation_count}")
     print()
 
@@ -190,120 +464,71 @@ def main():
         print(f"   Results will be merged and deduplicated")
         print()
 
-    # Confirm before proceeding
-    try:
-        response = input("Continue with job search? (y/n): ").lower().strip()
-        if response != "y":
-            print("[INFO] Search cancelled by user")
+    # Confirm before proceeding; unattended runs (cron, CI) can't answer a prompt
+    if assume_yes or os.getenv("CI") or not sys.stdin.isatty():
+        print("[INFO] Skipping confirmation prompt")
+    else:
+        try:
+            response = input("Continue with job search? (y/n): ").lower().strip()
+            if response != "y":
+                print("[INFO] Search cancelled by user")
+                return
+        except KeyboardInterrupt:
+            print("\n[INFO] Search cancelled by user")
             return
-    except KeyboardInterrupt:
-        print("\n[INFO] Search cancelled by user")
-        return
 
     print("\n" + "=" * 80)
     print("STARTING JOB SEARCH")
     print("=" * 80 + "\n")
 
+    # Heavy imports (pandas, duckdb, scrapers) wait until the search is confirmed
+    from src.core.storage import JobStorage
+
     # Initialize storage with profile-specific data directory
     storage = JobStorage(output_dir=str(paths.data_dir))
 
-    # Track all jobs
-    all_jobs = []
-    search_count = 0
-    total_searches = len(jobs) * len(locations) * proxy_rotation_count
-
-    # Search for each job/location combination with IP rotation
-    for job_title in jobs:
-        for location in locations:
-
-            # Run the same search with multiple IPs
-            for ip_iteration in range(proxy_rotation_count):
-                search_count += 1
-
-                print(f"\n{'─' * 80}")
-                print(f"Search {search_count}/{total_searches}")
-                print(f"Job: '{job_title}' | Location: '{location}'", end="")
-                if proxy_rotation_count > 1:
-                    print(f" | IP Rotation: {ip_iteration + 1}/{proxy_rotation_count}")
-                else:
-                    print()
-                print(f"{'─' * 80}\n")
-
-                try:
-                    # Generate unique session ID for IP rotation (only if using proxy)
-                    from core.scrapers.indeed import IndeedScraper
-                    proxy_session = IndeedScraper._generate_session_id() if (use_proxy and proxy_rotation_count > 1) else None
-
-                    if proxy_session:
-                        print(f"[INFO] Using proxy session: {proxy_session}")
-
-                    # Scrape jobs
-                    start_time = time.time()
-
-                    jobs_df = scrape_jobs(
-                        site_name="indeed",
-                        search_term=job_title,
-                        location=location,
-                        results_wanted=results_per_search,
-                        use_proxies=use_proxy,
-                        proxy_session=proxy_session,
-                    )
-
-                    elapsed = time.time() - start_time
-
-                    if not jobs_df.empty:
-                        print(f"Found {len(jobs_df)} jobs in {elapsed:.1f}s")
-                        # Convert DataFrame rows back to JobPost objects for storage
-                        from core.models import JobPost
-
-                        for _, row in jobs_df.iterrows():
-                            all_jobs.append(
-                                JobPost(
-                                    title=row["title"],
-                                    company=row["company"],
-                                    location=row["location"],
-                                    job_url=row["job_url"],
-                                    site=row["site"],
-                                    description=row.get("description"),
-                                    job_type=row.get("job_type"),
-                                    date_posted=row.get("date_posted"),
-                                    salary_min=row.get("salary_min"),
-                                    salary_max=row.get("salary_max"),
-                                    salary_currency=row.get("salary_currency"),
-                                    salary_period=row.get("salary_period"),
-                                    company_url=row.get("company_url"),
-                                    company_industry=row.get("company_industry"),
-                                    remote=row.get("remote", False),
-                                )
-                            )
-                    else:
-                        print(f"[WARNING] No jobs found in {elapsed:.1f}s")
-
-                except Exception as e:
-                    print(f"[ERROR] Error during search: {e}")
-                    continue
-
-                # Rate limiting between searches (be nice to Indeed API)
-                if search_count < total_searches:
-                    wait_time = 3  # 3 seconds between searches
-                    print(f"[INFO] Waiting {wait_time}s before next search...")
-                    time.sleep(wait_time)
+    # Build the work list once; per-search labels and flags don't change during the run
+    rotation_labels = (
+        [f" | IP Rotation: {ip_iteration + 1}/{proxy_rotation_count}" for ip_iteration in range(proxy_rotation_count)]
+        if proxy_rotation_count > 1 else [""]
+    )
+    searches = [
+        (job_title, location, rotation_label)
+        for job_title in jobs
+        for location in locations
+        for rotation_label in rotation_labels
+    ]
+    total_searches = len(searches)
+    print(f"[INFO] Running up to {search_concurrency} searches at a time, starting one every {search_interval:g}s at most\n")
+
+    # Save results in batches as searches finish instead of holding the whole run in memory
+    writer = _BatchedJobWriter(storage, deduplicate)
+    search_count = asyncio.run(
+        _run_searches(
+            searches,
+            search_concurrency,
+            writer.add,
+            min_interval=search_interval,
+            results_per_search=results_per_search,
+            use_proxy=use_proxy,
+            rotate_ips=use_proxy and proxy_rotation_count > 1,
+        )
+    )
 
-    # Save all collected jobs
+    # Save remaining collected jobs
     print("\n" + "=" * 80)
     print("SAVING RESULTS")
     print("=" * 80 + "\n")
 
-    if all_jobs:
-        # Use batch save for much better performance (single DB connection)
-        result = storage.save_jobs_batch(
-            jobs=all_jobs,
-            source="indeed",  # Indeed is the only active scraper
-        )
+    writer.flush()
 
-        print(f"\nTotal jobs processed: {len(all_jobs)}")
-        print(f"New jobs saved: {result.get('saved', 0)}")
-        print(f"Existing jobs updated: {result.get('updated', 0)}")
+    if writer.duplicates:
+        print(f"[INFO] Skipped {writer.duplicates} duplicate jobs found by more than one search")
+
+    if writer.collected:
+        print(f"\nTotal jobs processed: {writer.collected}")
+        print(f"New jobs saved: {writer.saved}")
+        print(f"Existing jobs updated: {writer.updated}")
     else:
         print("[WARNING] No jobs collected")
 
@@ -313,13 +538,17 @@ def main():
     print("=" * 80)
     print(f"Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Searches completed: {search_count}/{total_searches}")
-    print(f"Jobs collected: {len(all_jobs)}")
+    print(f"Jobs collected: {writer.collected}")
     print("=" * 80 + "\n")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape Indeed for every job/location in the active profile")
+    parser.add_argument("--yes", "-y", action="store_true", help="Skip the confirmation prompt")
+    args = parser.parse_args()
+
     try:
-        main()
+        main(assume_yes=args.yes)
     except KeyboardInterrupt:
         print("\n\n[INFO] Search interrupted by user")
     except Exception as e:
@@ -7,9 +7,14 @@ Launches both the backend API server and frontend dev server.
 
 import os
 import sys
+import queue
 import subprocess
+import shutil
 import signal
+import socket
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Project paths
@@ -18,18 +23,33 @@ WEB_DIR = PROJECT_ROOT / "web"
 BACKEND_PORT = 3000
 FRONTEND_PORT = 5173
 
+# Executables resolved once, so commands run directly instead of through a shell
+# (npm is a .cmd script on Windows, which subprocess can run without shell=True)
+NODE_EXE = shutil.which("node")
+NPM_EXE = shutil.which("npm.cmd" if os.name == "nt" else "npm")
+
+# Seconds to wait for each server to accept connections before reporting it as slow
+STARTUP_TIMEOUT = 30
+
 # Track child processes for cleanup
 processes = []
 
+# Child processes put themselves here when they exit
+exited = queue.Queue()
+
+# Blocking waits can't be interrupted by Ctrl+C on Windows, so wake up periodically there
+EXIT_WAIT_TIMEOUT = 1 if sys.platform == "win32" else None
+
 
 def check_node_installed():
     """Check if Node.js is installed."""
+    if not NODE_EXE:
+        return False
     try:
         result = subprocess.run(
-            ["node", "--version"],
+            [NODE_EXE, "--version"],
             capture_output=True,
             text=True,
-            shell=True
         )
         return result.returncode == 0
     except Exception:
@@ -38,12 +58,13 @@ def check_node_installed():
 
 def check_npm_installed():
     """Check if npm is installed."""
+    if not NPM_EXE:
+        return False
     try:
         result = subprocess.run(
-            ["npm", "--version"],
+            [NPM_EXE, "--version"],
             capture_output=True,
             text=True,
-            shell=True
         )
         return result.returncode == 0
     except Exception:
@@ -57,9 +78,8 @@ def install_frontend_deps():
     if not node_modules.exists():
         print("\n[Frontend] Installing dependencies...")
         result = subprocess.run(
-            ["npm", "install"],
+            [NPM_EXE, "install"],
             cwd=str(WEB_DIR),
-            shell=True
         )
         if result.returncode != 0:
             print("[Frontend] Failed to install dependencies")
@@ -90,14 +110,41 @@ def start_frontend():
     print(f"\n[Frontend] Starting on http://localhost:{FRONTEND_PORT}")
 
     process = subprocess.Popen(
-        ["npm", "run", "dev"],
+        [NPM_EXE, "run", "dev"],
         cwd=str(WEB_DIR),
-        shell=True,
     )
     processes.append(("Frontend", process))
     return process
 
 
+def watch_process(name, process):
+    """Report the process on the exited queue once it terminates."""
+    def wait():
+        process.wait()
+        exited.put((name, process))
+
+    threading.Thread(target=wait, name=f"{name}-watcher", daemon=True).start()
+
+
+def wait_for_port(port, process, timeout=STARTUP_TIMEOUT):
+    """
+    Wait until something accepts connections on localhost:port.
+
+    Returns:
+        True once the port is open; False if the process exited or the timeout passed
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            with socket.create_connection(("localhost", port), timeout=0.5):
+                return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
 def cleanup(signum=None, frame=None):
     """Clean up child processes."""
     print("\n\nShutting down...")
@@ -121,13 +168,18 @@ def main():
     print("  AI Job Finder - Web Application")
     print("=" * 50)
 
-    # Check prerequisites
-    if not check_node_installed():
+    # Check prerequisites (both probes run at once)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        node_check = executor.submit(check_node_installed)
+        npm_check = executor.submit(check_npm_installed)
+        node_installed, npm_installed = node_check.result(), npm_check.result()
+
+    if not node_installed:
         print("\n[Error] Node.js is not installed.")
         print("Please install Node.js from https://nodejs.org/")
         sys.exit(1)
 
-    if not check_npm_installed():
+    if not npm_installed:
         print("\n[Error] npm is not installed.")
         print("Please install Node.js from https://nodejs.org/")
         sys.exit(1)
@@ -145,30 +197,43 @@ def main():
     signal.signal(signal.SIGINT, cleanup)
     signal.signal(signal.SIGTERM, cleanup)
 
-    # Start services
+    # Start services together (the frontend doesn't need the backend up to start),
+    # then wait until each one is actually listening
     backend = start_backend()
-    time.sleep(2)  # Give backend time to start
-
     frontend = start_frontend()
-    time.sleep(2)  # Give frontend time to start
+
+    all_ready = True
+    for name, process, port in (("Backend", backend, BACKEND_PORT), ("Frontend", frontend, FRONTEND_PORT)):
+        if not wait_for_port(port, process):
+            if process.poll() is not None:
+                print(f"\n[{name}] Process exited with code {process.returncode}")
+                cleanup()
+            print(f"\n[{name}] Not accepting connections on port {port} after {STARTUP_TIMEOUT}s, still waiting...")
+            all_ready = False
 
     print("\n" + "=" * 50)
-    print("  Services started successfully!")
+    if all_ready:
+        print("  Services started successfully!")
+    else:
+        print("  Services started, but not yet reachable")
     print("=" * 50)
     print(f"\n  Backend API:  http://localhost:{BACKEND_PORT}")
     print(f"  Frontend UI:  http://localhost:{FRONTEND_PORT}")
     print("\n  Press Ctrl+C to stop all services")
     print("=" * 50 + "\n")
 
-    # Wait for processes
+    # Wait for processes: block until either one exits (no polling)
+    for name, process in processes:
+        watch_process(name, process)
+
     try:
         while True:
-            # Check if any process has died
-            for name, process in processes:
-                if process.poll() is not None:
-                    print(f"\n[{name}] Process exited with code {process.returncode}")
-                    cleanup()
-            time.sleep(1)
+            try:
+                name, process = exited.get(timeout=EXIT_WAIT_TIMEOUT)
+            except queue.Empty:
+                continue
+            print(f"\n[{name}] Process exited with code {process.returncode}")
+            cleanup()
     except KeyboardInterrupt:
         cleanup()
 
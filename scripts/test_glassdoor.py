@@ -7,6 +7,8 @@ Run with: python scripts/test_glassdoor.py
 Options:
   --vlm       Force VLM scraper (default)
   --graphql   Force GraphQL scraper
+  --factory   Test the scraper factory (auto-selects)
+  --all       Run the VLM, GraphQL and factory tests together
   --jobs N    Number of jobs to scrape (default: 5)
   --query Q   Search query (default: "software engineer")
   --location L Location (default: "Remote")
@@ -14,7 +16,7 @@ Options:
 
 import sys
 # Fix Windows console encoding
-if sys.platform == 'win32':
+if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 import argparse
@@ -39,7 +41,7 @@ def test_vlm_scraper(search_term: str, location: str, results_wanted: int):
 
     scraper = None
     try:
-        from src.core.scrapers.glassdoor_vlm import GlassdoorVLMScraper, close_singleton_browser
+        from src.core.scrapers.glassdoor_vlm import GlassdoorVLMScraper
 
         print("\n[1/4] Initializing VLM scraper...")
         scraper = GlassdoorVLMScraper()
@@ -113,8 +115,6 @@ def test_vlm_scraper(search_term: str, location: str, results_wanted: int):
         try:
             if scraper:
                 scraper.close()
-            # Close the singleton browser completely
-            close_singleton_browser()
         except:
             pass
 
@@ -202,7 +202,7 @@ def test_factory(search_term: str, location: str, results_wanted: int):
 
     scraper = None
     try:
-        from src.core.scraper import get_glassdoor_scraper, cleanup_glassdoor_browser
+        from src.core.scraper import get_glassdoor_scraper
 
         print("\n[1/4] Getting scraper from factory...")
         scraper = get_glassdoor_scraper()
@@ -248,8 +248,6 @@ def test_factory(search_term: str, location: str, results_wanted: int):
         try:
             if scraper:
                 scraper.close()
-            # Cleanup Glassdoor browser
-            cleanup_glassdoor_browser()
         except:
             pass
 
@@ -264,6 +262,7 @@ Examples:
   python scripts/test_glassdoor.py --graphql --jobs 10
   python scripts/test_glassdoor.py --query "data scientist" --location "New York"
   python scripts/test_glassdoor.py --factory
+  python scripts/test_glassdoor.py --all
         """
     )
 
@@ -282,6 +281,11 @@ Examples:
         action="store_true",
         help="Test scraper factory (auto-selects)"
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Run the VLM, GraphQL and factory tests in one run"
+    )
     parser.add_argument(
         "--jobs", "-n",
         type=int,
@@ -303,20 +307,42 @@ Examples:
 
     args = parser.parse_args()
 
+    if args.all:
+        args.vlm = args.graphql = args.factory = True
+
     # Default to VLM if no scraper specified
     if not args.vlm and not args.graphql and not args.factory:
         args.vlm = True
 
-    success = True
-
+    # Run every selected test in this process. Glassdoor scrapes are serialized
+    # (Playwright and the VLM's screen capture can't be shared across threads),
+    # so the tests run one after another and the browser is cleaned up once.
+    tests = []
     if args.factory:
-        success = test_factory(args.query, args.location, args.jobs)
-    elif args.graphql:
-        success = test_graphql_scraper(args.query, args.location, args.jobs)
-    elif args.vlm:
-        success = test_vlm_scraper(args.query, args.location, args.jobs)
+        tests.append(("factory", test_factory))
+    if args.graphql:
+        tests.append(("graphql", test_graphql_scraper))
+    if args.vlm:
+        tests.append(("vlm", test_vlm_scraper))
+
+    results = {}
+    try:
+        for name, test in tests:
+            results[name] = test(args.query, args.location, args.jobs)
+    finally:
+        try:
+            from src.core.scraper import cleanup_glassdoor_browser
+            cleanup_glassdoor_browser()
+        except Exception:
+            pass
+
+    if len(results) > 1:
+        print("\n" + "=" * 60)
+        for name, passed in results.items():
+            print(f"  {name:<8} {'PASS' if passed else 'FAIL'}")
+        print("=" * 60)
 
-    sys.exit(0 if success else 1)
+    sys.exit(0 if all(results.values()) else 1)
 
 
 if __name__ == "__main__":
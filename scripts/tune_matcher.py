@@ -7,27 +7,46 @@ Usage:
     python scripts/tune_matcher.py --search "netflix"  # Search jobs by keyword
     python scripts/tune_matcher.py --url <job_url>     # Fetch job from database by URL
     python scripts/tune_matcher.py --latest            # Use the most recent job from DB
+    python scripts/tune_matcher.py --similar           # Reuse scores of near-duplicate postings
+    python scripts/tune_matcher.py --prefetch          # Score listed jobs while you pick one
 """
 
 import sys
 import json
+import heapq
+import hashlib
 import argparse
-import math
+import threading
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-
-import numpy as np
-import pandas as pd
+from typing import TYPE_CHECKING, Callable, Optional
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from dotenv import load_dotenv
-load_dotenv()
+# pandas, numpy and the matcher stack are imported where they're used, so --help
+# and argument errors don't pay for them
+if TYPE_CHECKING:
+    import pandas as pd
+    from src.job_matcher.match_scorer import MatchScorer
+    from src.job_matcher.semantic_cache import SemanticCache
+
+# Longest wait for the background warm-up before the first score (seconds)
+WARMUP_WAIT = 30
+
+# Concurrent LLM requests when prefetching scores for a job listing
+PREFETCH_WORKERS = 4
 
-from src.job_matcher.llama_client import LlamaClient
-from src.job_matcher.resume_analyzer import ResumeAnalyzer
-from src.job_matcher.match_scorer import MatchScorer
-from src.core.storage import JobStorage
+# Arrow-backed strings make the keyword scan a vectorized Arrow kernel instead of a
+# per-row Python loop (pandas 3 already uses them by default when pyarrow is installed)
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# Last load_all_jobs() result: {"signature": database file stats, "frame": df}
+_jobs_frame_cache: dict = {}
+
+# Lowercased search text of the most recently searched jobs frame: {"frame": df, "haystack": Series}
+_haystack_cache: dict = {}
 
 
 def sanitize_job_dict(job: dict) -> dict:
@@ -35,6 +54,9 @@ def sanitize_job_dict(job: dict) -> dict:
     Convert numpy arrays and pandas types to native Python types.
     This is needed because DataFrame.to_dict() returns numpy arrays for list columns.
     """
+    import numpy as np
+    import pandas as pd
+
     sanitized = {}
     for key, value in job.items():
         if isinstance(value, np.ndarray):
@@ -50,15 +72,120 @@ def sanitize_job_dict(job: dict) -> dict:
     return sanitized
 
 
+def frame_to_jobs(df: "pd.DataFrame") -> list:
+    """
+    Convert a DataFrame of jobs to a list of dicts with native Python values.
+
+    Same result as sanitize_job_dict on every row, but NaN/NaT -> None and numpy
+    scalar boxing run column-wise in pandas; only datetime columns and list-valued
+    columns (DuckDB LIST columns come back as ndarrays) are converted per cell.
+    """
+    import numpy as np
+    import pandas as pd
+
+    df = df.copy()
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            df[col] = series.map(lambda v: v.isoformat(), na_action='ignore').astype(object)
+        elif series.dtype == object:
+            first = series.dropna().head(1)
+            if len(first) and isinstance(first.iloc[0], np.ndarray):
+                df[col] = series.map(lambda v: v.tolist() if isinstance(v, np.ndarray) else v)
+
+    df = df.astype(object)
+    return df.where(df.notna(), None).to_dict('records')
+
+
+def _search_haystack(df: "pd.DataFrame") -> "pd.Series":
+    """
+    Lowercased title, company and description of each job, built once per frame.
+
+    The columns are joined with a unit separator so a match can't span two fields.
+    """
+    if _haystack_cache.get("frame") is not df:
+        haystack = (
+            df['title'].fillna('') + '\x1f' +
+            df['company'].fillna('') + '\x1f' +
+            df['description'].fillna('')
+        ).str.lower()
+        if PYARROW_AVAILABLE:
+            haystack = haystack.astype('string[pyarrow]')
+        _haystack_cache.clear()
+        _haystack_cache.update(frame=df, haystack=haystack)
+    return _haystack_cache["haystack"]
+
+
+def search_mask(df: "pd.DataFrame", search: str) -> "pd.Series":
+    """Case-insensitive substring match of search against title, company or description."""
+    haystack = _search_haystack(df)
+    return haystack.str.contains(search.lower(), regex=False, na=False).astype(bool)
+
+
+def most_recent(df: "pd.DataFrame", n: int) -> "pd.DataFrame":
+    """
+    Return the n most recently posted jobs, newest first, undated jobs last.
+
+    Selects with a partial sort (heap of n) rather than sorting the whole frame.
+    """
+    import pandas as pd
+
+    dates = df['date_posted']
+    has_date = dates.notna()
+    if pd.api.types.is_datetime64_any_dtype(dates) or pd.api.types.is_numeric_dtype(dates):
+        dated = df[has_date].nlargest(n, 'date_posted', keep='first')
+    else:
+        # date_posted is stored as ISO-8601 text, which orders the same as the dates
+        values = dates[has_date]
+        as_list = values.tolist()
+        top = heapq.nlargest(n, range(len(as_list)), key=as_list.__getitem__)
+        dated = df.loc[values.index[top]]
+
+    if len(dated) < n:
+        dated = pd.concat([dated, df[~has_date].head(n - len(dated))])
+    return dated
+
+
+def _database_signature(db_path: Path) -> tuple:
+    """(mtime_ns, size) of the DuckDB file and its write-ahead log (None if missing)."""
+    signature = []
+    for path in (db_path, db_path.with_name(db_path.name + ".wal")):
+        try:
+            stat = path.stat()
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def load_jobs_frame() -> "pd.DataFrame":
+    """
+    All jobs as a DataFrame, reused while the database files are unchanged.
+
+    Any commit to the database (from this or another process) touches the file or
+    its WAL, so a changed signature means the jobs may have changed. Callers must
+    not modify the returned frame in place.
+    """
+    from src.core.storage import JobStorage
+
+    storage = JobStorage()
+    signature = _database_signature(Path(storage.db.db_path))
+    if _jobs_frame_cache.get("signature") != signature:
+        _jobs_frame_cache.clear()
+        _jobs_frame_cache.update(signature=signature, frame=storage.load_all_jobs())
+    return _jobs_frame_cache["frame"]
+
+
 def get_job_from_db(job_url: str = None, latest: bool = False) -> dict:
     """Fetch a job from the database."""
+    from src.core.storage import JobStorage
+
     storage = JobStorage()
 
     if latest:
-        df = storage.load_all_jobs()
+        df = load_jobs_frame()
         if df is not None and not df.empty:
-            df = df.sort_values('date_posted', ascending=False, na_position='last')
-            return sanitize_job_dict(df.iloc[0].to_dict())
+            return frame_to_jobs(most_recent(df, 1))[0]
         raise ValueError("No jobs found in database")
 
     if job_url:
@@ -70,67 +197,129 @@ def get_job_from_db(job_url: str = None, latest: bool = False) -> dict:
     return None
 
 
-def browse_jobs(search: str = None) -> dict:
-    """Browse jobs from database and let user select one."""
-    storage = JobStorage()
+class ScorePrefetcher:
+    """Speculatively score the jobs of a listing while the user reads it."""
+
+    def __init__(self, score_fn: Callable[[dict], Optional[dict]], max_workers: int = PREFETCH_WORKERS):
+        """
+        Args:
+            score_fn: Scores one job dict (must be thread-safe)
+            max_workers: Concurrent scoring requests
+        """
+        self.score_fn = score_fn
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        self._futures = {}
+
+    def start(self, jobs: list):
+        """Queue every listed job for scoring, replacing the previous listing."""
+        self.cancel()
+        self._futures = {job.get('job_url'): self._executor.submit(self.score_fn, job) for job in jobs}
+
+    def take(self, job: dict) -> Optional[dict]:
+        """
+        Get the prefetched result for a selected job and drop the rest of the listing.
+
+        Returns:
+            Scoring result, or None if the job wasn't prefetched (or is still queued)
+        """
+        future = self._futures.pop(job.get('job_url'), None)
+        self.cancel()
+        # A job that hasn't started yet is cheaper to score directly than to wait for
+        if future is None or future.cancel():
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"[WARNING] Prefetched scoring failed: {e}")
+            return None
 
-    # Get jobs from database as DataFrame
-    df = storage.load_all_jobs()
+    def cancel(self):
+        """Cancel queued scoring; requests already in flight finish in the background."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures = {}
 
-    if df is None or df.empty:
-        print("No jobs found in database")
-        return None
+    def shutdown(self):
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
-    # Filter by search term if provided
-    if search:
-        search_lower = search.lower()
-        mask = (
-            df['title'].str.lower().str.contains(search_lower, na=False) |
-            df['company'].str.lower().str.contains(search_lower, na=False) |
-            df['description'].str.lower().str.contains(search_lower, na=False)
-        )
-        df = df[mask]
-
-    if df.empty:
-        print(f"No jobs found matching '{search}'")
-        return None
 
-    # Sort by date_posted desc, limit to 50
-    df = df.sort_values('date_posted', ascending=False, na_position='last').head(50)
+def _show_listing(df: "pd.DataFrame") -> list:
+    """Print the 50 most recent jobs of df and return them as job dicts."""
+    # Most recently posted 50
+    df = most_recent(df, 50)
+
+    # Convert to list of dicts with native Python values
+    jobs = frame_to_jobs(df)
+
+    # Display columns, formatted column-wise (missing score/salary shown as "-")
+    import numpy as np
 
-    # Convert to list of dicts
-    jobs = df.to_dict('records')
+    scores = df['match_score'].astype(float)
+    salaries = df['salary_max'].astype(float)
+    score_strs = np.where(scores.notna(), scores.fillna(0).astype(int).astype(str).str.rjust(3), "  -")
+    salary_strs = np.where(
+        salaries.notna(),
+        "$" + (salaries.fillna(0) / 1000).round().astype(int).astype(str) + "k",
+        "    -",
+    )
+    remotes = np.where(df['remote'].eq(True), "Remote", "Onsite")
 
     # Display jobs
     print("\n" + "=" * 80)
     print(f"JOBS IN DATABASE ({len(jobs)} shown)")
     print("=" * 80)
 
-    for i, job in enumerate(jobs):
+    for i, (job, score_str, salary_str, remote) in enumerate(zip(jobs, score_strs, salary_strs, remotes)):
         title = str(job.get('title', 'Unknown'))[:40]
         company = str(job.get('company', 'Unknown'))[:20]
+        print(f"  [{i+1:2d}] {score_str} | {salary_str:>6} | {remote:6} | {title:<40} @ {company}")
 
-        # Handle score (could be None, NaN, or valid number)
-        score = job.get('match_score')
-        if score is not None and not (isinstance(score, float) and math.isnan(score)):
-            score_str = f"{int(score):3d}"
-        else:
-            score_str = "  -"
+    print("\n" + "-" * 80)
+    print("Enter number to select, 's' to search, or 'q' to quit")
 
-        remote = "Remote" if job.get('remote') else "Onsite"
+    return jobs
 
-        # Handle salary (could be None, NaN, or valid number)
-        salary_max = job.get('salary_max')
-        if salary_max is not None and not (isinstance(salary_max, float) and math.isnan(salary_max)):
-            salary_str = f"${float(salary_max)/1000:.0f}k"
-        else:
-            salary_str = "    -"
 
-        print(f"  [{i+1:2d}] {score_str} | {salary_str:>6} | {remote:6} | {title:<40} @ {company}")
+def browse_jobs(search: str = None, prefetcher: ScorePrefetcher = None) -> dict:
+    """Browse jobs from database and let user select one."""
+    # Loaded once per browse; searches filter this frame and reuse its search text
+    jobs_df = load_jobs_frame()
 
-    print("\n" + "-" * 80)
-    print("Enter number to select, 's' to search, or 'q' to quit")
+    if jobs_df is None or jobs_df.empty:
+        print("No jobs found in database")
+        return None
 
+    while True:
+        # Filter by search term if provided
+        df = jobs_df
+        if search:
+            df = df[search_mask(df, search)]
+
+        if df.empty:
+            print(f"No jobs found matching '{search}'")
+            return None
+
+        jobs = _show_listing(df)
+        if prefetcher is not None:
+            prefetcher.start(jobs)
+
+        selection = _select_job(len(jobs))
+        if selection is None:
+            return None
+        if isinstance(selection, str):
+            search = selection
+            continue
+        return jobs[selection]
+
+
+def _select_job(count: int):
+    """
+    Prompt until the user picks a job, asks for a search, or quits.
+
+    Returns:
+        Index of the chosen job, the new search term (str), or None to quit
+    """
     while True:
         try:
             choice = input("\nSelect job: ").strip().lower()
@@ -140,15 +329,17 @@ def browse_jobs(search: str = None) -> dict:
         if choice == 'q':
             return None
         elif choice == 's':
-            search_term = input("Search term: ").strip()
-            return browse_jobs(search=search_term)
+            try:
+                return input("Search term: ").strip()
+            except (EOFError, KeyboardInterrupt):
+                return None
         else:
             try:
                 idx = int(choice) - 1
-                if 0 <= idx < len(jobs):
-                    return sanitize_job_dict(jobs[idx])
+                if 0 <= idx < count:
+                    return idx
                 else:
-                    print(f"Invalid selection. Enter 1-{len(jobs)}")
+                    print(f"Invalid selection. Enter 1-{count}")
             except ValueError:
                 print("Enter a number, 's' to search, or 'q' to quit")
 
@@ -230,7 +421,7 @@ def display_scoring_result(result: dict, job: dict):
             print(f"  {req}: {value}")
 
 
-def show_prompt(scorer: MatchScorer, job: dict):
+def show_prompt(scorer: "MatchScorer", job: dict):
     """Show the full prompt that would be sent to the LLM."""
     print("\n" + "=" * 60)
     print("FULL PROMPT (for debugging)")
@@ -240,6 +431,75 @@ def show_prompt(scorer: MatchScorer, job: dict):
     print("\n" + "=" * 60)
 
 
+def print_token(text: str):
+    """Write streamed model output as it arrives."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def score_with_similar(scorer: "MatchScorer", job: dict, use_hybrid: bool,
+                       similar_cache: "SemanticCache" = None, refresh_cache: bool = False,
+                       on_token: Optional[Callable[[str], None]] = None):
+    """
+    Score a job, reusing the AI response of a near-duplicate posting when a similarity cache is given.
+
+    Only the AI part (score, reasoning, matched requirements) is reused; the deterministic
+    title/salary/location score and preference checks are computed for this job.
+
+    Args:
+        scorer: MatchScorer instance
+        job: Job dict to score
+        use_hybrid: Whether to use hybrid scoring
+        similar_cache: SemanticCache to consult, or None to always score
+        refresh_cache: Skip both caches and ask the LLM again
+        on_token: Called with the model's output as it streams in (not for cached results)
+
+    Returns:
+        Scoring result dict, or None if scoring failed
+    """
+    if similar_cache is None:
+        return scorer.score_job(job, use_hybrid_scoring=use_hybrid, refresh_cache=refresh_cache, on_token=on_token)
+
+    # The AI response doesn't depend on hybrid mode, so both modes share entries
+    context = f"{scorer.analyzer.get_candidate_context()}\x00ai_response"
+    context_id = hashlib.sha256(context.encode("utf-8")).hexdigest()
+
+    if not refresh_cache:
+        hit = similar_cache.lookup(job, context_id)
+        if hit:
+            similarity, entry = hit
+            print(f"[INFO] Reusing AI score from similar job (similarity {similarity:.2f}): {entry.get('job_url')}")
+            cached = entry["result"]
+            response = {
+                "match_score": cached["ai_score"],
+                "reasoning": cached["reasoning"],
+                "matched_requirements": cached["matched_requirements"],
+            }
+            return scorer.score_from_ai_response(job, response, use_hybrid_scoring=use_hybrid)
+
+    result = scorer.score_job(job, use_hybrid_scoring=use_hybrid, refresh_cache=refresh_cache, on_token=on_token)
+    if result:
+        response = scorer.ai_response_from_result(result)
+        similar_cache.store(job, context_id, {
+            "ai_score": response["match_score"],
+            "reasoning": response["reasoning"],
+            "matched_requirements": response["matched_requirements"],
+        })
+    return result
+
+
+def warm_up(client, analyzer, similar_cache: "SemanticCache" = None):
+    """
+    Get the model ready for the first score while the user picks a job.
+
+    Processes the candidate prefix shared by every scoring prompt on llama-server
+    (which also loads the model if it was idle) and loads the similarity model.
+    """
+    client.warm_prompt_cache(analyzer.get_candidate_context())
+    if similar_cache is not None:
+        similar_cache.embed({})
+
+
 def main():
     parser = argparse.ArgumentParser(description="Tune job matching against a single job")
     parser.add_argument("--url", help="Job URL to fetch from database")
@@ -247,8 +507,26 @@ def main():
     parser.add_argument("--latest", action="store_true", help="Use the most recent job from database")
     parser.add_argument("--show-prompt", action="store_true", help="Show the full prompt sent to LLM")
     parser.add_argument("--no-hybrid", action="store_true", help="Disable hybrid scoring (AI only)")
+    parser.add_argument("--no-cache", action="store_true", help="Always ask the LLM (don't reuse cached responses)")
+    parser.add_argument("--similar", action="store_true",
+                        help="Reuse AI scores of near-duplicate postings (reposts, templated descriptions)")
+    parser.add_argument("--no-fast-model", action="store_true",
+                        help="Score every job with the main model (ignore LLAMA_FAST_MODEL)")
+    parser.add_argument("--prefetch", action="store_true",
+                        help="Score the listed jobs in the background while browsing (uses more tokens)")
+    parser.add_argument("--stream", action="store_true", help="Print the LLM's output as it is generated")
     args = parser.parse_args()
 
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    from src.job_matcher.llama_client import LlamaClient
+    from src.job_matcher.resume_analyzer import ResumeAnalyzer
+    from src.job_matcher.match_scorer import MatchScorer
+    from src.job_matcher.response_cache import ResponseCache
+    from src.job_matcher.semantic_cache import SemanticCache
+    from src.utils.profile_manager import ProfilePaths
+
     print("\n" + "=" * 60)
     print("JOB MATCHER TUNING INTERFACE")
     print("=" * 60)
@@ -256,6 +534,11 @@ def main():
     # Initialize components
     print("\nInitializing...")
     client = LlamaClient()
+    if not args.no_cache:
+        # Re-scoring an unchanged prompt returns the stored response instantly. Only
+        # identical prompts to the same loaded model match, so edits to the prompt or
+        # requirements (or a model swap) re-query.
+        client.response_cache = ResponseCache(content_keys=False, model_id=client.get_model_id())
     analyzer = ResumeAnalyzer()
 
     try:
@@ -266,6 +549,43 @@ def main():
         return 1
 
     scorer = MatchScorer(client, analyzer)
+    scorer.use_fast_model = not args.no_fast_model
+    if client.fast_model and scorer.use_fast_model:
+        print(f"Clear-cut jobs are scored with fast model: {client.fast_model}")
+    # Build the candidate prefix shared by every prompt now, so [p]/[r] only format the job
+    analyzer.get_candidate_context()
+
+    similar_cache = None
+    if args.similar:
+        similar_cache = SemanticCache(ProfilePaths().data_dir / "semantic_cache.npz")
+        print(f"Similar-job cache: {similar_cache.backend}, threshold {similar_cache.threshold}")
+
+    # Warm the model in the background while a job is chosen
+    warmup = threading.Thread(target=warm_up, args=(client, analyzer, similar_cache), daemon=True)
+    warmup.start()
+    print("Warming up the model in the background")
+
+    use_hybrid = not args.no_hybrid
+    # Prefetched scores run in the background and never stream
+    on_token = print_token if args.stream else None
+
+    prefetcher = None
+    if args.prefetch:
+        def prefetch_score(job: dict) -> Optional[dict]:
+            warmup.join(timeout=WARMUP_WAIT)
+            return score_with_similar(scorer, job, use_hybrid, similar_cache)
+
+        prefetcher = ScorePrefetcher(prefetch_score)
+
+    def score_selected(job: dict) -> Optional[dict]:
+        """Score a job picked from a listing, using its prefetched result if there is one."""
+        result = prefetcher.take(job) if prefetcher is not None else None
+        if result:
+            return result
+        result = score_with_similar(scorer, job, use_hybrid, similar_cache, on_token=on_token)
+        if on_token is not None:
+            print()
+        return result
 
     # Get the job
     job = None
@@ -278,7 +598,7 @@ def main():
         print("Loaded latest job from database")
     else:
         # Default: browse jobs from database
-        job = browse_jobs(search=args.search)
+        job = browse_jobs(search=args.search, prefetcher=prefetcher)
 
     if not job:
         print("No job selected")
@@ -295,10 +615,10 @@ def main():
         if input().lower() != 'y':
             return 0
 
-    # Score the job
+    # Score the job (once the warm-up has processed the shared prefix)
     print("\nScoring job...")
-    use_hybrid = not args.no_hybrid
-    result = scorer.score_job(job, use_hybrid_scoring=use_hybrid)
+    warmup.join(timeout=WARMUP_WAIT)
+    result = score_selected(job)
 
     if result:
         display_scoring_result(result, job)
@@ -310,7 +630,8 @@ def main():
     print("\n" + "=" * 60)
     print("OPTIONS:")
     print("  [p] Show full prompt")
-    print("  [r] Re-score this job")
+    print("  [r] Re-score this job (cached if the prompt is unchanged)")
+    print("  [f] Force re-score (ask the LLM again)")
     print("  [b] Browse and select another job")
     print("  [q] Quit")
     print("=" * 60)
@@ -325,20 +646,27 @@ def main():
             break
         elif choice == 'p':
             show_prompt(scorer, job)
-        elif choice == 'r':
+        elif choice in ('r', 'f'):
             print("\nRe-scoring job...")
-            result = scorer.score_job(job, use_hybrid_scoring=use_hybrid)
+            if client.response_cache is not None:
+                # A model swapped on the server since startup must not get the old model's answer
+                client.response_cache.model_id = client.get_model_id(refresh=True)
+            result = score_with_similar(
+                scorer, job, use_hybrid, similar_cache, refresh_cache=(choice == 'f'), on_token=on_token
+            )
+            if on_token is not None:
+                print()
             if result:
                 display_scoring_result(result, job)
             else:
                 print("Scoring FAILED")
         elif choice == 'b':
-            new_job = browse_jobs()
+            new_job = browse_jobs(prefetcher=prefetcher)
             if new_job:
                 job = new_job
                 display_job_summary(job)
                 print("\nScoring job...")
-                result = scorer.score_job(job, use_hybrid_scoring=use_hybrid)
+                result = score_selected(job)
                 if result:
                     display_scoring_result(result, job)
                 else:
@@ -346,6 +674,9 @@ def main():
         else:
             print("Unknown option")
 
+    if prefetcher is not None:
+        prefetcher.shutdown()
+
     print("\nDone!")
     return 0
 
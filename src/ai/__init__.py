@@ -11,8 +11,10 @@ Usage:
     result = provider.generate("Hello, world!")
 """
 
+import hashlib
+import os
 import threading
-from typing import Optional
+from typing import Optional, Tuple
 
 from .provider import AIProvider, AICapabilities, ConnectionTestResult
 from .settings import (
@@ -31,18 +33,57 @@ from .settings import (
     threshold_settings_file_exists,
     delete_threshold_settings_file,
 )
+from .settings import SETTINGS_FILE, get_project_root
 from .openai_provider import OpenAICompatibleProvider
 
 
-# Cached provider instance with thread safety
+# Cached provider instance with thread safety. The lock only guards rebuilding;
+# cache hits read _provider_snapshot, a (settings signature, provider) tuple that
+# is replaced as a whole, so a lock-free reader never sees a mismatched pair.
 _provider_lock = threading.Lock()
 _provider_instance: Optional[AIProvider] = None
-_provider_settings_hash: Optional[str] = None
+_provider_settings_hash: Optional[bytes] = None
+_provider_snapshot: Optional[Tuple[Tuple, AIProvider]] = None
+
+# Inputs of load_ai_settings() besides ai_settings.json
+_DOTENV_FILE = get_project_root() / ".env"
+_SETTINGS_ENV_VARS = (
+    "AI_BASE_URL", "LLAMA_SERVER_URL", "OPENAI_API_KEY", "AI_MODEL",
+    "LLAMA_TEMPERATURE", "LLAMA_MAX_TOKENS", "LLAMA_REQUEST_TIMEOUT", "MATCH_THREADS",
+)
 
 
-def _settings_hash(settings: AISettings) -> str:
-    """Generate a hash of settings for cache invalidation."""
-    return f"{settings.base_url}:{settings.api_key}:{settings.model}:{settings.vision_model}"
+def _settings_signature() -> Tuple:
+    """
+    Fingerprint the inputs of load_ai_settings() without parsing them.
+
+    Returns:
+        (mtime_ns, size) of ai_settings.json and .env (None if missing), plus the
+        environment variables the settings are read from
+    """
+    signature = []
+    for path in (SETTINGS_FILE, _DOTENV_FILE):
+        try:
+            stat = path.stat()
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    signature.extend(os.environ.get(name) for name in _SETTINGS_ENV_VARS)
+    return tuple(signature)
+
+
+def _settings_hash(settings: AISettings) -> bytes:
+    """
+    Generate a hash of settings for cache invalidation.
+
+    A 16-byte blake2b digest keeps the raw API key out of module state; fields are
+    NUL-separated so values can't run into each other.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for value in (settings.base_url, settings.api_key, settings.model, settings.vision_model):
+        digest.update((value or "").encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.digest()
 
 
 def get_ai_provider(force_reload: bool = False) -> AIProvider:
@@ -50,7 +91,9 @@ def get_ai_provider(force_reload: bool = False) -> AIProvider:
     Get the AI provider instance.
 
     Uses a cached instance unless force_reload is True or settings have changed.
-    Thread-safe.
+    Settings are only re-read when ai_settings.json, .env or the relevant
+    environment variables changed since the last call. Thread-safe; cache hits
+    don't take the lock.
 
     Args:
         force_reload: Force creation of a new provider instance
@@ -58,16 +101,29 @@ def get_ai_provider(force_reload: bool = False) -> AIProvider:
     Returns:
         AIProvider instance configured from settings
     """
-    global _provider_instance, _provider_settings_hash
+    global _provider_instance, _provider_settings_hash, _provider_snapshot
+
+    if not force_reload:
+        snapshot = _provider_snapshot
+        if snapshot is not None and snapshot[0] == _settings_signature():
+            return snapshot[1]
 
     with _provider_lock:
+        # Another thread may have rebuilt the provider while we waited
+        snapshot = _provider_snapshot
+        if not force_reload and snapshot is not None and snapshot[0] == _settings_signature():
+            return snapshot[1]
+
         settings = load_ai_settings()
         current_hash = _settings_hash(settings)
+        # Taken after loading: load_ai_settings() may have applied .env to the environment
+        signature = _settings_signature()
 
         if force_reload or _provider_instance is None or _provider_settings_hash != current_hash:
             _provider_instance = create_provider(settings)
             _provider_settings_hash = current_hash
 
+        _provider_snapshot = (signature, _provider_instance)
         return _provider_instance
 
 
@@ -92,9 +148,11 @@ def create_provider(settings: Optional[AISettings] = None) -> AIProvider:
 
 def clear_provider_cache():
     """Clear the cached provider instance."""
-    global _provider_instance, _provider_settings_hash
-    _provider_instance = None
-    _provider_settings_hash = None
+    global _provider_instance, _provider_settings_hash, _provider_snapshot
+    with _provider_lock:
+        _provider_snapshot = None
+        _provider_instance = None
+        _provider_settings_hash = None
 
 
 __all__ = [
@@ -7,7 +7,6 @@ Commands for running job searches, testing proxies, and managing scraper configu
 import os
 import ast
 import time
-import yaml
 import random
 import string
 from datetime import datetime
@@ -18,6 +17,7 @@ import click
 from dotenv import load_dotenv
 
 from src.utils.profile_manager import ProfilePaths
+from src.utils.fast_yaml import load_yaml_file
 from src.cli.utils import (
     print_header,
     print_section,
@@ -66,6 +66,19 @@ def parse_env_list(env_var: str, default: list = None) -> list:
         return [item.strip() for item in value.split(",")]
 
 
+def _load_requirements() -> dict:
+    """
+    Load the active profile's requirements.yaml (one stat, cached parse)
+
+    Returns:
+        Parsed requirements, or empty dict if missing or unreadable
+    """
+    try:
+        return load_yaml_file(ProfilePaths().requirements_path) or {}
+    except Exception:
+        return {}
+
+
 def load_jobs_from_requirements() -> list:
     """
     Load job search terms from active profile's requirements.yaml
@@ -73,16 +86,8 @@ def load_jobs_from_requirements() -> list:
     Returns:
         List of job titles to search, or empty list if not found
     """
-    requirements_path = ProfilePaths().requirements_path
-
-    if not requirements_path.exists():
-        return []
-
     try:
-        with open(requirements_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-
-        job_requirements = data.get('job_requirements', {})
+        job_requirements = _load_requirements().get('job_requirements', {})
         search_jobs = job_requirements.get('search_jobs', [])
 
         return search_jobs if search_jobs else []
@@ -97,17 +102,9 @@ def load_locations_from_requirements() -> list:
     Returns:
         List of locations to search, or empty list if not found
     """
-    requirements_path = ProfilePaths().requirements_path
-
-    if not requirements_path.exists():
-        return []
-
     try:
-        with open(requirements_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-
         # Read from preferences.locations (single source of truth)
-        preferences = data.get('preferences', {})
+        preferences = _load_requirements().get('preferences', {})
         locations = preferences.get('locations', [])
 
         return locations if locations else []
@@ -10,7 +10,7 @@ import sys
 import json
 import threading
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator
 from datetime import datetime
 
 import duckdb
@@ -331,6 +331,32 @@ class DatabaseManager:
                 )
                 """)
 
+                # LLM response cache - parsed AI responses keyed by prompt hash
+                conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_response_cache (
+                prompt_hash VARCHAR PRIMARY KEY,
+                response_json TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+                """)
+
+                # Filter cache - URLs of jobs that passed a content-filter set (by fingerprint)
+                conn.execute("""
+                CREATE TABLE IF NOT EXISTS filtered_job_cache (
+                fingerprint VARCHAR NOT NULL,
+                job_url VARCHAR NOT NULL,
+                PRIMARY KEY (fingerprint, job_url)
+                )
+                """)
+
+                # Filter cache watermarks - last_seen up to which each fingerprint is evaluated
+                conn.execute("""
+                CREATE TABLE IF NOT EXISTS filtered_job_watermarks (
+                fingerprint VARCHAR PRIMARY KEY,
+                watermark TIMESTAMP NOT NULL
+                )
+                """)
+
                 # Create indexes for performance
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source)")
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_match_score ON jobs(match_score)")
@@ -440,6 +466,38 @@ class DatabaseManager:
             finally:
                 conn.close()
 
+    def fetch_records(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
+        """Execute query and return rows as dicts keyed by column name (uses read-only connection).
+        Skips the DataFrame round trip when the caller wants plain records.
+        """
+        with self._conn_lock:
+            conn = self._connect(read_only=True)
+            try:
+                result = conn.execute(query, params) if params else conn.execute(query)
+                columns = [column[0] for column in result.description]
+                return [dict(zip(columns, row)) for row in result.fetchall()]
+            finally:
+                conn.close()
+
+    def fetchdf_chunks(self, query: str, params: tuple = None, rows_per_chunk: int = 8192) -> Iterator:
+        """Execute query and yield the result as pandas DataFrame chunks (uses read-only connection).
+
+        Only one chunk is materialized at a time. The lock and connection are held
+        until the generator is exhausted or closed, so consume it promptly.
+        """
+        vectors_per_chunk = max(1, rows_per_chunk // 2048)  # DuckDB vectors hold 2048 rows
+        with self._conn_lock:
+            conn = self._connect(read_only=True)
+            try:
+                result = conn.execute(query, params) if params else conn.execute(query)
+                while True:
+                    chunk = result.fetch_df_chunk(vectors_per_chunk)
+                    if chunk.empty:
+                        break
+                    yield chunk
+            finally:
+                conn.close()
+
     def batch_context(self) -> "BatchContext":
         """Get a batch context for performing multiple operations on a single connection.
 
@@ -517,6 +575,15 @@ class BatchContext:
             raise RuntimeError("BatchContext not entered")
         self._conn.executemany(query, params_list)
 
+    def register(self, view_name: str, df):
+        """Expose a pandas DataFrame as a view on the batch connection.
+
+        Lets set-based statements (e.g. UPDATE ... FROM view) consume many rows at once.
+        """
+        if not self._conn:
+            raise RuntimeError("BatchContext not entered")
+        self._conn.register(view_name, df)
+
 
 def get_database(profile_name: Optional[str] = None) -> DatabaseManager:
     """
@@ -84,8 +84,10 @@ def scrape_jobs(
     proxies: Optional[List[str]] = None,
     use_proxies: bool = True,
     proxy_session: Optional[str] = None,
+    indeed_scraper: Optional[IndeedScraper] = None,
+    as_objects: bool = False,
     **kwargs,
-) -> pd.DataFrame:
+) -> Union[pd.DataFrame, List[JobPost]]:
     """
     Scrape job postings from multiple job boards
 
@@ -100,10 +102,13 @@ def scrape_jobs(
         proxies: List of proxy URLs to use for requests (optional)
         use_proxies: Whether to use proxies for requests (default: True)
         proxy_session: Optional session ID for IP rotation (generates different IPs)
+        indeed_scraper: Existing IndeedScraper to reuse across calls (left open; the
+                        caller closes it). proxy_session is applied to it.
+        as_objects: Return the scraped JobPost objects instead of building a DataFrame
         **kwargs: Additional site-specific parameters
 
     Returns:
-        pandas DataFrame with job postings
+        pandas DataFrame with job postings (list of JobPost objects if as_objects)
 
     Example:
         >>> jobs = scrape_jobs(
@@ -145,14 +150,14 @@ def scrape_jobs(
     concurrent_scrapers = []
     glassdoor_scraper = None
 
+    # Scrapers passed in by the caller are reused, not closed
     if "indeed" in site_names:
-        concurrent_scrapers.append(
-            (
-                "indeed",
-                IndeedScraper(proxies=proxies, use_proxies=use_proxies, proxy_session=proxy_session),
-                {"country": country_indeed},
-            )
-        )
+        if indeed_scraper is not None:
+            indeed_scraper.set_proxy_session(proxy_session)
+            scraper, owned = indeed_scraper, False
+        else:
+            scraper, owned = IndeedScraper(proxies=proxies, use_proxies=use_proxies, proxy_session=proxy_session), True
+        concurrent_scrapers.append(("indeed", scraper, {"country": country_indeed}, owned))
 
     if "glassdoor" in site_names:
         # Glassdoor uses VLM with singleton browser - must run sequentially
@@ -163,7 +168,7 @@ def scrape_jobs(
     # Disabled scrapers - need GraphQL/API implementation
     # if "linkedin" in site_names:
     #     concurrent_scrapers.append(
-    #         ("linkedin", LinkedInScraper(proxies=proxies, use_proxies=use_proxies), {})
+    #         ("linkedin", LinkedInScraper(proxies=proxies, use_proxies=use_proxies), {}, True)
     #     )
     #
     # if "zip_recruiter" in site_names:
@@ -172,6 +177,7 @@ def scrape_jobs(
     #             "zip_recruiter",
     #             ZipRecruiterScraper(proxies=proxies, use_proxies=use_proxies),
     #             {},
+    #             True,
     #         )
     #     )
 
@@ -182,7 +188,7 @@ def scrape_jobs(
         with ThreadPoolExecutor(max_workers=len(concurrent_scrapers)) as executor:
             future_to_scraper = {}
 
-            for site, scraper, site_kwargs in concurrent_scrapers:
+            for site, scraper, site_kwargs, owned in concurrent_scrapers:
                 future = executor.submit(
                     _scrape_site,
                     scraper,
@@ -192,10 +198,10 @@ def scrape_jobs(
                     hours_old,
                     site_kwargs,
                 )
-                future_to_scraper[future] = (site, scraper)
+                future_to_scraper[future] = (site, scraper, owned)
 
             for future in as_completed(future_to_scraper):
-                site, scraper = future_to_scraper[future]
+                site, scraper, owned = future_to_scraper[future]
                 try:
                     jobs = future.result()
                     all_jobs.extend(jobs)
@@ -203,10 +209,11 @@ def scrape_jobs(
                 except Exception as e:
                     print(f"Error scraping {site}: {e}")
                 finally:
-                    try:
-                        scraper.close()
-                    except:
-                        pass
+                    if owned:
+                        try:
+                            scraper.close()
+                        except:
+                            pass
 
     # Run Glassdoor separately (uses singleton browser, must be sequential)
     if glassdoor_scraper:
@@ -231,11 +238,15 @@ def scrape_jobs(
             except:
                 pass
 
-    # Convert to DataFrame
     if not all_jobs:
         print("No jobs found")
-        return pd.DataFrame()
+        return [] if as_objects else pd.DataFrame()
 
+    if as_objects:
+        print(f"\nTotal jobs found: {len(all_jobs)}")
+        return all_jobs
+
+    # Convert to DataFrame
     df = pd.DataFrame([job.to_dict() for job in all_jobs])
 
     # Sort by site and date (if available)
@@ -54,18 +54,31 @@ class IndeedScraper(BaseScraper):
         # Get proxy URL if using proxies
         self.proxy_url = None
         self.proxy_session = proxy_session
+        self._base_proxy = None
 
         if use_proxies:
             if proxies:
-                base_proxy = proxies[0] if proxies else None
+                self._base_proxy = proxies[0] if proxies else None
             elif DEFAULT_PROXIES:
-                base_proxy = DEFAULT_PROXIES[0]
-            else:
-                base_proxy = None
+                self._base_proxy = DEFAULT_PROXIES[0]
 
             # Build proxy URL with session ID if provided
-            if base_proxy:
-                self.proxy_url = self._build_session_proxy(base_proxy, proxy_session)
+            if self._base_proxy:
+                self.proxy_url = self._build_session_proxy(self._base_proxy, proxy_session)
+
+    def set_proxy_session(self, proxy_session: Optional[str]) -> None:
+        """
+        Switch to a different proxy session (exit IP) while keeping the TLS session
+
+        Lets one scraper be reused across searches: connections and cookies
+        carry over and only the session ID in the proxy URL changes.
+
+        Args:
+            proxy_session: Proxy session ID (None for the base proxy)
+        """
+        self.proxy_session = proxy_session
+        if self._base_proxy:
+            self.proxy_url = self._build_session_proxy(self._base_proxy, proxy_session)
 
     @staticmethod
     def _generate_session_id(length: int = 10) -> str:
@@ -6,10 +6,11 @@ Handles saving job data to DuckDB with deduplication.
 
 import json
 import math
+import hashlib
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Union
 
 from .models import JobPost
 from .database import get_database
@@ -49,6 +50,7 @@ class JobStorage:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         self.db = get_database(profile_name)
+        self._record_select: Optional[str] = None
 
     def save_jobs(
         self,
@@ -149,10 +151,9 @@ class JobStorage:
             with self.db.batch_context() as batch:
                 # Get existing URLs in one query
                 job_urls = [j["job_url"] for j in job_dicts]
-                placeholders = ",".join(["?" for _ in job_urls])
                 existing_result = batch.fetchall(
-                    f"SELECT job_url FROM jobs WHERE job_url IN ({placeholders})",
-                    tuple(job_urls)
+                    "SELECT job_url FROM jobs WHERE job_url IN (SELECT unnest(?))",
+                    (job_urls,)
                 )
                 existing_urls = {row[0] for row in existing_result}
 
@@ -758,6 +759,30 @@ class JobStorage:
 
         return df
 
+    def iter_unprocessed_jobs(
+        self, source: Optional[str] = None, batch_size: int = 8192
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream jobs that haven't been scored yet in DataFrame chunks
+
+        Args:
+            source: Optional source filter
+            batch_size: Approximate number of rows per chunk
+
+        Returns:
+            Iterator of DataFrame chunks
+        """
+        if source:
+            return self.db.fetchdf_chunks(
+                "SELECT * FROM jobs WHERE source = ? AND match_score IS NULL ORDER BY first_seen DESC",
+                (source,),
+                rows_per_chunk=batch_size,
+            )
+        return self.db.fetchdf_chunks(
+            "SELECT * FROM jobs WHERE match_score IS NULL ORDER BY first_seen DESC",
+            rows_per_chunk=batch_size,
+        )
+
     def load_unprocessed_jobs_filtered(
         self,
         source: Optional[str] = None,
@@ -769,6 +794,8 @@ class JobStorage:
         job_types: Optional[List[str]] = None,
         locations: Optional[List[str]] = None,
         max_job_age_days: Optional[int] = None,
+        exclude_tracked: bool = False,
+        filter_cache: bool = False,
     ) -> tuple[Optional[pd.DataFrame], Dict[str, Any]]:
         """
         Load unprocessed jobs with SQL-based filtering (much faster than Python filtering)
@@ -783,10 +810,126 @@ class JobStorage:
             job_types: List of acceptable job types (e.g., ["full-time", "fulltime"])
             locations: List of preferred locations (for non-remote jobs)
             max_job_age_days: Maximum age of job posting in days
+            exclude_tracked: If True, skip jobs already recorded in processed_jobs
+                             (anti-join inside DuckDB instead of per-job lookups)
+            filter_cache: If True, reuse cached content-filter verdicts and only
+                          filter rows seen since the last run
 
         Returns:
             Tuple of (DataFrame with filtered jobs, filter statistics dict)
         """
+        where_clause, params, base_where, base_params = self._build_unprocessed_filters(
+            source=source,
+            title_keywords=title_keywords,
+            title_exclude_keywords=title_exclude_keywords,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            remote_only=remote_only,
+            job_types=job_types,
+            locations=locations,
+            max_job_age_days=max_job_age_days,
+            exclude_tracked=exclude_tracked,
+            filter_cache=filter_cache,
+        )
+
+        # Get total count before filtering (for stats)
+        total_before = self.db.fetchone(f"SELECT COUNT(*) FROM jobs WHERE {base_where}", base_params)[0]
+
+        query = f"SELECT * FROM jobs WHERE {where_clause} ORDER BY first_seen DESC"
+        df = self.db.fetchdf(query, params)
+
+        # Calculate stats
+        total_after = len(df) if not df.empty else 0
+        stats = {
+            "total_jobs": total_before,
+            "passed_jobs": total_after,
+            "rejected_jobs": total_before - total_after,
+            "pass_rate": total_after / total_before if total_before > 0 else 0,
+        }
+
+        if df.empty:
+            return None, stats
+
+        return df, stats
+
+    def iter_unprocessed_jobs_filtered(
+        self,
+        source: Optional[str] = None,
+        title_keywords: Optional[List[str]] = None,
+        title_exclude_keywords: Optional[List[str]] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        remote_only: bool = False,
+        job_types: Optional[List[str]] = None,
+        locations: Optional[List[str]] = None,
+        max_job_age_days: Optional[int] = None,
+        exclude_tracked: bool = False,
+        filter_cache: bool = False,
+        batch_size: int = 8192,
+    ) -> tuple[Iterator[pd.DataFrame], Dict[str, Any]]:
+        """
+        Streaming variant of load_unprocessed_jobs_filtered
+
+        Filter statistics are computed up front with COUNT queries, so the
+        matching rows never have to be held in memory at once.
+
+        Args:
+            (filters): Same as load_unprocessed_jobs_filtered
+            batch_size: Approximate number of rows per chunk
+
+        Returns:
+            Tuple of (iterator of DataFrame chunks, filter statistics dict)
+        """
+        where_clause, params, base_where, base_params = self._build_unprocessed_filters(
+            source=source,
+            title_keywords=title_keywords,
+            title_exclude_keywords=title_exclude_keywords,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            remote_only=remote_only,
+            job_types=job_types,
+            locations=locations,
+            max_job_age_days=max_job_age_days,
+            exclude_tracked=exclude_tracked,
+            filter_cache=filter_cache,
+        )
+
+        total_before = self.db.fetchone(f"SELECT COUNT(*) FROM jobs WHERE {base_where}", base_params)[0]
+        total_after = self.db.fetchone(f"SELECT COUNT(*) FROM jobs WHERE {where_clause}", params)[0]
+        stats = {
+            "total_jobs": total_before,
+            "passed_jobs": total_after,
+            "rejected_jobs": total_before - total_after,
+            "pass_rate": total_after / total_before if total_before > 0 else 0,
+        }
+
+        query = f"SELECT * FROM jobs WHERE {where_clause} ORDER BY first_seen DESC"
+        return self.db.fetchdf_chunks(query, params, rows_per_chunk=batch_size), stats
+
+    def _build_unprocessed_filters(
+        self,
+        source: Optional[str],
+        title_keywords: Optional[List[str]],
+        title_exclude_keywords: Optional[List[str]],
+        min_salary: Optional[float],
+        max_salary: Optional[float],
+        remote_only: bool,
+        job_types: Optional[List[str]],
+        locations: Optional[List[str]],
+        max_job_age_days: Optional[int],
+        exclude_tracked: bool,
+        filter_cache: bool = False,
+    ) -> tuple[str, tuple, str, tuple]:
+        """
+        Build the WHERE clause shared by the filtered unprocessed-job loaders
+
+        With filter_cache, the content filters (title, salary, remote, job type,
+        location) are answered from materialize_filtered_view for rows already
+        evaluated, and only rows seen since then go through the full filter.
+
+        Returns:
+            Tuple of (where clause, params, candidate-pool where clause, its params)
+        """
         from datetime import datetime, timedelta
 
         # Build WHERE conditions
@@ -797,35 +940,48 @@ class JobStorage:
             conditions.append("source = ?")
             params.append(source)
 
+        if exclude_tracked:
+            conditions.append(
+                "NOT EXISTS (SELECT 1 FROM processed_jobs p WHERE p.job_url = jobs.job_url)"
+            )
+
+        # Conditions so far select the candidate pool (used for stats)
+        base_where = " AND ".join(conditions)
+        base_params = tuple(params)
+
+        # Content filters depend only on the row itself, so their verdicts can be cached
+        content_conditions = []
+        content_params = []
+
         # Title keyword filter (OR logic - any keyword matches)
         if title_keywords:
             keyword_conditions = []
             for keyword in title_keywords:
                 keyword_conditions.append("LOWER(title) LIKE ?")
-                params.append(f"%{keyword.lower()}%")
+                content_params.append(f"%{keyword.lower()}%")
             if keyword_conditions:
-                conditions.append(f"({' OR '.join(keyword_conditions)})")
+                content_conditions.append(f"({' OR '.join(keyword_conditions)})")
 
         # Title exclude filter (AND logic - none of these keywords)
         if title_exclude_keywords:
             for keyword in title_exclude_keywords:
-                conditions.append("LOWER(title) NOT LIKE ?")
-                params.append(f"%{keyword.lower()}%")
+                content_conditions.append("LOWER(title) NOT LIKE ?")
+                content_params.append(f"%{keyword.lower()}%")
 
         # Salary filter - reject if job's max salary is below our minimum
         if min_salary:
             # Only filter if salary_max is provided AND it's below our minimum
-            conditions.append("(salary_max IS NULL OR salary_max >= ?)")
-            params.append(min_salary)
+            content_conditions.append("(salary_max IS NULL OR salary_max >= ?)")
+            content_params.append(min_salary)
 
         # Salary filter - reject if job's min salary is above our maximum
         if max_salary:
-            conditions.append("(salary_min IS NULL OR salary_min <= ?)")
-            params.append(max_salary)
+            content_conditions.append("(salary_min IS NULL OR salary_min <= ?)")
+            content_params.append(max_salary)
 
         # Remote filter
         if remote_only:
-            conditions.append("(remote = TRUE OR LOWER(location) LIKE '%remote%')")
+            content_conditions.append("(remote = TRUE OR LOWER(location) LIKE '%remote%')")
 
         # Job type filter
         if job_types:
@@ -834,50 +990,124 @@ class JobStorage:
                 # Normalize: remove hyphens and spaces for matching
                 normalized = jtype.lower().replace("-", "").replace(" ", "")
                 type_conditions.append("LOWER(REPLACE(REPLACE(job_type, '-', ''), ' ', '')) = ?")
-                params.append(normalized)
+                content_params.append(normalized)
             if type_conditions:
                 # Also allow NULL job_type (don't exclude jobs without type info)
-                conditions.append(f"(job_type IS NULL OR {' OR '.join(type_conditions)})")
+                content_conditions.append(f"(job_type IS NULL OR {' OR '.join(type_conditions)})")
 
         # Location filter (only applies to non-remote jobs)
         if locations and not remote_only:
             location_conditions = ["remote = TRUE"]  # Remote jobs always pass
             for loc in locations:
                 location_conditions.append("LOWER(location) LIKE ?")
-                params.append(f"%{loc.lower()}%")
-            conditions.append(f"({' OR '.join(location_conditions)})")
+                content_params.append(f"%{loc.lower()}%")
+            content_conditions.append(f"({' OR '.join(location_conditions)})")
+
+        if content_conditions:
+            content_where = " AND ".join(content_conditions)
+            watermark = None
+            if filter_cache:
+                fingerprint = self._filter_fingerprint(source, content_where, content_params)
+                watermark = self.materialize_filtered_view(source, fingerprint, content_where, tuple(content_params))
+
+            if watermark is not None:
+                # Cached verdicts up to the watermark, full filter for anything newer
+                conditions.append(
+                    "((last_seen <= ? AND job_url IN "
+                    "(SELECT job_url FROM filtered_job_cache WHERE fingerprint = ?)) "
+                    f"OR ((last_seen IS NULL OR last_seen > ?) AND {content_where}))"
+                )
+                params.extend([watermark, fingerprint, watermark])
+            else:
+                conditions.append(content_where)
+            params.extend(content_params)
 
-        # Job age filter
+        # Job age filter (relative to today, so never cached)
         if max_job_age_days:
             cutoff_date = (datetime.now() - timedelta(days=max_job_age_days)).strftime('%Y-%m-%d')
             # Only filter if date_posted is provided AND it's older than cutoff
             conditions.append("(date_posted IS NULL OR date_posted >= ?)")
             params.append(cutoff_date)
 
-        # Get total count before filtering (for stats)
-        count_query = f"SELECT COUNT(*) FROM jobs WHERE source = ? AND match_score IS NULL" if source else "SELECT COUNT(*) FROM jobs WHERE match_score IS NULL"
-        count_params = (source,) if source else ()
-        total_before = self.db.fetchone(count_query, count_params)[0]
+        return " AND ".join(conditions), tuple(params), base_where, base_params
 
-        # Build final query
-        where_clause = " AND ".join(conditions)
-        query = f"SELECT * FROM jobs WHERE {where_clause} ORDER BY first_seen DESC"
+    @staticmethod
+    def _filter_fingerprint(source: Optional[str], content_where: str, content_params: List[Any]) -> str:
+        """Stable identifier for a set of content filters (same SQL + params = same fingerprint)"""
+        canonical = json.dumps([source, content_where, content_params], default=str)
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
 
-        df = self.db.fetchdf(query, tuple(params))
+    def materialize_filtered_view(
+        self,
+        source: Optional[str],
+        fingerprint: str,
+        content_where: str,
+        content_params: tuple,
+    ) -> Optional[datetime]:
+        """
+        Bring the cached filter verdicts for a fingerprint up to date
 
-        # Calculate stats
-        total_after = len(df) if not df.empty else 0
-        stats = {
-            "total_jobs": total_before,
-            "passed_jobs": total_after,
-            "rejected_jobs": total_before - total_after,
-            "pass_rate": total_after / total_before if total_before > 0 else 0,
-        }
+        filtered_job_cache holds the URLs of jobs that passed the content
+        filters, for every job with last_seen at or before the fingerprint's
+        watermark. Each call only runs the filter over jobs seen after the
+        previous watermark (new or re-imported rows, since upserts bump
+        last_seen) and then advances the watermark.
 
-        if df.empty:
-            return None, stats
+        Args:
+            source: Optional source filter
+            fingerprint: Identifier of the filter set (see _filter_fingerprint)
+            content_where: SQL for the content filters
+            content_params: Parameters for content_where
 
-        return df, stats
+        Returns:
+            New watermark, or None if there is nothing cached (or the update failed)
+        """
+        source_condition = " AND source = ?" if source else ""
+        source_params = (source,) if source else ()
+
+        try:
+            with self.db.batch_context() as batch:
+                row = batch.fetchone(
+                    "SELECT watermark FROM filtered_job_watermarks WHERE fingerprint = ?",
+                    (fingerprint,)
+                )
+                previous = row[0] if row else None
+                latest = batch.fetchone(
+                    f"SELECT MAX(last_seen) FROM jobs WHERE TRUE{source_condition}",
+                    source_params
+                )[0]
+
+                if latest is None:
+                    return None
+                if previous is not None and latest <= previous:
+                    return previous
+
+                # Rows to (re-)evaluate: seen after the previous watermark, up to the new one
+                delta_where = f"last_seen <= ?{source_condition}"
+                delta_params = (latest,) + source_params
+                if previous is not None:
+                    delta_where += " AND last_seen > ?"
+                    delta_params += (previous,)
+
+                batch.execute(
+                    f"""DELETE FROM filtered_job_cache WHERE fingerprint = ?
+                        AND job_url IN (SELECT job_url FROM jobs WHERE {delta_where})""",
+                    (fingerprint,) + delta_params
+                )
+                batch.execute(
+                    f"""INSERT OR IGNORE INTO filtered_job_cache (fingerprint, job_url)
+                        SELECT ?, job_url FROM jobs WHERE {delta_where} AND {content_where}""",
+                    (fingerprint,) + delta_params + content_params
+                )
+                # Advance the watermark last, so a failed run just re-evaluates the same delta
+                batch.execute(
+                    "INSERT OR REPLACE INTO filtered_job_watermarks (fingerprint, watermark) VALUES (?, ?)",
+                    (fingerprint, latest)
+                )
+                return latest
+        except Exception as e:
+            print(f"[WARNING] Filter cache update failed, filtering all rows: {e}")
+            return None
 
     def load_matched_jobs(
         self,
@@ -914,6 +1144,59 @@ class JobStorage:
 
         return df
 
+    def load_matched_job_records(
+        self,
+        source: Optional[str] = None,
+        min_score: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Load jobs that have been scored and meet threshold, as JSON-friendly dicts
+
+        Timestamps are formatted as ISO strings and NULL lists become [] inside
+        the query, so no DataFrame is built and no per-row conversion is needed.
+
+        Args:
+            source: Optional source filter
+            min_score: Minimum match score (default: 0.0)
+
+        Returns:
+            List of job dicts ordered by match score (empty if none)
+        """
+        where = "match_score IS NOT NULL AND match_score >= ?"
+        params: List[Any] = [min_score]
+        if source:
+            where = "source = ? AND " + where
+            params.insert(0, source)
+
+        return self.db.fetch_records(
+            f"SELECT {self._json_record_select()} FROM jobs WHERE {where} ORDER BY match_score DESC",
+            tuple(params)
+        )
+
+    def _json_record_select(self) -> str:
+        """
+        Select list for the jobs table that yields JSON-friendly values (built once)
+
+        Returns:
+            "*" with REPLACE clauses for timestamp (ISO string) and list (NULL -> []) columns
+        """
+        if self._record_select is None:
+            columns = self.db.fetchall(
+                """SELECT column_name, data_type FROM information_schema.columns
+                   WHERE table_name = 'jobs' AND (data_type LIKE 'TIMESTAMP%' OR data_type LIKE '%[]')"""
+            )
+            replacements = []
+            for name, data_type in columns:
+                if data_type.endswith("[]"):
+                    replacements.append(f"coalesce({name}, []) AS {name}")
+                else:
+                    # Same format as datetime.isoformat()
+                    replacements.append(
+                        f"regexp_replace(strftime({name}, '%Y-%m-%dT%H:%M:%S.%f'), '\\.000000$', '') AS {name}"
+                    )
+            self._record_select = f"* REPLACE ({', '.join(replacements)})" if replacements else "*"
+        return self._record_select
+
     def update_match_results(
         self,
         job_url: str,
@@ -958,18 +1241,18 @@ class JobStorage:
 
     def update_match_results_batch(
         self,
-        jobs: List[Dict[str, Any]],
+        jobs: Union[List[Dict[str, Any]], pd.DataFrame],
         force_upsert: bool = True,
     ) -> Dict[str, int]:
         """
         Batch update match results for multiple jobs.
 
-        This method reduces database lock contention by checking for existing
-        jobs once and performing updates in sequence. If batch operations fail,
-        records are saved to pending files for later retry.
+        The rows are registered as a DataFrame view and applied with a single
+        UPDATE ... FROM statement. If the batch update fails, records are saved
+        to pending files for later retry.
 
         Args:
-            jobs: List of job dicts with keys:
+            jobs: List of job dicts (or a DataFrame with these columns):
                 - job_url: The job URL (required)
                 - match_score: Match score (0-100)
                 - match_explanation: Explanation of the match
@@ -981,72 +1264,58 @@ class JobStorage:
         Returns:
             Dict with counts: {"updated": N, "failed": M, "not_found": K}
         """
-        if not jobs:
+        if jobs is None or len(jobs) == 0:
             return {"updated": 0, "failed": 0, "not_found": 0}
 
         from src.core.pending_writes import get_pending_manager
 
-        updated = 0
-        failed = 0
-        not_found = 0
-        failed_jobs = []
+        columns = ["job_url", "match_score", "match_explanation", "is_relevant", "gap_analysis", "resume_suggestions"]
+        if isinstance(jobs, pd.DataFrame):
+            updates = jobs.reindex(columns=columns)
+        else:
+            updates = pd.DataFrame.from_records(jobs, columns=columns)
+        updates = updates.astype(object).where(updates.notna(), None)
 
-        try:
-            for job in jobs:
-                job_url = job.get("job_url")
-                if not job_url:
-                    failed += 1
-                    continue
-
-                try:
-                    # Use RETURNING to verify the update actually matched a row
-                    result = self.db.fetchone("""
-                        UPDATE jobs SET
-                            match_score = ?,
-                            match_explanation = ?,
-                            is_relevant = ?,
-                            gap_analysis = ?,
-                            resume_suggestions = ?
-                        WHERE job_url = ?
-                        RETURNING job_url
-                    """, (
-                        job.get("match_score"),
-                        job.get("match_explanation"),
-                        job.get("is_relevant"),
-                        job.get("gap_analysis"),
-                        job.get("resume_suggestions"),
-                        job_url,
-                    ))
-
-                    if result:
-                        updated += 1
-                    else:
-                        # UPDATE didn't match any rows - job doesn't exist in DB
-                        print(f"[WARNING] Job not found in database for update: {job_url[:80]}...")
-                        not_found += 1
-                        failed_jobs.append(job)
-
-                except Exception as e:
-                    print(f"[WARNING] Failed to update match results for {job_url}: {e}")
-                    failed += 1
-                    failed_jobs.append(job)
-
-            # Save failed jobs to pending if any
-            if failed_jobs:
-                pending_manager = get_pending_manager()
-                pending_manager.save_pending(failed_jobs, "update_match_results")
-
-            if not_found > 0:
-                print(f"[WARNING] {not_found} jobs were not found in database - they may have been deleted or from a different source")
-
-            return {"updated": updated, "failed": failed, "not_found": not_found}
+        # Rows without a URL can't be matched
+        has_url = updates["job_url"].map(bool)
+        failed = int((~has_url).sum())
+        # Later rows win for duplicate URLs (same as applying updates in order)
+        updates = updates[has_url].drop_duplicates(subset="job_url", keep="last")
 
+        try:
+            with self.db.batch_context() as batch:
+                batch.register("_match_updates", updates)
+                rows = batch.fetchall("""
+                    UPDATE jobs SET
+                        match_score = u.match_score,
+                        match_explanation = u.match_explanation,
+                        is_relevant = u.is_relevant,
+                        gap_analysis = u.gap_analysis,
+                        resume_suggestions = u.resume_suggestions
+                    FROM _match_updates u
+                    WHERE jobs.job_url = u.job_url
+                    RETURNING jobs.job_url
+                """)
         except Exception as e:
             print(f"[ERROR] Batch update match results failed: {e}")
-            # Fallback: save all remaining jobs to pending
+            # Fallback: save all jobs to pending
+            pending_manager = get_pending_manager()
+            pending_manager.save_pending(updates.to_dict("records"), "update_match_results")
+            return {"updated": 0, "failed": len(updates) + failed, "not_found": 0, "error": str(e)}
+
+        updated_urls = {row[0] for row in rows}
+        missing = updates[~updates["job_url"].isin(updated_urls)]
+        not_found = len(missing)
+
+        # Save jobs that didn't match a row to pending
+        if not_found > 0:
+            for job_url in missing["job_url"].head(5):
+                print(f"[WARNING] Job not found in database for update: {job_url[:80]}...")
             pending_manager = get_pending_manager()
-            pending_manager.save_pending(jobs, "update_match_results")
-            return {"updated": updated, "failed": len(jobs) - updated, "not_found": not_found, "error": str(e)}
+            pending_manager.save_pending(missing.to_dict("records"), "update_match_results")
+            print(f"[WARNING] {not_found} jobs were not found in database - they may have been deleted or from a different source")
+
+        return {"updated": len(updated_urls), "failed": failed, "not_found": not_found}
 
     def get_job(self, job_url: str) -> Optional[Dict[str, Any]]:
         """
@@ -1088,6 +1357,16 @@ class JobStorage:
 
         return result[0] if result else 0
 
+    def get_job_counts_by_source(self) -> Dict[str, int]:
+        """
+        Get count of jobs in database for every source in one query
+
+        Returns:
+            Dict mapping source to number of jobs (sources without jobs are absent)
+        """
+        rows = self.db.fetchall("SELECT source, COUNT(*) FROM jobs GROUP BY source")
+        return {source: count for source, count in rows}
+
     def get_stats(self, source: Optional[str] = None) -> Dict[str, Any]:
         """
         Get statistics about stored jobs
@@ -1101,40 +1380,21 @@ class JobStorage:
         where_clause = "WHERE source = ?" if source else ""
         params = (source,) if source else ()
 
-        # Total jobs
-        total = self.db.fetchone(
-            f"SELECT COUNT(*) FROM jobs {where_clause}",
-            params
-        )[0]
-
-        # Scored jobs
-        scored = self.db.fetchone(
-            f"SELECT COUNT(*) FROM jobs {where_clause} {'AND' if source else 'WHERE'} match_score IS NOT NULL",
-            params
-        )[0]
-
-        # Average score
-        avg_result = self.db.fetchone(
-            f"SELECT AVG(match_score) FROM jobs {where_clause} {'AND' if source else 'WHERE'} match_score IS NOT NULL",
+        # All counts and the score distribution in one aggregate query
+        total, scored, avg_score, high, medium, low = self.db.fetchone(
+            f"""
+            SELECT
+                COUNT(*),
+                COUNT(match_score),
+                AVG(match_score),
+                COUNT(*) FILTER (WHERE match_score >= 80),
+                COUNT(*) FILTER (WHERE match_score >= 60 AND match_score < 80),
+                COUNT(*) FILTER (WHERE match_score < 60)
+            FROM jobs {where_clause}
+            """,
             params
         )
-        avg_score = avg_result[0] if avg_result and avg_result[0] else 0
-
-        # Score distribution
-        high = self.db.fetchone(
-            f"SELECT COUNT(*) FROM jobs {where_clause} {'AND' if source else 'WHERE'} match_score >= 80",
-            params
-        )[0]
-
-        medium = self.db.fetchone(
-            f"SELECT COUNT(*) FROM jobs {where_clause} {'AND' if source else 'WHERE'} match_score >= 60 AND match_score < 80",
-            params
-        )[0]
-
-        low = self.db.fetchone(
-            f"SELECT COUNT(*) FROM jobs {where_clause} {'AND' if source else 'WHERE'} match_score < 60 AND match_score IS NOT NULL",
-            params
-        )[0]
+        avg_score = avg_score or 0
 
         return {
             "total_jobs": total,
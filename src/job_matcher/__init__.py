@@ -18,6 +18,8 @@ from .checkpoint_manager import CheckpointManager
 from .email_service import EmailService
 from .failure_tracker import FailureTracker, ErrorType
 from .smooth_batch_processor import SmoothBatchProcessor
+from .response_cache import ResponseCache
+from .semantic_cache import SemanticCache
 
 __all__ = [
     "JobTracker",
@@ -32,4 +34,6 @@ __all__ = [
     "FailureTracker",
     "ErrorType",
     "SmoothBatchProcessor",
+    "ResponseCache",
+    "SemanticCache",
 ]
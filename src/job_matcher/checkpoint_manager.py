@@ -38,6 +38,7 @@ class CheckpointManager:
         self.paths = ProfilePaths(profile_name)
         self.checkpoint_data = None
         self._checkpoint_source = None
+        self._checkpoint_updated_at = None
         self._lock = threading.Lock()
 
     def has_checkpoint(self, input_file: str) -> bool:
@@ -77,12 +78,14 @@ class CheckpointManager:
             return None
 
         self._checkpoint_source = result[0]  # Use source as the key
+        self._checkpoint_updated_at = result[6] or result[5]
 
         # Parse stored JSON data
         try:
             processed_urls_data = json.loads(result[3]) if result[3] else {}
             matched_jobs_data = json.loads(result[4]) if result[4] else {}
-        except json.JSONDecodeError:
+        except json.JSONDecodeError as e:
+            print(f"[WARNING] Checkpoint for {input_file} has unreadable stage data, ignoring it: {e}")
             processed_urls_data = {}
             matched_jobs_data = {}
 
@@ -172,6 +175,7 @@ class CheckpointManager:
 
         # Store the source as our checkpoint key
         self._checkpoint_source = input_file
+        self._checkpoint_updated_at = now
 
         return self.checkpoint_data
 
@@ -206,6 +210,7 @@ class CheckpointManager:
             now,
             self._checkpoint_source
         ))
+        self._checkpoint_updated_at = now
 
     def mark_job_completed(self, stage: str, job_url: str):
         """
@@ -254,6 +259,30 @@ class CheckpointManager:
 
             self._save()
 
+    def mark_stages_completed(self, stages: List[str], matched_count: Optional[int] = None):
+        """
+        Mark several pipeline stages as completed in a single checkpoint write (thread-safe)
+
+        Args:
+            stages: Pipeline stages (scoring, analysis, optimization)
+            matched_count: Optional count of matched jobs (recorded on the scoring stage)
+        """
+        if not self.checkpoint_data:
+            return
+
+        with self._lock:
+            for stage in stages:
+                if stage not in self.checkpoint_data["stages"]:
+                    print(f"[WARNING] Invalid stage: {stage}")
+                    return
+
+            for stage in stages:
+                self.checkpoint_data["stages"][stage]["completed"] = True
+            if matched_count is not None and "scoring" in stages:
+                self.checkpoint_data["stages"]["scoring"]["matched_count"] = matched_count
+
+            self._save()
+
     def update_output_file(self, file_type: str, file_path: str):
         """
         Update output file path in checkpoint (thread-safe)
@@ -420,6 +449,18 @@ class CheckpointManager:
 
         self.checkpoint_data = None
         self._checkpoint_source = None
+        self._checkpoint_updated_at = None
+
+    def get_age_hours(self) -> Optional[float]:
+        """
+        Get hours since the loaded checkpoint last recorded progress
+
+        Returns:
+            Age in hours, or None if no checkpoint is loaded
+        """
+        if not isinstance(self._checkpoint_updated_at, datetime):
+            return None
+        return (datetime.now() - self._checkpoint_updated_at).total_seconds() / 3600
 
     def get_summary(self) -> str:
         """
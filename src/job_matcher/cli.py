@@ -13,6 +13,7 @@ import click
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.profile_manager import ProfilePaths
+from src.utils.fast_json import load_json_file
 from src.cli.utils import (
     print_header,
     print_section,
@@ -249,7 +250,7 @@ def score_jobs(input_file, source, min_score, no_skip):
         pipeline.analyzer.load_all()
 
         # Load and filter jobs
-        jobs = pipeline.load_jobs(input_file)
+        jobs = pipeline.load_jobs(input_file, skip_processed=not no_skip)
 
         if not no_skip:
             jobs = pipeline.filter_unprocessed_jobs(jobs)
@@ -466,8 +467,8 @@ def reprocess_date_range(from_date, to_date, sources, dry_run, min_score, yes):
 
             if source_name:
                 if source_name not in jobs_by_source:
-                    jobs_by_source[source_name] = []
-                jobs_by_source[source_name].append(url)
+                    jobs_by_source[source_name] = set()
+                jobs_by_source[source_name].add(url)
 
         # Import JobMatcherPipeline
         import importlib.util
@@ -491,12 +492,12 @@ def reprocess_date_range(from_date, to_date, sources, dry_run, min_score, yes):
                 print_error(f"Source file not found: {source_file}")
                 continue
 
-            # Load all jobs from source
-            with open(source_file, "r", encoding="utf-8") as f:
-                all_jobs = json.load(f)
-
-            # Filter to only jobs we want to reprocess
-            jobs_to_run = [job for job in all_jobs if job.get("job_url") in url_list]
+            # Load source file and keep only the jobs we want to reprocess,
+            # dropping the full list before the pipeline runs
+            jobs_to_run = [
+                job for job in load_json_file(source_file)
+                if job.get("job_url") in url_list
+            ]
 
             print_info(f"Loaded {len(jobs_to_run)} jobs from {source_file}")
 
@@ -878,9 +879,9 @@ def retry_failed_jobs(stage, temp, tokens, min_score):
                 print_info(f"Saved to: {output_file}")
 
                 # Mark successful as resolved
-                for job in matched_jobs:
-                    if job.get("match_score", 0) > 0:
-                        pipeline.failure_tracker.mark_resolved(job.get("job_url"), stage)
+                pipeline.failure_tracker.mark_resolved_bulk(
+                    [job.get("job_url") for job in matched_jobs if job.get("match_score", 0) > 0], stage
+                )
 
         elif stage == "analysis":
             analyzed_jobs = pipeline.run_analysis_pass(jobs_to_retry)
@@ -890,8 +891,7 @@ def retry_failed_jobs(stage, temp, tokens, min_score):
                 print_info(f"Saved to: {output_file}")
 
                 # Mark all as resolved (analysis doesn't fail on content)
-                for job in analyzed_jobs:
-                    pipeline.failure_tracker.mark_resolved(job.get("job_url"), stage)
+                pipeline.failure_tracker.mark_resolved_bulk([job.get("job_url") for job in analyzed_jobs], stage)
 
         elif stage == "optimization":
             optimized_jobs = pipeline.run_optimization_pass(jobs_to_retry)
@@ -901,8 +901,7 @@ def retry_failed_jobs(stage, temp, tokens, min_score):
                 print_info(f"Saved to: {output_file}")
 
                 # Mark all as resolved
-                for job in optimized_jobs:
-                    pipeline.failure_tracker.mark_resolved(job.get("job_url"), stage)
+                pipeline.failure_tracker.mark_resolved_bulk([job.get("job_url") for job in optimized_jobs], stage)
 
         # Restore original environment variables
         if temp and original_temp:
@@ -306,15 +306,13 @@ def send_email(report_file, recipient, subject):
             print_info(f"  Reports attached: {len(report_paths)}")
 
             # Send multi-source email to all recipients
-            success_count = 0
-            for rec in recipients:
-                if service.send_multi_source_report(
-                    recipient=rec,
-                    jobs_by_source=jobs_by_source,
-                    report_paths=report_paths,
-                    subject_prefix=subject_prefix,
-                ):
-                    success_count += 1
+            results = service.send_multi_source_report_to_recipients(
+                recipients=recipients,
+                jobs_by_source=jobs_by_source,
+                report_paths=report_paths,
+                subject_prefix=subject_prefix,
+            )
+            success_count = sum(results.values())
 
             if success_count > 0:
                 print_success(f"\nEmail sent successfully to {success_count} recipient(s)")
@@ -370,15 +368,13 @@ def send_email(report_file, recipient, subject):
                 jobs = []
 
             # Send to all recipients
-            success_count = 0
-            for rec in recipients:
-                if service.send_report(
-                    recipient=rec,
-                    jobs=jobs,
-                    report_path=report_file,
-                    subject_prefix=subject_prefix,
-                ):
-                    success_count += 1
+            results = service.send_report_to_recipients(
+                recipients=recipients,
+                jobs=jobs,
+                report_path=report_file,
+                subject_prefix=subject_prefix,
+            )
+            success_count = sum(results.values())
 
             if success_count > 0:
                 print_success(f"Email sent successfully to {success_count} recipient(s)")
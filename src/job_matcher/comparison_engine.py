@@ -8,6 +8,10 @@ more accurate and explainable job matching.
 from typing import Dict, Any, List, Tuple, Optional
 from .models.job_sections import extract_job_sections, JobComparison
 
+# Title words that modify a role without saying what the role is
+SENIORITY_KEYWORDS = frozenset({'senior', 'staff', 'lead', 'principal', 'junior', 'associate', 'head', 'director', 'manager', 'vp'})
+GENERIC_ROLE_WORDS = frozenset({'engineer', 'developer', 'architect', 'analyst', 'scientist'})
+
 
 class ComparisonEngine:
     """Hybrid scoring engine combining deterministic and AI-based scores"""
@@ -23,6 +27,49 @@ class ComparisonEngine:
         self.requirements = candidate_requirements if candidate_requirements is not None else {}
         self.preferences = preferences if preferences is not None else {}
 
+        # (requirements key, keyword sets) derived from the requirements, rebuilt only when they change.
+        # Replaced in one assignment so threads never see a key paired with another key's sets.
+        self._title_keywords: Optional[Tuple[tuple, Tuple[List[str], frozenset, frozenset]]] = None
+
+    def _get_title_keywords(self) -> Tuple[List[str], frozenset, frozenset]:
+        """
+        Lowercased target roles plus the domain and generic keywords derived from them
+
+        Returns:
+            (target roles, domain keywords, generic keywords)
+        """
+        target_roles = self.requirements.get('target_roles', [])
+        related_keywords = self.requirements.get('related_keywords', [])
+        key = (tuple(target_roles), tuple(related_keywords))
+        cached = self._title_keywords
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # Extract domain-specific keywords (the core of what the role is about)
+        # These are critical - without them, the title is too ambiguous
+        domain_keywords = set()
+        generic_keywords = set()
+
+        for role in target_roles:
+            words = role.lower().split()
+            for word in words:
+                if word in SENIORITY_KEYWORDS:
+                    continue  # Skip seniority modifiers
+                elif word in GENERIC_ROLE_WORDS:
+                    generic_keywords.add(word)  # Generic role words
+                else:
+                    domain_keywords.add(word)  # Domain-specific (e.g., "data", "platform", "infrastructure")
+
+        # Add related keywords as domain keywords
+        for kw in related_keywords:
+            kw_lower = kw.lower()
+            if kw_lower not in SENIORITY_KEYWORDS and kw_lower not in generic_keywords:
+                domain_keywords.add(kw_lower)
+
+        keywords = ([role.lower() for role in target_roles], frozenset(domain_keywords), frozenset(generic_keywords))
+        self._title_keywords = (key, keywords)
+        return keywords
+
     def calculate_deterministic_score(self, job: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calculate deterministic score (0-40 points) based on hard requirements
@@ -75,41 +122,17 @@ class ComparisonEngine:
         title_lower = job.title.job_title.lower()
 
         # Get target roles and keywords
-        target_roles = self.requirements.get('target_roles', [])
-        related_keywords = self.requirements.get('related_keywords', [])
+        target_roles, domain_keywords, generic_keywords = self._get_title_keywords()
 
         # Check for exact role match first (highest score)
-        for role in target_roles:
-            role_lower = role.lower()
+        for role_lower in target_roles:
             if role_lower in title_lower or title_lower in role_lower:
                 return 20.0  # Exact match
 
-        # Extract domain-specific keywords (the core of what the role is about)
-        # These are critical - without them, the title is too ambiguous
-        domain_keywords = set()
-        generic_keywords = set()
-        seniority_keywords = {'senior', 'staff', 'lead', 'principal', 'junior', 'associate', 'head', 'director', 'manager', 'vp'}
-
-        for role in target_roles:
-            words = role.lower().split()
-            for word in words:
-                if word in seniority_keywords:
-                    continue  # Skip seniority modifiers
-                elif word in {'engineer', 'developer', 'architect', 'analyst', 'scientist'}:
-                    generic_keywords.add(word)  # Generic role words
-                else:
-                    domain_keywords.add(word)  # Domain-specific (e.g., "data", "platform", "infrastructure")
-
-        # Add related keywords as domain keywords
-        for kw in related_keywords:
-            kw_lower = kw.lower()
-            if kw_lower not in seniority_keywords and kw_lower not in generic_keywords:
-                domain_keywords.add(kw_lower)
-
         # Count matches
         domain_matches = sum(1 for kw in domain_keywords if kw in title_lower)
         generic_matches = sum(1 for kw in generic_keywords if kw in title_lower)
-        seniority_matches = sum(1 for kw in seniority_keywords if kw in title_lower)
+        seniority_matches = sum(1 for kw in SENIORITY_KEYWORDS if kw in title_lower)
 
         # Scoring logic - domain keywords are critical
         if domain_matches >= 2:
@@ -9,6 +9,9 @@ import sys
 import base64
 import json
 import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from email.mime.text import MIMEText
@@ -23,12 +26,17 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+import google_auth_httplib2
+import httplib2
 
 # Add parent directory to path for profile_manager import
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.profile_manager import ProfileManager
 
+# Stands in for the report filename in a body built before the report exists
+_REPORT_FILENAME_PLACEHOLDER = "\x00report_filename\x00"
+
 
 class EmailService:
     """Gmail API email service for sending job match reports"""
@@ -36,6 +44,10 @@ class EmailService:
     # Gmail API scope for sending emails
     SCOPES = ["https://www.googleapis.com/auth/gmail.send"]
 
+    # Transient Gmail API statuses worth retrying, and how many attempts to make
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    SEND_ATTEMPTS = 3
+
     def __init__(
         self,
         credentials_dir: str = "credentials",
@@ -61,8 +73,14 @@ class EmailService:
         self.credentials_dir.mkdir(parents=True, exist_ok=True)
 
         self.service = None
+        self._credentials = None
         self._initialize_service()
 
+        # Concurrent sends to multiple recipients (each worker thread gets its own HTTP connection)
+        self.max_workers = max(1, int(os.getenv("EMAIL_MAX_WORKERS", "4")))
+        self._thread_local = threading.local()
+        self._message_lock = threading.Lock()
+
         # Load profile-specific email config with fallback to global .env
         self._load_email_config()
 
@@ -109,6 +127,7 @@ class EmailService:
                     token.write(creds.to_json())
 
             # Build Gmail service
+            self._credentials = creds
             self.service = build("gmail", "v1", credentials=creds)
             return True
 
@@ -193,35 +212,36 @@ class EmailService:
             print("[WARNING] No email recipients configured")
             return False
 
-        success_count = 0
-        for recipient in self.recipients:
-            if self.send_report(recipient, jobs, report_path, self.subject_prefix):
-                success_count += 1
+        results = self.send_report_to_recipients(self.recipients, jobs, report_path, self.subject_prefix)
+        return any(results.values())
 
-        return success_count > 0
-
-    def send_report(
+    def send_report_to_recipients(
         self,
-        recipient: str,
+        recipients: List[str],
         jobs: List[Dict[str, Any]],
         report_path: str,
         subject_prefix: Optional[str] = None,
-    ) -> bool:
+        body_html: Optional[str] = None,
+    ) -> Dict[str, bool]:
         """
-        Send job match report via email
+        Send the same job match report to several recipients
+
+        The subject, body and attachments are built once; only the "to"
+        header changes between sends.
 
         Args:
-            recipient: Email address to send report to
+            recipients: Email addresses to send the report to
             jobs: List of matched jobs
             report_path: Path to HTML report file
             subject_prefix: Prefix for email subject (default: from profile/global config)
+            body_html: Body from build_report_body() (default: built here)
 
         Returns:
-            True if email sent successfully, False otherwise
+            Dict mapping each recipient to whether the email was sent
         """
         if not self.service:
             print("[WARNING] Email service not configured. Skipping email delivery.")
-            return False
+            return {recipient: False for recipient in recipients}
 
         # Use configured subject prefix if not provided
         if subject_prefix is None:
@@ -230,17 +250,106 @@ class EmailService:
         try:
             # Generate email content
             subject = self._generate_subject(jobs, subject_prefix)
-            body_html = self._generate_email_body(jobs, report_path)
+            if body_html is None:
+                body_html = self.build_report_body(jobs)
+            body_html = body_html.replace(_REPORT_FILENAME_PLACEHOLDER, Path(report_path).name)
+            message = self._build_report_message(subject, body_html, [report_path])
+        except Exception as e:
+            print(f"[ERROR] Unexpected error building email: {e}")
+            return {recipient: False for recipient in recipients}
 
-            # Create email message
-            message = self._create_message_with_attachment(
-                recipient, subject, body_html, report_path
-            )
+        return self._send_to_recipients(recipients, message)
 
-            # Send email
-            self.service.users().messages().send(
-                userId="me", body=message
-            ).execute()
+    def send_report(
+        self,
+        recipient: str,
+        jobs: List[Dict[str, Any]],
+        report_path: str,
+        subject_prefix: Optional[str] = None,
+    ) -> bool:
+        """
+        Send job match report via email
+
+        Args:
+            recipient: Email address to send report to
+            jobs: List of matched jobs
+            report_path: Path to HTML report file
+            subject_prefix: Prefix for email subject (default: from profile/global config)
+
+        Returns:
+            True if email sent successfully, False otherwise
+        """
+        return self.send_report_to_recipients([recipient], jobs, report_path, subject_prefix)[recipient]
+
+    def _send_to_recipients(self, recipients: List[str], message: MIMEMultipart) -> Dict[str, bool]:
+        """
+        Send a prepared message to each recipient, concurrently when there are several
+
+        Args:
+            recipients: Email addresses to send to
+            message: Message built by _build_report_message
+
+        Returns:
+            Dict mapping each recipient to whether the email was sent
+        """
+        workers = min(len(recipients), self.max_workers)
+        if workers <= 1:
+            return {recipient: self._send_message(recipient, message) for recipient in recipients}
+
+        def send(recipient: str) -> bool:
+            return self._send_message(recipient, message, http=self._thread_http())
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(recipients, executor.map(send, recipients)))
+
+    def _thread_http(self) -> Optional[google_auth_httplib2.AuthorizedHttp]:
+        """Authorized HTTP connection for the current thread (httplib2 is not thread-safe)"""
+        if self._credentials is None:
+            return None
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+
+    def _send_message(
+        self,
+        recipient: str,
+        message: MIMEMultipart,
+        http: Optional[google_auth_httplib2.AuthorizedHttp] = None,
+    ) -> bool:
+        """
+        Address a prepared message to one recipient and send it
+
+        Transient Gmail API errors (rate limits, 5xx) are retried with
+        exponential backoff.
+
+        Args:
+            recipient: Email address to send to
+            message: Message built by _build_report_message
+            http: Connection to send on (default: the service's own)
+
+        Returns:
+            True if email sent successfully, False otherwise
+        """
+        try:
+            # The message is shared between worker threads; only addressing + encoding is serialized
+            with self._message_lock:
+                del message["to"]
+                message["to"] = recipient
+                raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
+
+            for attempt in range(1, self.SEND_ATTEMPTS + 1):
+                try:
+                    # Send email
+                    self.service.users().messages().send(
+                        userId="me", body={"raw": raw}
+                    ).execute(http=http)
+                    break
+                except HttpError as e:
+                    if e.resp.status not in self.RETRY_STATUSES or attempt == self.SEND_ATTEMPTS:
+                        raise
+                    time.sleep(2 ** (attempt - 1))
 
             print(f"Email sent to {recipient}")
             return True
@@ -271,34 +380,43 @@ class EmailService:
         Returns:
             True if email sent successfully, False otherwise
         """
+        return self.send_multi_source_report_to_recipients(
+            [recipient], jobs_by_source, report_paths, subject_prefix
+        )[recipient]
+
+    def send_multi_source_report_to_recipients(
+        self,
+        recipients: List[str],
+        jobs_by_source: List[Tuple[str, List[Dict[str, Any]]]],
+        report_paths: List[str],
+        subject_prefix: str = "[Job Matcher]",
+    ) -> Dict[str, bool]:
+        """
+        Send the same multi-source job match report to several recipients
+
+        Args:
+            recipients: Email addresses to send the report to
+            jobs_by_source: List of (source, jobs) tuples
+            report_paths: List of paths to HTML report files
+            subject_prefix: Prefix for email subject
+
+        Returns:
+            Dict mapping each recipient to whether the email was sent
+        """
         if not self.service:
             print("[WARNING] Email service not configured. Skipping email delivery.")
-            return False
+            return {recipient: False for recipient in recipients}
 
         try:
             # Generate email content
             subject = self._generate_multi_source_subject(jobs_by_source, subject_prefix)
             body_html = self._generate_multi_source_email_body(jobs_by_source, report_paths)
-
-            # Create email message with multiple attachments
-            message = self._create_message_with_multiple_attachments(
-                recipient, subject, body_html, report_paths
-            )
-
-            # Send email
-            self.service.users().messages().send(
-                userId="me", body=message
-            ).execute()
-
-            print(f"Email sent to {recipient}")
-            return True
-
-        except HttpError as e:
-            print(f"[ERROR] Failed to send email: {e}")
-            return False
+            message = self._build_report_message(subject, body_html, report_paths)
         except Exception as e:
-            print(f"[ERROR] Unexpected error sending email: {e}")
-            return False
+            print(f"[ERROR] Unexpected error building email: {e}")
+            return {recipient: False for recipient in recipients}
+
+        return self._send_to_recipients(recipients, message)
 
     def _generate_subject(
         self, jobs: List[Dict[str, Any]], prefix: str
@@ -358,6 +476,21 @@ class EmailService:
         self, jobs: List[Dict[str, Any]], report_path: str
     ) -> str:
         """Generate HTML email body with summary and top jobs"""
+        return self.build_report_body(jobs).replace(_REPORT_FILENAME_PLACEHOLDER, Path(report_path).name)
+
+    def build_report_body(self, jobs: List[Dict[str, Any]]) -> str:
+        """
+        Build the HTML email body without needing the report file
+
+        Lets callers build the body while the report is still rendering;
+        send_report_to_recipients(body_html=...) fills in the report filename.
+
+        Args:
+            jobs: List of matched jobs
+
+        Returns:
+            HTML email body
+        """
 
         if not jobs:
             return """
@@ -473,7 +606,7 @@ class EmailService:
             """
 
         # Add footer
-        report_filename = Path(report_path).name
+        report_filename = _REPORT_FILENAME_PLACEHOLDER
         html += f"""
                 <div style="background: #fff3cd; border-left: 4px solid #f39c12; padding: 15px; margin: 30px 0;">
                     <p style="margin: 0; font-size: 1em;">
@@ -498,28 +631,25 @@ class EmailService:
 
         return html
 
-    def _create_message_with_attachment(
+    def _build_report_message(
         self,
-        to: str,
         subject: str,
         body_html: str,
-        attachment_path: str,
-    ) -> Dict[str, str]:
+        attachment_paths: List[str],
+    ) -> MIMEMultipart:
         """
-        Create email message with HTML body and attachment
+        Build the report email (HTML body, inline image, attachments) without a recipient
 
         Args:
-            to: Recipient email address
             subject: Email subject
             body_html: HTML email body
-            attachment_path: Path to file to attach
+            attachment_paths: Paths to files to attach
 
         Returns:
-            Gmail API message dict
+            MIME message (set the "to" header before sending)
         """
         # Create multipart message
         message = MIMEMultipart()
-        message["to"] = to
         message["subject"] = subject
 
         # Add HTML body
@@ -534,24 +664,23 @@ class EmailService:
             image_part.add_header("Content-Disposition", "inline", filename=image_filename)
             message.attach(image_part)
 
-        # Add attachment
-        if Path(attachment_path).exists():
-            attachment_filename = Path(attachment_path).name
+        # Add all attachments
+        for attachment_path in attachment_paths:
+            if Path(attachment_path).exists():
+                attachment_filename = Path(attachment_path).name
 
-            with open(attachment_path, "rb") as f:
-                part = MIMEBase("application", "octet-stream")
-                part.set_payload(f.read())
+                with open(attachment_path, "rb") as f:
+                    part = MIMEBase("application", "octet-stream")
+                    part.set_payload(f.read())
 
-            encoders.encode_base64(part)
-            part.add_header(
-                "Content-Disposition",
-                f"attachment; filename={attachment_filename}",
-            )
-            message.attach(part)
+                encoders.encode_base64(part)
+                part.add_header(
+                    "Content-Disposition",
+                    f"attachment; filename={attachment_filename}",
+                )
+                message.attach(part)
 
-        # Encode message
-        raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
-        return {"raw": raw}
+        return message
 
     def send_test_email(self, recipient: str) -> bool:
         """
@@ -809,62 +938,6 @@ class EmailService:
 
         return html
 
-    def _create_message_with_multiple_attachments(
-        self,
-        to: str,
-        subject: str,
-        body_html: str,
-        attachment_paths: List[str],
-    ) -> Dict[str, str]:
-        """
-        Create email message with HTML body and multiple attachments
-
-        Args:
-            to: Recipient email address
-            subject: Email subject
-            body_html: HTML email body
-            attachment_paths: List of paths to files to attach
-
-        Returns:
-            Gmail API message dict
-        """
-        # Create multipart message
-        message = MIMEMultipart()
-        message["to"] = to
-        message["subject"] = subject
-
-        # Add HTML body
-        message.attach(MIMEText(body_html, "html"))
-
-        # Add random inline image
-        random_image = self._get_random_image()
-        if random_image:
-            image_bytes, image_filename = random_image
-            image_part = MIMEImage(image_bytes)
-            image_part.add_header("Content-ID", "<random_image>")
-            image_part.add_header("Content-Disposition", "inline", filename=image_filename)
-            message.attach(image_part)
-
-        # Add all attachments
-        for attachment_path in attachment_paths:
-            if Path(attachment_path).exists():
-                attachment_filename = Path(attachment_path).name
-
-                with open(attachment_path, "rb") as f:
-                    part = MIMEBase("application", "octet-stream")
-                    part.set_payload(f.read())
-
-                encoders.encode_base64(part)
-                part.add_header(
-                    "Content-Disposition",
-                    f"attachment; filename={attachment_filename}",
-                )
-                message.attach(part)
-
-        # Encode message
-        raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
-        return {"raw": raw}
-
 
 if __name__ == "__main__":
     # Test email service
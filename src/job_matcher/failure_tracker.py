@@ -186,6 +186,28 @@ class FailureTracker:
 
             return False
 
+    def mark_resolved_bulk(self, job_urls: List[str], stage: str) -> int:
+        """
+        Mark several failed jobs as resolved with a single delete
+
+        Args:
+            job_urls: Job URLs (empty values are ignored)
+            stage: Pipeline stage
+
+        Returns:
+            Number of failures removed
+        """
+        job_urls = [job_url for job_url in job_urls if job_url]
+        if not job_urls:
+            return 0
+
+        with self._lock:
+            removed = self.db.fetchall(
+                "DELETE FROM failed_jobs WHERE stage = ? AND job_url IN (SELECT unnest(?)) RETURNING job_url",
+                (stage, job_urls)
+            )
+            return len(removed)
+
     def get_failed_jobs(
         self,
         stage: Optional[str] = None,
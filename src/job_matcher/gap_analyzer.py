@@ -6,6 +6,7 @@ and overall fit assessment.
 Supports multi-threaded processing for faster batch analysis.
 """
 
+import asyncio
 import json
 import os
 import threading
@@ -15,6 +16,7 @@ from typing import Dict, Any, Optional, List
 from .llama_client import LlamaClient
 from .resume_analyzer import ResumeAnalyzer
 from .failure_tracker import FailureTracker, ErrorType
+from .response_cache import job_content_id
 from .models.job_sections import extract_job_sections
 from .comparison_engine import ComparisonEngine
 from .smooth_batch_processor import SmoothBatchProcessor
@@ -84,29 +86,7 @@ class GapAnalyzer:
                 print(f"[WARNING] JSON parse error analyzing job: {job.get('title', 'Unknown')}")
                 return None
 
-            if not response:
-                error_msg = "Empty response from AI"
-                if self.failure_tracker:
-                    self.failure_tracker.record_failure(job, "analysis", ErrorType.UNKNOWN_ERROR, error_msg)
-                print(f"[WARNING] Failed to analyze job: {job.get('title', 'Unknown')}")
-                return None
-
-            # Validate required fields
-            required_fields = ["strengths", "gaps", "red_flags", "assessment"]
-            missing_fields = [f for f in required_fields if f not in response]
-            if missing_fields:
-                error_msg = f"Missing required fields: {', '.join(missing_fields)}"
-                if self.failure_tracker:
-                    self.failure_tracker.record_failure(job, "analysis", ErrorType.VALIDATION_ERROR, error_msg)
-                print(f"[WARNING] Validation error analyzing job: {error_msg}")
-                return None
-
-            return {
-                "strengths": response.get("strengths", []),
-                "gaps": response.get("gaps", []),
-                "red_flags": response.get("red_flags", []),
-                "assessment": response.get("assessment", "No assessment provided"),
-            }
+            return self._analysis_from_response(job, response)
 
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
@@ -115,6 +95,89 @@ class GapAnalyzer:
             print(f"[WARNING] Unexpected error analyzing job {job.get('title', 'Unknown')}: {e}")
             return None
 
+    async def analyze_job_async(
+        self, session, job: Dict[str, Any], semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """
+        Analyze one job over a shared aiohttp session
+
+        Used by the pipelined pass runner. Failures are recorded and the job is
+        returned with empty analysis fields, like the batch methods do.
+
+        Args:
+            session: aiohttp session to send the request on
+            job: Job dict with match_score and other fields from Pass 1
+            semaphore: Semaphore bounding concurrent LLM requests
+
+        Returns:
+            Job dict with the analysis fields added
+        """
+        import aiohttp
+
+        title = job.get("title", "Unknown")
+        result = None
+        try:
+            prompt = self._create_analysis_prompt(job)
+            async with semaphore:
+                response = await self.client.generate_json_async(
+                    session, prompt, temperature=0.4, max_tokens=2048
+                )
+            result = self._analysis_from_response(job, response)
+        except asyncio.TimeoutError:
+            if self.failure_tracker:
+                self.failure_tracker.record_failure(job, "analysis", ErrorType.TIMEOUT_ERROR, "Request timed out")
+            print(f"[WARNING] Timeout analyzing job: {title}")
+        except aiohttp.ClientConnectionError as e:
+            if self.failure_tracker:
+                self.failure_tracker.record_failure(job, "analysis", ErrorType.CONNECTION_ERROR, f"Connection error: {str(e)}")
+            print(f"[WARNING] Connection error analyzing job: {title}")
+        except Exception as e:
+            if self.failure_tracker:
+                self.failure_tracker.record_failure(job, "analysis", ErrorType.UNKNOWN_ERROR, f"Unexpected error: {str(e)}")
+            print(f"[WARNING] Unexpected error analyzing job {title}: {e}")
+
+        job_url = job.get("job_url", "")
+        if self.checkpoint_manager and job_url:
+            self.checkpoint_manager.mark_job_completed("analysis", job_url)
+
+        if result:
+            return {**job, **result}
+
+        self.failed_jobs.append(job)
+        return {
+            **job,
+            "strengths": [],
+            "gaps": [],
+            "red_flags": [],
+            "assessment": "Failed to analyze job",
+        }
+
+    def _analysis_from_response(self, job: Dict[str, Any], response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Validate an AI response and extract the analysis fields (None on failure)"""
+        if not response:
+            error_msg = "Empty response from AI"
+            if self.failure_tracker:
+                self.failure_tracker.record_failure(job, "analysis", ErrorType.UNKNOWN_ERROR, error_msg)
+            print(f"[WARNING] Failed to analyze job: {job.get('title', 'Unknown')}")
+            return None
+
+        # Validate required fields
+        required_fields = ["strengths", "gaps", "red_flags", "assessment"]
+        missing_fields = [f for f in required_fields if f not in response]
+        if missing_fields:
+            error_msg = f"Missing required fields: {', '.join(missing_fields)}"
+            if self.failure_tracker:
+                self.failure_tracker.record_failure(job, "analysis", ErrorType.VALIDATION_ERROR, error_msg)
+            print(f"[WARNING] Validation error analyzing job: {error_msg}")
+            return None
+
+        return {
+            "strengths": response.get("strengths", []),
+            "gaps": response.get("gaps", []),
+            "red_flags": response.get("red_flags", []),
+            "assessment": response.get("assessment", "No assessment provided"),
+        }
+
     def _create_analysis_prompt(self, job: Dict[str, Any]) -> str:
         """
         Create AI prompt for section-based gap analysis
@@ -149,14 +212,13 @@ Family: {job_sections.title.job_family}"""
         benefits_text = ", ".join(job_sections.compensation.benefits) if job_sections.compensation.benefits else "Not specified"
 
         description = job.get("description", "No description available")
-        resume_text = self.analyzer.resume_text or "No resume provided"
-        profile_text = self.analyzer.get_requirements_text()
 
-        prompt = f"""CRITICAL: YOU MUST RESPOND WITH ONLY JSON. NO THINKING. NO EXPLANATION. NO TEXT BEFORE OR AFTER THE JSON. START YOUR RESPONSE WITH THE OPENING BRACE {{
+        # Shared candidate block first (cacheable prefix), job-specific content after
+        prompt = self.analyzer.get_candidate_context() + f"""CRITICAL: YOU MUST RESPOND WITH ONLY JSON. NO THINKING. NO EXPLANATION. NO TEXT BEFORE OR AFTER THE JSON. START YOUR RESPONSE WITH THE OPENING BRACE {{
 
-You are an expert career advisor. You previously scored this job at {match_score}/100 with the following reasoning: "{reasoning}"
+You are an expert career advisor. You previously scored the job below at {match_score}/100 with the following reasoning: "{reasoning}"
 
-Now provide a detailed section-by-section gap analysis to help the candidate understand their fit for this position.
+Now provide a detailed section-by-section gap analysis to help the candidate above understand their fit for this position.
 
 **JOB POSTING:**
 
@@ -184,15 +246,6 @@ Size: {job_sections.company.company_size or "Not specified"}
 
 ---
 
-**CANDIDATE RESUME:**
-{resume_text}
-
----
-
-**{profile_text}**
-
----
-
 **PREVIOUS SCORING:**
 Match Score: {match_score}/100
 Reasoning: {reasoning}
@@ -253,6 +306,14 @@ Provide a comprehensive section-by-section analysis:
 
 Be specific and reference actual details from the resume, candidate profile, and job description."""
 
+        cache = getattr(self.client, "response_cache", None)
+        if cache is not None:
+            # The same posting from another source reuses this response, as long as it was scored the same
+            content_id = job_content_id(
+                job, self.analyzer.get_candidate_context(), "analysis", stage_inputs=(match_score, reasoning)
+            )
+            cache.register_content_key(prompt, content_id, temperature=0.4, max_tokens=2048)
+
         return prompt
 
     def analyze_jobs_batch(
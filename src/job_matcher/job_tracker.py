@@ -10,6 +10,7 @@ import sys
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pathlib import Path
+import pandas as pd
 from dotenv import load_dotenv
 
 # Add parent directory to path for imports
@@ -45,11 +46,37 @@ class JobTracker:
         Returns:
             True if job has been processed, False otherwise
         """
+        # job_url is the primary key, so this is a single index probe that
+        # stops at the first hit instead of counting matching rows
         result = self.db.fetchone(
-            "SELECT COUNT(*) FROM processed_jobs WHERE job_url = ?",
+            "SELECT 1 FROM processed_jobs WHERE job_url = ? LIMIT 1",
             (job_url,)
         )
-        return result[0] > 0 if result else False
+        return result is not None
+
+    def get_processed_urls(self, job_urls: List[str]) -> set:
+        """
+        Find which of the given job URLs have been processed, in one query
+
+        Use instead of calling is_processed() per job when filtering a batch.
+
+        Args:
+            job_urls: Job posting URLs to check
+
+        Returns:
+            Set of URLs that are already in the tracker
+        """
+        job_urls = list({url for url in job_urls if url})
+        if not job_urls:
+            return set()
+
+        # Bind the URLs as a single LIST parameter rather than one "?" per
+        # URL, so the statement text is identical for every batch size
+        result = self.db.fetchall(
+            "SELECT job_url FROM processed_jobs WHERE job_url IN (SELECT unnest(?))",
+            (job_urls,)
+        )
+        return {row[0] for row in result}
 
     def add_job(
         self,
@@ -145,98 +172,85 @@ class JobTracker:
         if not jobs:
             return {"inserted": 0, "updated": 0}
 
-        # Extract all job URLs
-        job_urls = [job.get("job_url", "") for job in jobs if job.get("job_url")]
-        if not job_urls:
-            return {"inserted": 0, "updated": 0}
-
-        # Get existing URLs in one query
-        placeholders = ",".join(["?" for _ in job_urls])
-        existing_result = self.db.fetchall(
-            f"SELECT job_url FROM processed_jobs WHERE job_url IN ({placeholders})",
-            tuple(job_urls)
-        )
-        existing_urls = {row[0] for row in existing_result}
-
         now = datetime.now()
         report_date = now.strftime("%Y-%m-%d")
 
-        # Separate new vs existing jobs
-        new_jobs = []
-        existing_jobs = []
-        for job in jobs:
-            job_url = job.get("job_url", "")
-            if not job_url:
-                continue
-            if job_url in existing_urls:
-                existing_jobs.append(job)
-            else:
-                new_jobs.append(job)
-
-        inserted = 0
-        updated = 0
-
-        # Batch insert new jobs using INSERT with multiple value sets
-        if new_jobs:
-            # Build batch insert - DuckDB supports multi-row INSERT
-            values = []
-            params = []
-            for job in new_jobs:
-                values.append("(?, ?, ?, ?, ?, ?, ?, ?, ?)")
-                params.extend([
-                    job.get("job_url", ""),
+        rows = pd.DataFrame.from_records(
+            [
+                (
+                    job["job_url"],
                     job.get("title", "Unknown"),
                     job.get("company", "Unknown"),
                     job.get("location", "Unknown"),
                     job.get("match_score", default_score),
-                    report_date,
-                    now,
-                    now,
-                    1,
-                ])
+                )
+                for job in jobs
+                if job.get("job_url")
+            ],
+            columns=["job_url", "job_title", "company", "location", "match_score"],
+        )
+        if rows.empty:
+            return {"inserted": 0, "updated": 0}
+        # One row per URL (ON CONFLICT can't touch the same row twice); later rows win
+        rows = rows.drop_duplicates(subset="job_url", keep="last")
+        rows["match_score"] = pd.to_numeric(rows["match_score"], errors="coerce")
 
-            insert_sql = f"""
-                INSERT INTO processed_jobs
-                (job_url, job_title, company, location, match_score,
-                 report_date, first_seen, last_seen, times_seen)
-                VALUES {",".join(values)}
-            """
+        # One set-based upsert from the registered DataFrame instead of a statement per row
+        try:
+            with self.db.batch_context() as batch:
+                batch.register("_tracker_rows", rows)
+                result = batch.fetchall("""
+                    INSERT INTO processed_jobs
+                    (job_url, job_title, company, location, match_score,
+                     report_date, first_seen, last_seen, times_seen)
+                    SELECT job_url, job_title, company, location, match_score,
+                           CAST(? AS TIMESTAMP), ?, ?, 1
+                    FROM _tracker_rows
+                    ON CONFLICT (job_url) DO UPDATE SET
+                        last_seen = EXCLUDED.last_seen,
+                        times_seen = processed_jobs.times_seen + 1,
+                        match_score = EXCLUDED.match_score
+                    RETURNING times_seen
+                """, (report_date, now, now))
+        except Exception as e:
+            print(f"[WARNING] Batch tracker update failed, falling back to individual updates: {e}")
+            return self._add_jobs_individually(rows, report_date)
+
+        # Newly inserted rows are the ones seen exactly once
+        inserted = sum(1 for (times_seen,) in result if times_seen == 1)
+        return {"inserted": inserted, "updated": len(result) - inserted}
+
+    def _add_jobs_individually(self, rows: pd.DataFrame, report_date: str) -> Dict[str, int]:
+        """
+        Add jobs one at a time (fallback when the batch upsert fails), skipping rows that fail
+
+        Args:
+            rows: Deduplicated tracker rows built by add_jobs_batch()
+            report_date: Date of report
+
+        Returns:
+            Dict with counts: {"inserted": N, "updated": M}
+        """
+        inserted = 0
+        updated = 0
+        for job_url, job_title, company, location, match_score in rows.itertuples(index=False):
             try:
-                self.db.execute(insert_sql, tuple(params))
-                inserted = len(new_jobs)
-            except Exception as e:
-                print(f"[WARNING] Batch insert failed, falling back to individual inserts: {e}")
-                # Fallback to individual inserts if batch fails
-                for job in new_jobs:
-                    try:
-                        self.add_job(
-                            job_url=job.get("job_url", ""),
-                            job_title=job.get("title", "Unknown"),
-                            company=job.get("company", "Unknown"),
-                            location=job.get("location", "Unknown"),
-                            match_score=job.get("match_score", default_score),
-                        )
-                        inserted += 1
-                    except Exception:
-                        pass
-
-        # Batch update existing jobs - use a single UPDATE with CASE
-        if existing_jobs:
-            # For updates, we need to update last_seen, times_seen, and match_score
-            # DuckDB doesn't support UPDATE with JOIN well, so we use individual updates
-            # but we can at least do them without the is_processed check
-            for job in existing_jobs:
-                try:
-                    self.db.execute("""
-                        UPDATE processed_jobs
-                        SET last_seen = ?,
-                            times_seen = times_seen + 1,
-                            match_score = ?
-                        WHERE job_url = ?
-                    """, (now, job.get("match_score", default_score), job.get("job_url", "")))
+                existed = self.is_processed(job_url)
+                if not self.add_job(
+                    job_url=job_url,
+                    job_title=job_title,
+                    company=company,
+                    location=location,
+                    match_score=None if pd.isna(match_score) else match_score,
+                    report_date=report_date,
+                ):
+                    continue
+                if existed:
                     updated += 1
-                except Exception:
-                    pass
+                else:
+                    inserted += 1
+            except Exception as e:
+                print(f"[WARNING] Tracker update failed for {job_url}: {e}")
 
         return {"inserted": inserted, "updated": updated}
 
@@ -299,37 +313,22 @@ class JobTracker:
         Returns:
             Stats dict with counts and averages
         """
-        # Total jobs
-        result = self.db.fetchone("SELECT COUNT(*) FROM processed_jobs")
-        total_jobs = result[0] if result else 0
-
-        # Average match score
-        result = self.db.fetchone("SELECT AVG(match_score) FROM processed_jobs")
-        avg_score = result[0] if result and result[0] else 0
-
-        # High matches (>= 80)
-        result = self.db.fetchone(
-            "SELECT COUNT(*) FROM processed_jobs WHERE match_score >= 80"
-        )
-        high_matches = result[0] if result else 0
-
-        # Medium matches (60-79)
-        result = self.db.fetchone(
-            "SELECT COUNT(*) FROM processed_jobs WHERE match_score >= 60 AND match_score < 80"
-        )
-        medium_matches = result[0] if result else 0
-
-        # Low matches (< 60)
-        result = self.db.fetchone(
-            "SELECT COUNT(*) FROM processed_jobs WHERE match_score < 60"
-        )
-        low_matches = result[0] if result else 0
-
-        # Reposted jobs (seen more than once)
-        result = self.db.fetchone(
-            "SELECT COUNT(*) FROM processed_jobs WHERE times_seen > 1"
-        )
-        reposted_jobs = result[0] if result else 0
+        # All counts in one aggregate query (one connection instead of six)
+        result = self.db.fetchone("""
+            SELECT
+                COUNT(*),
+                AVG(match_score),
+                COUNT(*) FILTER (WHERE match_score >= 80),
+                COUNT(*) FILTER (WHERE match_score >= 60 AND match_score < 80),
+                COUNT(*) FILTER (WHERE match_score < 60),
+                COUNT(*) FILTER (WHERE times_seen > 1)
+            FROM processed_jobs
+        """)
+        if not result:
+            result = (0, None, 0, 0, 0, 0)
+
+        total_jobs, avg_score, high_matches, medium_matches, low_matches, reposted_jobs = result
+        avg_score = avg_score or 0
 
         return {
             "total_jobs": total_jobs,
@@ -13,10 +13,14 @@ import os
 import json
 import ast
 import time
+import threading
 import requests
-from typing import Optional, Dict, Any, List
+from contextlib import nullcontext
+from typing import Optional, Dict, Any, List, Callable
 from dotenv import load_dotenv
 
+from src.utils import fast_json
+
 # Try to import aiohttp at module level for async batch mode
 # If not available, async batch mode will be disabled
 try:
@@ -70,6 +74,7 @@ class LlamaClient:
         request_timeout: Optional[int] = None,
         max_retries: Optional[int] = None,
         retry_delay: Optional[float] = None,
+        response_cache=None,
     ):
         """
         Initialize LlamaClient
@@ -83,6 +88,7 @@ class LlamaClient:
             request_timeout: Request timeout in seconds (default: from .env, 300s)
             max_retries: Maximum retry attempts on connection failure (default: 3)
             retry_delay: Base delay between retries in seconds (default: 5.0)
+            response_cache: Optional ResponseCache for reusing parsed JSON responses
         """
         # Store all configured URLs for retry logic
         self._all_urls: List[str] = []
@@ -143,6 +149,23 @@ class LlamaClient:
         self.request_timeout = request_timeout or int(os.getenv("LLAMA_REQUEST_TIMEOUT", "300"))
         self.max_retries = max_retries if max_retries is not None else 3
         self.retry_delay = retry_delay if retry_delay is not None else 5.0
+        self.response_cache = response_cache
+        # Let llama-server reuse the KV cache of a matching prompt prefix (shared candidate block)
+        self.cache_prompt = os.getenv("LLAMA_CACHE_PROMPT", "true").lower() == "true"
+        # Smaller/quantized model for requests whose answer is easy to predict (sent as the
+        # request's "model", for llama-server router mode or llama-swap). Empty = one model.
+        self.fast_model = os.getenv("LLAMA_FAST_MODEL", "").strip() or None
+        # Bound in-flight completions across every thread sharing this client (e.g. concurrent sources)
+        # so requests queue here instead of piling up behind llama-server's slots
+        self.server_slots = int(os.getenv("LLAMA_SERVER_SLOTS", os.getenv("MATCH_THREADS", "4")))
+        self._slots = threading.BoundedSemaphore(self.server_slots) if self.server_slots > 0 else None
+        # monotonic time of the last successful health check (test_connection re-probes after the TTL)
+        self._healthy_at: Optional[float] = None
+        self.health_check_ttl = float(os.getenv("LLAMA_HEALTH_CHECK_TTL", "60"))
+        # llama-server's parallel slot count, read from /props on first use (0 = unknown)
+        self._detected_slots: Optional[int] = None
+        # Loaded model path from /props, read on first use
+        self._model_id: Optional[str] = None
 
         # Ensure server_url doesn't have trailing slash
         self.server_url = self.server_url.rstrip("/")
@@ -157,12 +180,19 @@ class LlamaClient:
         """
         Test connection to llama-server
 
+        A success is remembered for health_check_ttl seconds (LLAMA_HEALTH_CHECK_TTL,
+        default 60), so back-to-back pipeline runs don't re-probe the server.
+
         Returns:
             True if server is reachable, False otherwise
         """
+        if self._healthy_at is not None and time.monotonic() - self._healthy_at < self.health_check_ttl:
+            return True
+
         try:
             response = requests.get(f"{self.server_url}/health", timeout=5)
             if response.status_code == 200:
+                self._healthy_at = time.monotonic()
                 return True
             else:
                 print(f"X Connection test failed: Server returned status {response.status_code}")
@@ -182,6 +212,31 @@ class LlamaClient:
             print(f"  URL: {self.server_url}/health")
             return False
 
+    def warm_prompt_cache(self, prefix: str) -> bool:
+        """
+        Process a prompt prefix once so later prompts starting with it reuse its KV cache
+
+        Args:
+            prefix: Text every following prompt starts with
+
+        Returns:
+            True if the server processed the prefix
+        """
+        if not self.cache_prompt or not prefix:
+            return False
+
+        try:
+            response = requests.post(
+                f"{self.server_url}/completion",
+                json={"prompt": prefix, "n_predict": 1, "cache_prompt": True, "stream": False},
+                headers={"Content-Type": "application/json"},
+                timeout=self.request_timeout,
+            )
+            return response.status_code == 200
+        except Exception as e:
+            print(f"[WARNING] Prompt cache warm-up failed: {e}")
+            return False
+
     def generate(
         self,
         prompt: str,
@@ -189,6 +244,7 @@ class LlamaClient:
         max_tokens: Optional[int] = None,
         stop: Optional[list] = None,
         json_schema: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
     ) -> Optional[str]:
         """
         Generate text completion from llama-server
@@ -199,6 +255,7 @@ class LlamaClient:
             max_tokens: Override default max_tokens
             stop: List of stop sequences
             json_schema: Optional JSON schema to enforce output format
+            model: Model to route the request to (default: the server's model)
 
         Returns:
             Generated text or None if request fails
@@ -210,21 +267,23 @@ class LlamaClient:
                 "n_predict": max_tokens or self.max_tokens,
                 "stop": stop or [],
                 "stream": False,
+                "cache_prompt": self.cache_prompt,
             }
 
             # Add JSON schema if provided (llama.cpp supports this)
             if json_schema:
                 payload["json_schema"] = json_schema
+            if model:
+                payload["model"] = model
 
-            response = requests.post(
-                f"{self.server_url}/completion",
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=self.request_timeout,
-            )
+            if self._slots is not None:
+                with self._slots:
+                    response = self._post_completion(payload)
+            else:
+                response = self._post_completion(payload)
 
             if response.status_code == 200:
-                result = response.json()
+                result = fast_json.loads(response.content)
                 return result.get("content", "").strip()
             else:
                 print(f"X Generation failed: {response.status_code} - {response.text}")
@@ -237,12 +296,102 @@ class LlamaClient:
             print(f"X Generation error: {e}")
             return None
 
+    def generate_stream(
+        self,
+        prompt: str,
+        on_token: Callable[[str], None],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        stop: Optional[list] = None,
+        json_schema: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Generate a completion, passing each piece of text to on_token as it arrives
+
+        Uses llama-server's server-sent events stream, so output can be shown while
+        the model is still generating.
+
+        Args:
+            prompt: The prompt to send to the model
+            on_token: Called with each generated text chunk
+            temperature: Override default temperature
+            max_tokens: Override default max_tokens
+            stop: List of stop sequences
+            json_schema: Optional JSON schema to enforce output format
+            model: Model to route the request to (default: the server's model)
+
+        Returns:
+            Full generated text or None if request fails
+        """
+        payload = {
+            "prompt": prompt,
+            "temperature": temperature or self.temperature,
+            "n_predict": max_tokens or self.max_tokens,
+            "stop": stop or [],
+            "stream": True,
+            "cache_prompt": self.cache_prompt,
+        }
+        if json_schema:
+            payload["json_schema"] = json_schema
+        if model:
+            payload["model"] = model
+
+        try:
+            with self._slots if self._slots is not None else nullcontext():
+                with requests.post(
+                    f"{self.server_url}/completion",
+                    json=payload,
+                    headers={"Content-Type": "application/json"},
+                    timeout=self.request_timeout,
+                    stream=True,
+                ) as response:
+                    if response.status_code != 200:
+                        print(f"X Generation failed: {response.status_code} - {response.text}")
+                        return None
+
+                    chunks = []
+                    for line in response.iter_lines():
+                        # Events are "data: {...}" lines separated by blank lines
+                        if not line.startswith(b"data: "):
+                            continue
+                        data = line[len(b"data: "):]
+                        if data == b"[DONE]":
+                            break
+                        event = fast_json.loads(data)
+                        text = event.get("content", "")
+                        if text:
+                            chunks.append(text)
+                            on_token(text)
+                        if event.get("stop"):
+                            break
+                    return "".join(chunks).strip()
+
+        except requests.exceptions.Timeout:
+            print(f"X Request timed out after {self.request_timeout} seconds")
+            return None
+        except Exception as e:
+            print(f"X Generation error: {e}")
+            return None
+
+    def _post_completion(self, payload: Dict[str, Any]) -> requests.Response:
+        """POST a completion request to llama-server"""
+        return requests.post(
+            f"{self.server_url}/completion",
+            json=payload,
+            headers={"Content-Type": "application/json"},
+            timeout=self.request_timeout,
+        )
+
     def generate_json(
         self,
         prompt: str,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         json_schema: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+        model: Optional[str] = None,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Generate JSON response from llama-server
@@ -252,29 +401,84 @@ class LlamaClient:
             temperature: Override default temperature
             max_tokens: Override default max_tokens
             json_schema: Optional JSON schema to enforce output format
+            use_cache: Consult response_cache (if configured) before calling the server
+            model: Model to route the request to (default: the server's model)
+            on_token: Stream the raw output to this callback while generating
+                      (not called for cached responses)
 
         Returns:
             Parsed JSON dict or None if request fails
         """
+        if use_cache and self.response_cache is not None:
+            cache_key = self.response_cache.make_key(prompt, temperature, max_tokens, json_schema, model)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
+
+            # Wait for an equivalent request another thread is already sending
+            in_flight = self.response_cache.claim(cache_key)
+            if in_flight is not None:
+                in_flight.wait(self.request_timeout)
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    return dict(cached)
+                return self.generate_json(
+                    prompt, temperature, max_tokens, json_schema, use_cache=False, model=model, on_token=on_token
+                )
+
+            try:
+                response = self.generate_json(
+                    prompt, temperature, max_tokens, json_schema, use_cache=False, model=model, on_token=on_token
+                )
+                self.response_cache.put(cache_key, response)
+            finally:
+                self.response_cache.release(cache_key)
+            return response
+
         # Add JSON instruction to prompt
         json_prompt = f"{prompt}\n\nYou MUST respond with ONLY valid JSON. Do not include explanations, thinking, or any text outside the JSON object."
 
-        result = self.generate(
-            prompt=json_prompt,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            json_schema=json_schema
-        )
+        if on_token is not None:
+            result = self.generate_stream(
+                json_prompt,
+                on_token,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                json_schema=json_schema,
+                model=model,
+            )
+        else:
+            result = self.generate(
+                prompt=json_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                json_schema=json_schema,
+                model=model,
+            )
 
         if not result:
             return None
 
+        return self._parse_json_response(result)
+
+    @staticmethod
+    def _parse_json_response(result: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract a JSON object from raw model output
+
+        Args:
+            result: Generated text from llama-server
+
+        Returns:
+            Parsed JSON dict or None if no strategy succeeds
+        """
         # Try multiple strategies to extract JSON from response
         import re
 
-        # Strategy 1: Direct parse
+        # Strategy 1: Direct parse (orjson when available; the fallbacks below use the
+        # more lenient stdlib parser, e.g. for NaN)
         try:
-            return json.loads(result)
+            return fast_json.loads(result)
         except json.JSONDecodeError:
             pass
 
@@ -374,6 +578,103 @@ class LlamaClient:
         # Removed print statements to avoid thread output conflicts in multi-threaded execution
         return None
 
+    async def generate_json_async(
+        self,
+        session: "aiohttp.ClientSession",
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        json_schema: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Generate a single JSON response over a shared aiohttp session
+
+        Callers bound concurrency themselves (e.g. with an asyncio.Semaphore).
+        Timeouts and connection errors are raised so callers can classify them.
+
+        Args:
+            session: aiohttp session to send the request on
+            prompt: The prompt to send to the model
+            temperature: Override default temperature
+            max_tokens: Override default max_tokens
+            json_schema: Optional JSON schema to enforce output format
+            model: Model to route the request to (default: the server's model)
+
+        Returns:
+            Parsed JSON dict or None if the server errors or the output can't be parsed
+        """
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.make_key(prompt, temperature, max_tokens, json_schema, model)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
+
+            # Wait (off the event loop) for an equivalent request already in flight
+            in_flight = self.response_cache.claim(cache_key)
+            if in_flight is not None:
+                await asyncio.to_thread(in_flight.wait, self.request_timeout)
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    return dict(cached)
+                cache_key = None
+
+        try:
+            return await self._generate_json_async_uncached(
+                session, prompt, temperature, max_tokens, json_schema, cache_key, model
+            )
+        finally:
+            if cache_key is not None:
+                self.response_cache.release(cache_key)
+
+    async def _generate_json_async_uncached(
+        self,
+        session,
+        prompt: str,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        json_schema: Optional[Dict[str, Any]],
+        cache_key: Optional[str],
+        model: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Send one JSON request on an aiohttp session, storing the parsed result under cache_key"""
+        # Add JSON instruction to prompt
+        json_prompt = f"{prompt}\n\nYou MUST respond with ONLY valid JSON. Do not include explanations, thinking, or any text outside the JSON object."
+
+        payload = {
+            "prompt": json_prompt,
+            "temperature": temperature or self.temperature,
+            "n_predict": max_tokens or self.max_tokens,
+            "stop": [],
+            "stream": False,
+            "cache_prompt": self.cache_prompt,
+        }
+        if json_schema:
+            payload["json_schema"] = json_schema
+        if model:
+            payload["model"] = model
+
+        async with session.post(
+            f"{self.server_url}/completion",
+            json=payload,
+            headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+        ) as response:
+            if response.status != 200:
+                print(f"X Generation failed: {response.status} - {(await response.text())[:500]}")
+                return None
+            result = fast_json.loads(await response.read())
+
+        content = result.get("content", "").strip()
+        if not content:
+            return None
+
+        parsed = self._parse_json_response(content)
+        if cache_key is not None:
+            self.response_cache.put(cache_key, parsed)
+        return parsed
+
     async def generate_json_batch_async(
         self,
         prompts: List[str],
@@ -381,6 +682,8 @@ class LlamaClient:
         max_tokens: Optional[int] = None,
         json_schema: Optional[Dict[str, Any]] = None,
         max_concurrent: Optional[int] = None,
+        use_cache: bool = True,
+        model: Optional[str] = None,
     ) -> List[Optional[Dict[str, Any]]]:
         """
         Generate JSON responses for multiple prompts using async HTTP with rate limiting
@@ -394,6 +697,8 @@ class LlamaClient:
             max_tokens: Override default max_tokens
             json_schema: Optional JSON schema to enforce output format
             max_concurrent: Maximum concurrent requests (default: from MATCH_THREADS env, or 4)
+            use_cache: Consult response_cache (if configured) and only send cache misses
+            model: Model to route every request to (default: the server's model)
 
         Returns:
             List of parsed JSON dicts (or None for failed requests), in same order as prompts
@@ -404,6 +709,36 @@ class LlamaClient:
                 "Install with: pip install aiohttp>=3.9.0"
             )
 
+        if use_cache and self.response_cache is not None and prompts:
+            cache_keys = [
+                self.response_cache.make_key(prompt, temperature, max_tokens, json_schema, model)
+                for prompt in prompts
+            ]
+            results = [dict(cached) if cached is not None else None
+                       for cached in self.response_cache.get_many(cache_keys)]
+            miss_indices = [i for i, result in enumerate(results) if result is None]
+
+            if len(miss_indices) < len(prompts):
+                print(f"[INFO] LLM cache: reusing {len(prompts) - len(miss_indices)} of {len(prompts)} responses")
+
+            if miss_indices:
+                fresh = await self.generate_json_batch_async(
+                    [prompts[i] for i in miss_indices],
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    json_schema=json_schema,
+                    max_concurrent=max_concurrent,
+                    use_cache=False,
+                    model=model,
+                )
+                for i, response in zip(miss_indices, fresh):
+                    results[i] = response
+                self.response_cache.put_many(
+                    [(cache_keys[i], response) for i, response in zip(miss_indices, fresh)]
+                )
+
+            return results
+
         # Get max concurrent requests from env or parameter
         if max_concurrent is None:
             max_concurrent = int(os.getenv("MATCH_THREADS", "4"))
@@ -431,11 +766,14 @@ class LlamaClient:
                 "n_predict": max_tokens or self.max_tokens,
                 "stop": [],
                 "stream": False,
+                "cache_prompt": self.cache_prompt,
             }
 
             # Add JSON schema if provided
             if json_schema:
                 payload["json_schema"] = json_schema
+            if model:
+                payload["model"] = model
 
             try:
                 async with session.post(
@@ -445,13 +783,13 @@ class LlamaClient:
                     timeout=aiohttp.ClientTimeout(total=self.request_timeout),
                 ) as response:
                     if response.status == 200:
-                        result = await response.json()
+                        result = fast_json.loads(await response.read())
                         content = result.get("content", "").strip()
 
                         # Parse JSON from content using same strategies as generate_json()
                         # Strategy 1: Direct parse
                         try:
-                            return (index, json.loads(content))
+                            return (index, fast_json.loads(content))
                         except json.JSONDecodeError:
                             pass
 
@@ -608,6 +946,61 @@ class LlamaClient:
             stop=["<|im_end|>"],
         )
 
+    def get_parallelism(self, default: int = 8) -> int:
+        """
+        Number of concurrent requests to keep in flight for async fan-out
+
+        Uses LLM_PARALLELISM when set; otherwise matches llama-server's slot
+        count (--parallel, reported as total_slots by /props) so every slot
+        stays busy without requests queueing on the server.
+
+        Args:
+            default: Fallback when neither is available
+
+        Returns:
+            Number of parallel requests
+        """
+        configured = os.getenv("LLM_PARALLELISM")
+        if configured:
+            return int(configured)
+
+        if self._detected_slots is None:
+            self._detected_slots = 0
+            try:
+                response = requests.get(f"{self.server_url}/props", timeout=5)
+                if response.status_code == 200:
+                    self._detected_slots = int(response.json().get("total_slots") or 0)
+            except (requests.exceptions.RequestException, ValueError, TypeError):
+                pass
+
+        return self._detected_slots or default
+
+    def get_model_id(self, refresh: bool = False) -> str:
+        """
+        Identify the model llama-server has loaded (for keying cached responses)
+
+        Args:
+            refresh: Ask the server again instead of reusing the last answer (e.g. after a model swap)
+
+        Returns:
+            Loaded model path from /props, or the server URL if the server doesn't report it
+        """
+        if self._model_id is None or refresh:
+            try:
+                response = requests.get(f"{self.server_url}/props", timeout=5)
+                if response.status_code == 200:
+                    props = response.json()
+                    self._model_id = (
+                        props.get("model_path")
+                        or props.get("default_generation_settings", {}).get("model")
+                        or None
+                    )
+            except (requests.exceptions.RequestException, ValueError, AttributeError):
+                pass
+
+        # Not cached when unknown, so a later call can pick the path up once the server is reachable
+        return self._model_id or self.server_url
+
     def get_model_info(self) -> Optional[Dict[str, Any]]:
         """
         Get information about the loaded model
@@ -5,13 +5,15 @@ Analyzes jobs against resume and requirements to generate match scores.
 Supports multi-threaded processing for faster batch scoring.
 """
 
+import asyncio
 import json
 import os
 import threading
 import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Any, Optional, List
-from .llama_client import LlamaClient
+from typing import Dict, Any, Optional, List, Callable
+from .llama_client import LlamaClient, ASYNC_AVAILABLE
+from .response_cache import job_content_id
 from .resume_analyzer import ResumeAnalyzer
 from .failure_tracker import FailureTracker, ErrorType
 from .filters import apply_filters_to_jobs
@@ -19,6 +21,192 @@ from .comparison_engine import ComparisonEngine
 from .models.job_sections import extract_job_sections
 from .smooth_batch_processor import SmoothBatchProcessor
 
+# JSON schema enforced on scoring responses
+SCORING_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "match_score": {
+            "type": "integer",
+            "minimum": 0,
+            "maximum": 100,
+            "description": "Match score from 0 to 100"
+        },
+        "reasoning": {
+            "type": "string",
+            "description": "Brief explanation of the score (2-3 sentences)"
+        },
+        "matched_requirements": {
+            "type": "object",
+            "description": "Dictionary of matched requirements (can be empty)"
+        }
+    },
+    "required": ["match_score", "reasoning", "matched_requirements"]
+}
+
+
+# Fields a fused response adds on top of the scoring fields, grouped by the pass they replace
+FUSED_ANALYSIS_FIELDS = {"strengths": list, "gaps": list, "red_flags": list, "assessment": str}
+FUSED_OPTIMIZATION_FIELDS = {
+    "keywords": list,
+    "experience_highlights": list,
+    "sections_to_expand": list,
+    "cover_letter_points": list,
+    "resume_summary": str,
+}
+
+# JSON schema for fused responses (score + gap analysis + resume suggestions in one call)
+FUSED_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        **SCORING_JSON_SCHEMA["properties"],
+        **{
+            name: {"type": "array", "items": {"type": "string"}} if kind is list else {"type": "string"}
+            for name, kind in {**FUSED_ANALYSIS_FIELDS, **FUSED_OPTIMIZATION_FIELDS}.items()
+        },
+    },
+    "required": SCORING_JSON_SCHEMA["required"] + list(FUSED_ANALYSIS_FIELDS) + list(FUSED_OPTIMIZATION_FIELDS),
+}
+
+# Replaces the output section of the scoring prompt in fused mode
+FUSED_PROMPT_SUFFIX = """**ADDITIONAL ANALYSIS (after scoring):**
+1. **Strengths**: 3-5 specific reasons the candidate fits, each referencing actual resume experience and a job requirement.
+2. **Gaps**: Specific skills, experience, or qualifications the candidate lacks (title/seniority, skills, experience, compensation).
+3. **Red Flags**: Must-have violations, avoid-list items, or deal-breakers. Leave empty if none.
+4. **Assessment**: 2-3 sentences on whether to apply and how well each major section aligns.
+
+**RESUME RECOMMENDATIONS:**
+5. **Keywords**: 5-10 important keywords from the job description the resume should contain.
+6. **Experience Highlights**: 3-5 bullets or achievements from the resume to feature prominently (use the resume's text).
+7. **Sections to Expand**: 2-3 resume sections to expand, with specific guidance.
+8. **Cover Letter Points**: 3-4 talking points that address the job requirements.
+9. **Resume Summary**: A 2-3 sentence professional summary tailored to this job.
+
+**CRITICAL OUTPUT REQUIREMENTS:**
+- You MUST respond with ONLY a JSON object
+- DO NOT include any explanations, thinking, or text before or after the JSON
+- DO NOT use markdown code blocks or formatting
+- The response must start with { and end with }
+
+**REQUIRED JSON FORMAT:**
+{
+  "match_score": <integer from 0 to 100>,
+  "reasoning": "<2-3 sentences: role type + domain match, qualification fit, any concerns>",
+  "matched_requirements": {},
+  "strengths": ["..."],
+  "gaps": ["..."],
+  "red_flags": ["..."],
+  "assessment": "...",
+  "keywords": ["..."],
+  "experience_highlights": ["..."],
+  "sections_to_expand": ["..."],
+  "cover_letter_points": ["..."],
+  "resume_summary": "..."
+}"""
+
+# Fixed text between the candidate context and the job posting in scoring prompts
+SCORING_PROMPT_PREAMBLE = """You are an expert job matching system. Evaluate how well the job posting below matches what the candidate above is looking for AND whether they're qualified.
+
+"""
+
+# Static tail of the scoring prompt (evaluation rubric and output format)
+SCORING_PROMPT_INSTRUCTIONS = """**EVALUATION INSTRUCTIONS:**
+
+Complete each evaluation step and track your assessment. Your final score MUST reflect the cumulative result of all steps.
+
+**STEP 1: DEAL-BREAKER CHECK**
+Review ONLY the MUST-HAVES and AVOID lists (these are the ONLY deal-breakers):
+- Does this job satisfy ALL MUST-HAVES? (Yes/No)
+- Does this job contain ANY AVOID items? (Yes/No)
+- If ANY deal-breaker is triggered → Cap score at 49 maximum
+
+IMPORTANT: Skills and other preferences are NOT deal-breakers. A job missing some preferred skills should NOT be disqualified. Only MUST-HAVES and AVOID items can disqualify a job.
+
+**STEP 2: DOMAIN MATCH CHECK**
+Read the ENTIRE job description to determine the actual role:
+- What is the primary domain? (e.g., data engineering, frontend, DevOps, etc.)
+- Does this match the candidate's target domain? (Yes/Partial/No)
+- If NO (wrong domain entirely) → Cap score at 59 maximum
+- If PARTIAL (adjacent/overlapping domain) → Cap score at 74 maximum
+
+**STEP 3: ROLE ALIGNMENT SCORING** (0-30 points)
+How well does the role match what the candidate wants?
+- 25-30: Exact target role match (title AND responsibilities align perfectly)
+- 18-24: Strong alignment (clearly in target domain, minor title/scope differences)
+- 10-17: Moderate alignment (right domain but different focus area)
+- 0-9: Weak alignment (tangentially related)
+
+**STEP 4: QUALIFICATIONS FIT SCORING** (0-40 points)
+How qualified is the candidate for this specific role?
+- 35-40: Exceeds requirements (candidate has more experience/skills than the job requires)
+- 28-34: Fully qualified (candidate meets all key requirements listed in the job)
+- 20-27: Mostly qualified (candidate meets most requirements, missing 1-2 specific skills)
+- 12-19: Partially qualified (candidate is missing several required skills or significant experience)
+- 0-11: Under-qualified (candidate lacks fundamental skills or experience for this role)
+
+**STEP 5: PREFERENCES SCORING** (0-30 points)
+How well does the job meet the candidate's stated preferences?
+- Remote/location preference met? (0-10 points)
+- Salary in acceptable range? (0-10 points)
+- Other preferences (company size, tech stack, etc.)? (0-10 points)
+
+**WHAT MATTERS VS. WHAT DOESN'T:**
+
+Things that SHOULD impact the score:
+- Does the job match the candidate's target role and domain?
+- Does the candidate have the technical skills the job requires?
+- Does the job meet the candidate's must-haves (remote, salary, etc.)?
+- Does the job trigger any avoid items?
+
+Things that should NOT significantly impact the score:
+- Lack of experience at the specific company (everyone is new to a company when they join)
+- Lack of experience in the specific industry/vertical (transferable skills matter more)
+- Candidate having MORE skills than the job mentions (this is a positive, not a gap)
+- Unclear seniority levels or job leveling systems
+- Minor differences in job title wording (e.g., "Data Platform Engineer" vs "Data Engineer")
+- Job not using ALL of the candidate's listed skills (the candidate's skills are a POOL of technologies they know - a job only needs to match SOME of them, not all)
+
+**FINAL SCORE CALCULATION:**
+1. Sum your points from Steps 3-5 (maximum 100)
+2. Apply any caps from Steps 1-2 if triggered
+3. The result is your match_score
+
+**SCORE INTERPRETATION:**
+- 85-100: Strong match - Right role, candidate can do the job, core preferences met. May still have minor gaps.
+- 70-84: Good match - Right domain, candidate is qualified, some preference trade-offs. May have a few gaps.
+- 50-69: Moderate match - Alignment concerns (adjacent role, missing important skills, or significant preference gaps)
+- 0-49: Poor match - Wrong domain, deal-breaker triggered, or candidate lacks core required skills
+
+Note: Having gaps does NOT mean the score should be low. Most real job matches have some gaps - what matters is whether the candidate can do the job and the job meets their core requirements.
+
+**REASONING REQUIREMENTS:**
+In your 2-3 sentence explanation, state:
+1. The actual role type and whether it matches the target domain
+2. Key qualification matches or gaps
+3. Any deal-breakers or preference issues
+
+**CRITICAL OUTPUT REQUIREMENTS:**
+- You MUST respond with ONLY a JSON object
+- DO NOT include any explanations, thinking, or text before or after the JSON
+- DO NOT use markdown code blocks or formatting
+- The response must start with { and end with }
+
+**REQUIRED JSON FORMAT:**
+{
+  "match_score": <integer from 0 to 100>,
+  "reasoning": "<2-3 sentences: role type + domain match, qualification fit, any concerns>",
+  "matched_requirements": {}
+}"""
+
+# Deterministic scores (0-40) at or beyond these bounds are clear-cut, and the AI
+# part is sent to the client's fast model (LLAMA_FAST_MODEL) when one is configured
+FAST_MODEL_MAX_DETERMINISTIC = 12
+FAST_MODEL_MIN_DETERMINISTIC = 34
+
+# Fused prompts keep the scoring rubric but replace its output format
+FUSED_PROMPT_INSTRUCTIONS = (
+    SCORING_PROMPT_INSTRUCTIONS.rsplit("**CRITICAL OUTPUT REQUIREMENTS:**", 1)[0] + FUSED_PROMPT_SUFFIX
+)
+
 
 class MatchScorer:
     """Score jobs based on resume and requirements match"""
@@ -43,6 +231,8 @@ class MatchScorer:
         self.failed_jobs: List[Dict[str, Any]] = []  # Track failures during batch
         self.rejected_jobs: List[Dict[str, Any]] = []  # Track title-rejected jobs
         self.filtered_jobs: List[Dict[str, Any]] = []  # Track pre-filtered jobs
+        # Route clear-cut jobs to the client's fast model (if it has one)
+        self.use_fast_model = True
 
         # Initialize comparison engine for hybrid scoring
         self.comparison_engine = ComparisonEngine(
@@ -104,13 +294,18 @@ class MatchScorer:
 
         return False
 
-    def score_job(self, job: Dict[str, Any], use_hybrid_scoring: bool = True) -> Optional[Dict[str, Any]]:
+    def score_job(
+        self, job: Dict[str, Any], use_hybrid_scoring: bool = True, refresh_cache: bool = False,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Score a single job against the resume and requirements
 
         Args:
             job: Job dict from JobPost
             use_hybrid_scoring: If True, combines deterministic + AI scores (default: True)
+            refresh_cache: Drop any cached AI response for this prompt and ask the model again
+            on_token: Stream the model's raw output to this callback as it's generated
 
         Returns:
             Dict with match_score, reasoning, and preference_checks
@@ -140,26 +335,15 @@ class MatchScorer:
                 return None
 
             # Define JSON schema for the expected response
-            json_schema = {
-                "type": "object",
-                "properties": {
-                    "match_score": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 100,
-                        "description": "Match score from 0 to 100"
-                    },
-                    "reasoning": {
-                        "type": "string",
-                        "description": "Brief explanation of the score (2-3 sentences)"
-                    },
-                    "matched_requirements": {
-                        "type": "object",
-                        "description": "Dictionary of matched requirements (can be empty)"
-                    }
-                },
-                "required": ["match_score", "reasoning", "matched_requirements"]
-            }
+            json_schema = SCORING_JSON_SCHEMA
+            model = self._scoring_model(deterministic_scores)
+            if model:
+                # The prompt registered its content key for the default model
+                self._register_content_key(job, prompt, 2048, json_schema, model)
+
+            cache = getattr(self.client, "response_cache", None)
+            if refresh_cache and cache is not None:
+                cache.discard(cache.make_key(prompt, 0.2, 2048, json_schema, model))
 
             # Generate response with JSON schema enforcement
             try:
@@ -167,7 +351,9 @@ class MatchScorer:
                     prompt,
                     temperature=0.2,  # Lower temperature for more consistent JSON output
                     max_tokens=2048,
-                    json_schema=json_schema
+                    json_schema=json_schema,
+                    model=model,
+                    on_token=on_token,
                 )
             except requests.exceptions.Timeout:
                 error_msg = "Request timed out"
@@ -188,66 +374,156 @@ class MatchScorer:
                 print(f"[WARNING] JSON parse error scoring job: {job.get('title', 'Unknown')}")
                 return None
 
-            if not response or not isinstance(response, dict):
-                error_msg = f"Invalid response from AI: {type(response).__name__}"
-                if self.failure_tracker:
-                    self.failure_tracker.record_failure(job, "scoring", ErrorType.UNKNOWN_ERROR, error_msg)
-                print(f"[WARNING] Failed to score job: {job.get('title', 'Unknown')} - Invalid response type")
-                return None
+            return self._finalize_score(job, deterministic_scores, response, use_hybrid_scoring)
+
+        except Exception as e:
+            error_msg = f"Unexpected error: {str(e)}"
+            if self.failure_tracker:
+                self.failure_tracker.record_failure(job, "scoring", ErrorType.UNKNOWN_ERROR, error_msg)
+            print(f"[WARNING] Unexpected error scoring job {job.get('title', 'Unknown')}: {e}")
+            return None
 
-            # Extract AI score and reasoning
-            ai_match_score = response.get("match_score", 0)
-            ai_reasoning = response.get("reasoning", "No reasoning provided")
-            matched_requirements = response.get("matched_requirements", {})
+    def _scoring_model(self, deterministic_scores: Dict[str, Any]) -> Optional[str]:
+        """
+        Pick the model for a job's AI score
 
-            # Validate AI score
-            if not isinstance(ai_match_score, (int, float)) or ai_match_score < 0 or ai_match_score > 100:
-                error_msg = f"Invalid match score: {ai_match_score}"
-                if self.failure_tracker:
-                    self.failure_tracker.record_failure(job, "scoring", ErrorType.VALIDATION_ERROR, error_msg)
-                print(f"[WARNING] Invalid match score: {ai_match_score}, defaulting to 0")
-                ai_match_score = 0
-
-            # Combine deterministic and AI scores if hybrid scoring enabled
-            if use_hybrid_scoring:
-                combined = self.comparison_engine.combine_scores(
-                    deterministic_scores,
-                    int(ai_match_score),
-                    ai_reasoning
-                )
-                final_score = int(combined['combined_score'])
-                final_reasoning = f"[Hybrid Score: {final_score}/100 = Deterministic {combined['deterministic_component']:.0f} + AI {combined['ai_component']:.0f}]\n\n{ai_reasoning}"
-            else:
-                final_score = int(ai_match_score)
-                final_reasoning = ai_reasoning
+        Jobs whose title/salary/location already decide the outcome (clearly strong
+        or clearly weak) go to the fast model; borderline jobs get the full model.
 
-            # Check preferences
-            preference_checks = self.analyzer.validate_job_preferences(job)
+        Args:
+            deterministic_scores: Output of calculate_deterministic_score
 
-            result = {
-                "match_score": final_score,
-                "reasoning": final_reasoning,
-                "matched_requirements": matched_requirements,
-                "preference_checks": preference_checks,
-            }
+        Returns:
+            Fast model name, or None for the server's default model
+        """
+        fast_model = getattr(self.client, "fast_model", None)
+        if not (self.use_fast_model and fast_model):
+            return None
 
-            # Add hybrid scoring breakdown if enabled
-            if use_hybrid_scoring:
-                result["scoring_breakdown"] = {
-                    "deterministic_score": deterministic_scores['deterministic_score'],
-                    "ai_score": int(ai_match_score),
-                    "combined_score": final_score,
-                    "deterministic_breakdown": deterministic_scores,
-                }
+        score = deterministic_scores['deterministic_score']
+        if score <= FAST_MODEL_MAX_DETERMINISTIC or score >= FAST_MODEL_MIN_DETERMINISTIC:
+            return fast_model
+        return None
 
-            return result
+    def _finalize_score(
+        self, job: Dict[str, Any], deterministic_scores: Dict[str, Any],
+        response: Optional[Dict[str, Any]], use_hybrid_scoring: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Validate an AI scoring response and combine it with the deterministic score
 
-        except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}"
+        Args:
+            job: Job dict being scored
+            deterministic_scores: Result of ComparisonEngine.calculate_deterministic_score
+            response: Parsed AI response
+            use_hybrid_scoring: If True, combines deterministic + AI scores
+
+        Returns:
+            Dict with match_score, reasoning, and preference_checks
+            Returns None if the response is unusable
+        """
+        if not response or not isinstance(response, dict):
+            error_msg = f"Invalid response from AI: {type(response).__name__}"
             if self.failure_tracker:
                 self.failure_tracker.record_failure(job, "scoring", ErrorType.UNKNOWN_ERROR, error_msg)
-            print(f"[WARNING] Unexpected error scoring job {job.get('title', 'Unknown')}: {e}")
+            print(f"[WARNING] Failed to score job: {job.get('title', 'Unknown')} - Invalid response type")
+            return None
+
+        # Extract AI score and reasoning
+        ai_match_score = response.get("match_score", 0)
+        ai_reasoning = response.get("reasoning", "No reasoning provided")
+        matched_requirements = response.get("matched_requirements", {})
+
+        # Validate AI score
+        if not isinstance(ai_match_score, (int, float)) or ai_match_score < 0 or ai_match_score > 100:
+            error_msg = f"Invalid match score: {ai_match_score}"
+            if self.failure_tracker:
+                self.failure_tracker.record_failure(job, "scoring", ErrorType.VALIDATION_ERROR, error_msg)
+            print(f"[WARNING] Invalid match score: {ai_match_score}, defaulting to 0")
+            ai_match_score = 0
+
+        # Combine deterministic and AI scores if hybrid scoring enabled
+        if use_hybrid_scoring:
+            combined = self.comparison_engine.combine_scores(
+                deterministic_scores,
+                int(ai_match_score),
+                ai_reasoning
+            )
+            final_score = int(combined['combined_score'])
+            final_reasoning = f"[Hybrid Score: {final_score}/100 = Deterministic {combined['deterministic_component']:.0f} + AI {combined['ai_component']:.0f}]\n\n{ai_reasoning}"
+        else:
+            final_score = int(ai_match_score)
+            final_reasoning = ai_reasoning
+
+        # Check preferences
+        preference_checks = self.analyzer.validate_job_preferences(job)
+
+        result = {
+            "match_score": final_score,
+            "reasoning": final_reasoning,
+            "matched_requirements": matched_requirements,
+            "preference_checks": preference_checks,
+        }
+
+        # Add hybrid scoring breakdown if enabled
+        if use_hybrid_scoring:
+            result["scoring_breakdown"] = {
+                "deterministic_score": deterministic_scores['deterministic_score'],
+                "ai_score": int(ai_match_score),
+                "ai_reasoning": ai_reasoning,
+                "combined_score": final_score,
+                "deterministic_breakdown": deterministic_scores,
+            }
+
+        return result
+
+    def score_from_ai_response(
+        self, job: Dict[str, Any], response: Dict[str, Any], use_hybrid_scoring: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Score a job with an AI response obtained elsewhere (e.g. from a similar posting)
+
+        The deterministic title/salary/location score is computed for this job.
+
+        Args:
+            job: Job dict being scored
+            response: AI response with match_score, reasoning and matched_requirements
+            use_hybrid_scoring: If True, combines deterministic + AI scores
+
+        Returns:
+            Dict with match_score, reasoning, and preference_checks
+            Returns None if scoring fails
+        """
+        try:
+            deterministic_scores = self.comparison_engine.calculate_deterministic_score(job)
+        except Exception as e:
+            print(f"[WARNING] Deterministic scoring failed for {job.get('title', 'Unknown')}: {e}")
             return None
+        return self._finalize_score(job, deterministic_scores, response, use_hybrid_scoring)
+
+    @staticmethod
+    def ai_response_from_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Recover the AI part of a score_job() result
+
+        Args:
+            result: Result dict from score_job()
+
+        Returns:
+            Dict with the AI's match_score, reasoning and matched_requirements
+        """
+        breakdown = result.get("scoring_breakdown")
+        if breakdown:
+            return {
+                "match_score": breakdown["ai_score"],
+                "reasoning": breakdown["ai_reasoning"],
+                "matched_requirements": result.get("matched_requirements", {}),
+            }
+        return {
+            "match_score": result["match_score"],
+            "reasoning": result["reasoning"],
+            "matched_requirements": result.get("matched_requirements", {}),
+        }
 
     def _create_scoring_prompt(self, job: Dict[str, Any]) -> str:
         """
@@ -259,6 +535,28 @@ class MatchScorer:
         Returns:
             Formatted prompt string
         """
+        # Shared candidate block first (cacheable prefix), job-specific content after.
+        # Only the job posting is formatted per call; the rest is fixed or cached text.
+        prompt = (
+            self.analyzer.get_candidate_context()
+            + SCORING_PROMPT_PREAMBLE
+            + self._format_job_posting(job)
+            + SCORING_PROMPT_INSTRUCTIONS
+        )
+
+        self._register_content_key(job, prompt, 2048, SCORING_JSON_SCHEMA)
+        return prompt
+
+    def _format_job_posting(self, job: Dict[str, Any]) -> str:
+        """
+        Format the job posting section of the scoring prompt
+
+        Args:
+            job: Job dict from JobPost
+
+        Returns:
+            Job posting text (title, requirements, compensation, work, company, description)
+        """
         # Extract structured job sections
         job_sections = extract_job_sections(job)
 
@@ -344,13 +642,7 @@ About the Company:
         # === DESCRIPTION ===
         description = job.get("description", "No description available")
 
-        resume_text = self.analyzer.resume_text or "No resume provided"
-        candidate_requirements_text = self.analyzer.get_requirements_text()
-        preferences_text = self.analyzer.get_preferences_text()
-
-        prompt = f"""You are an expert job matching system. Evaluate how well this job posting matches what the candidate is looking for AND whether they're qualified.
-
-**JOB POSTING:**
+        return f"""**JOB POSTING:**
 
 **TITLE & ROLE:**
 {title_text}
@@ -372,140 +664,94 @@ About the Company:
 
 ---
 
-**CANDIDATE RESUME:**
-{resume_text}
-
----
-
-**CANDIDATE'S REQUIREMENTS AND PREFERENCES:**
-
-{candidate_requirements_text}
-
-**ADDITIONAL PREFERENCES (salary/location from filters):**
-{preferences_text}
-
----
-
-**EVALUATION INSTRUCTIONS:**
-
-Complete each evaluation step and track your assessment. Your final score MUST reflect the cumulative result of all steps.
-
-**STEP 1: DEAL-BREAKER CHECK**
-Review ONLY the MUST-HAVES and AVOID lists (these are the ONLY deal-breakers):
-- Does this job satisfy ALL MUST-HAVES? (Yes/No)
-- Does this job contain ANY AVOID items? (Yes/No)
-- If ANY deal-breaker is triggered → Cap score at 49 maximum
-
-IMPORTANT: Skills and other preferences are NOT deal-breakers. A job missing some preferred skills should NOT be disqualified. Only MUST-HAVES and AVOID items can disqualify a job.
-
-**STEP 2: DOMAIN MATCH CHECK**
-Read the ENTIRE job description to determine the actual role:
-- What is the primary domain? (e.g., data engineering, frontend, DevOps, etc.)
-- Does this match the candidate's target domain? (Yes/Partial/No)
-- If NO (wrong domain entirely) → Cap score at 59 maximum
-- If PARTIAL (adjacent/overlapping domain) → Cap score at 74 maximum
-
-**STEP 3: ROLE ALIGNMENT SCORING** (0-30 points)
-How well does the role match what the candidate wants?
-- 25-30: Exact target role match (title AND responsibilities align perfectly)
-- 18-24: Strong alignment (clearly in target domain, minor title/scope differences)
-- 10-17: Moderate alignment (right domain but different focus area)
-- 0-9: Weak alignment (tangentially related)
-
-**STEP 4: QUALIFICATIONS FIT SCORING** (0-40 points)
-How qualified is the candidate for this specific role?
-- 35-40: Exceeds requirements (candidate has more experience/skills than the job requires)
-- 28-34: Fully qualified (candidate meets all key requirements listed in the job)
-- 20-27: Mostly qualified (candidate meets most requirements, missing 1-2 specific skills)
-- 12-19: Partially qualified (candidate is missing several required skills or significant experience)
-- 0-11: Under-qualified (candidate lacks fundamental skills or experience for this role)
-
-**STEP 5: PREFERENCES SCORING** (0-30 points)
-How well does the job meet the candidate's stated preferences?
-- Remote/location preference met? (0-10 points)
-- Salary in acceptable range? (0-10 points)
-- Other preferences (company size, tech stack, etc.)? (0-10 points)
-
-**WHAT MATTERS VS. WHAT DOESN'T:**
+"""
 
-Things that SHOULD impact the score:
-- Does the job match the candidate's target role and domain?
-- Does the candidate have the technical skills the job requires?
-- Does the job meet the candidate's must-haves (remote, salary, etc.)?
-- Does the job trigger any avoid items?
+    def _register_content_key(
+        self, job: Dict[str, Any], prompt: str, max_tokens: int, json_schema: Dict[str, Any],
+        model: Optional[str] = None
+    ):
+        """
+        Key the cached response for this prompt on the posting's content as well
 
-Things that should NOT significantly impact the score:
-- Lack of experience at the specific company (everyone is new to a company when they join)
-- Lack of experience in the specific industry/vertical (transferable skills matter more)
-- Candidate having MORE skills than the job mentions (this is a positive, not a gap)
-- Unclear seniority levels or job leveling systems
-- Minor differences in job title wording (e.g., "Data Platform Engineer" vs "Data Engineer")
-- Job not using ALL of the candidate's listed skills (the candidate's skills are a POOL of technologies they know - a job only needs to match SOME of them, not all)
+        A posting re-crawled from another source (or with trivial text drift) gets
+        a different prompt, but the same normalized title, company, description and
+        compensation/work/company details, so it reuses the AI response; the
+        deterministic part is still computed per job.
 
-**FINAL SCORE CALCULATION:**
-1. Sum your points from Steps 3-5 (maximum 100)
-2. Apply any caps from Steps 1-2 if triggered
-3. The result is your match_score
+        Args:
+            job: Job dict the prompt was built for
+            prompt: Prompt text
+            max_tokens: Max tokens the prompt is sent with
+            json_schema: JSON schema the prompt is sent with
+            model: Model the prompt is routed to (None = server default)
+        """
+        cache = getattr(self.client, "response_cache", None)
+        if cache is None:
+            return
+        content_id = job_content_id(job, self.analyzer.get_candidate_context())
+        cache.register_content_key(
+            prompt, content_id, temperature=0.2, max_tokens=max_tokens, json_schema=json_schema, model=model
+        )
 
-**SCORE INTERPRETATION:**
-- 85-100: Strong match - Right role, candidate can do the job, core preferences met. May still have minor gaps.
-- 70-84: Good match - Right domain, candidate is qualified, some preference trade-offs. May have a few gaps.
-- 50-69: Moderate match - Alignment concerns (adjacent role, missing important skills, or significant preference gaps)
-- 0-49: Poor match - Wrong domain, deal-breaker triggered, or candidate lacks core required skills
+    def _create_fused_prompt(self, job: Dict[str, Any]) -> str:
+        """
+        Create the scoring prompt extended with gap analysis and resume recommendations
 
-Note: Having gaps does NOT mean the score should be low. Most real job matches have some gaps - what matters is whether the candidate can do the job and the job meets their core requirements.
+        Args:
+            job: Job dict
 
-**REASONING REQUIREMENTS:**
-In your 2-3 sentence explanation, state:
-1. The actual role type and whether it matches the target domain
-2. Key qualification matches or gaps
-3. Any deal-breakers or preference issues
+        Returns:
+            Formatted prompt string
+        """
+        prompt = (
+            self.analyzer.get_candidate_context()
+            + SCORING_PROMPT_PREAMBLE
+            + self._format_job_posting(job)
+            + FUSED_PROMPT_INSTRUCTIONS
+        )
+        self._register_content_key(job, prompt, 4096, FUSED_JSON_SCHEMA)
+        return prompt
 
-**CRITICAL OUTPUT REQUIREMENTS:**
-- You MUST respond with ONLY a JSON object
-- DO NOT include any explanations, thinking, or text before or after the JSON
-- DO NOT use markdown code blocks or formatting
-- The response must start with {{ and end with }}
+    @staticmethod
+    def _fused_extras(response: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Pull the analysis/optimization fields out of a fused response
 
-**REQUIRED JSON FORMAT:**
-{{
-  "match_score": <integer from 0 to 100>,
-  "reasoning": "<2-3 sentences: role type + domain match, qualification fit, any concerns>",
-  "matched_requirements": {{}}
-}}"""
+        Each group is only taken when all of its fields are present with the
+        right type, so incomplete groups can be redone by the dedicated pass.
 
-        return prompt
+        Args:
+            response: Parsed fused response
 
-    def score_jobs_batch(
-        self, jobs: list, progress_callback: Optional[callable] = None, apply_pre_filters: bool = True
-    ) -> list:
+        Returns:
+            Dict with the complete field groups (may be empty)
         """
-        Score multiple jobs (with multi-threading support and pre-filtering)
+        extras = {}
+        if not isinstance(response, dict):
+            return extras
+        for fields in (FUSED_ANALYSIS_FIELDS, FUSED_OPTIMIZATION_FIELDS):
+            if all(isinstance(response.get(name), kind) for name, kind in fields.items()):
+                extras.update({name: response[name] for name in fields})
+        return extras
+
+    def _select_jobs_for_scoring(self, jobs: list, apply_pre_filters: bool = True) -> list:
+        """
+        Drop checkpointed jobs and apply pre-filters before AI scoring
+
+        Records filtered/title-rejected jobs on self.filtered_jobs / self.rejected_jobs.
 
         Args:
             jobs: List of job dicts
-            progress_callback: Optional callback function(current, total, job)
-            apply_pre_filters: If True, applies deterministic filters before AI scoring (default: True)
+            apply_pre_filters: If True, applies deterministic filters (else legacy title filter)
 
         Returns:
-            List of jobs with added match_score, reasoning, etc.
+            List of jobs that should be scored with AI (may be empty)
         """
-        # Reset tracking lists
-        self.failed_jobs = []
-        self.rejected_jobs = []
-        self.filtered_jobs = []
-
-        # Get thread count from environment
-        max_workers = int(os.getenv("MATCH_THREADS", "4"))
-        total = len(jobs)
-
-        # Get list of already-processed jobs from checkpoint
-        processed_urls = set()
+        # Filter out already-processed jobs from checkpoint
+        jobs_to_process = jobs
         if self.checkpoint_manager:
             processed_urls = set(self.checkpoint_manager.get_processed_urls("scoring"))
-
-        # Filter out already-processed jobs
-        jobs_to_process = [job for job in jobs if job.get("job_url", "") not in processed_urls]
+            jobs_to_process = [job for job in jobs if job.get("job_url", "") not in processed_urls]
 
         if not jobs_to_process:
             return []
@@ -550,6 +796,34 @@ In your 2-3 sentence explanation, state:
             print("\n[WARNING] No jobs passed filters!")
             return []
 
+        return jobs_to_process
+
+    def score_jobs_batch(
+        self, jobs: list, progress_callback: Optional[callable] = None, apply_pre_filters: bool = True
+    ) -> list:
+        """
+        Score multiple jobs (with multi-threading support and pre-filtering)
+
+        Args:
+            jobs: List of job dicts
+            progress_callback: Optional callback function(current, total, job)
+            apply_pre_filters: If True, applies deterministic filters before AI scoring (default: True)
+
+        Returns:
+            List of jobs with added match_score, reasoning, etc.
+        """
+        # Reset tracking lists
+        self.failed_jobs = []
+        self.rejected_jobs = []
+        self.filtered_jobs = []
+
+        # Get thread count from environment
+        max_workers = int(os.getenv("MATCH_THREADS", "4"))
+
+        jobs_to_process = self._select_jobs_for_scoring(jobs, apply_pre_filters)
+        if not jobs_to_process:
+            return []
+
         # Update total to reflect filtered count
         total = len(jobs_to_process)
 
@@ -651,53 +925,8 @@ In your 2-3 sentence explanation, state:
         max_workers = int(os.getenv("MATCH_THREADS", "4"))
         queue_delay_ms = int(os.getenv("BATCH_QUEUE_DELAY_MS", "50"))
 
-        # Filter out already-processed jobs from checkpoint
-        jobs_to_process = jobs
-        if self.checkpoint_manager:
-            processed_urls = set(self.checkpoint_manager.get_processed_urls("scoring"))
-            jobs_to_process = [job for job in jobs if job.get("job_url", "") not in processed_urls]
-
-        if not jobs_to_process:
-            return []
-
-        # APPLY DETERMINISTIC PRE-FILTERS
-        if apply_pre_filters:
-            print(f"\n🔍 Applying deterministic filters to {len(jobs_to_process)} jobs...")
-
-            passed_jobs, rejected_jobs, filter_stats = apply_filters_to_jobs(
-                jobs_to_process,
-                self.analyzer.candidate_profile,
-                self.analyzer.preferences
-            )
-
-            # Track filtered jobs
-            self.filtered_jobs = rejected_jobs
-
-            # Print filter statistics
-            print(f"✅ Filters passed: {filter_stats['passed_jobs']} jobs")
-            print(f"❌ Filters rejected: {filter_stats['rejected_jobs']} jobs")
-            print(f"📊 Pass rate: {filter_stats['pass_rate']*100:.1f}%")
-
-            if filter_stats['rejection_reasons']:
-                print(f"\n📋 Rejection breakdown:")
-                for reason, count in filter_stats['rejection_reasons'].items():
-                    print(f"   • {reason}: {count} jobs")
-
-            # Use filtered jobs for AI scoring
-            jobs_to_process = passed_jobs
-        else:
-            # TITLE RELEVANCE FILTER (legacy fallback if pre-filters disabled)
-            relevant_jobs = []
-            for job in jobs_to_process:
-                if self._is_title_relevant(job):
-                    relevant_jobs.append(job)
-                else:
-                    self.rejected_jobs.append(job)
-
-            jobs_to_process = relevant_jobs
-
+        jobs_to_process = self._select_jobs_for_scoring(jobs, apply_pre_filters)
         if not jobs_to_process:
-            print("\n[WARNING] No jobs passed filters!")
             return []
 
         print(f"\n[INFO] Scoring {len(jobs_to_process)} jobs with AI (batch queue mode)...\n")
@@ -734,26 +963,7 @@ In your 2-3 sentence explanation, state:
             return self._create_scoring_prompt(job)
 
         # Define AI parameters for async batch mode
-        json_schema = {
-            "type": "object",
-            "properties": {
-                "match_score": {
-                    "type": "integer",
-                    "minimum": 0,
-                    "maximum": 100,
-                    "description": "Match score from 0 to 100"
-                },
-                "reasoning": {
-                    "type": "string",
-                    "description": "Brief explanation of the score (2-3 sentences)"
-                },
-                "matched_requirements": {
-                    "type": "object",
-                    "description": "Dictionary of matched requirements (can be empty)"
-                }
-            },
-            "required": ["match_score", "reasoning", "matched_requirements"]
-        }
+        json_schema = SCORING_JSON_SCHEMA
 
         # Define AI executor (fallback for thread-based mode)
         def ai_executor(prompt: str) -> Optional[Dict[str, Any]]:
@@ -813,6 +1023,7 @@ In your 2-3 sentence explanation, state:
                     scoring_breakdown = {
                         "deterministic_score": deterministic_scores['deterministic_score'],
                         "ai_score": int(ai_match_score),
+                        "ai_reasoning": ai_reasoning,
                         "combined_score": final_score,
                         "deterministic_breakdown": deterministic_scores,
                     }
@@ -876,6 +1087,156 @@ In your 2-3 sentence explanation, state:
 
         return scored_jobs
 
+    def score_jobs_async(
+        self, jobs: list, progress_callback: Optional[callable] = None, apply_pre_filters: bool = True,
+        fused: bool = False
+    ) -> list:
+        """
+        Score multiple jobs with concurrent async requests (asyncio + aiohttp)
+
+        Requests share one aiohttp session and at most LLM_PARALLELISM (default:
+        llama-server's slot count, else 8) are in flight at once.
+
+        Args:
+            jobs: List of job dicts
+            progress_callback: Optional callback function(current, total, job)
+            apply_pre_filters: If True, applies deterministic filters before AI scoring (default: True)
+            fused: If True, also request gap analysis and resume recommendations in the same call
+
+        Returns:
+            List of jobs with added match_score, reasoning, etc. (input order)
+        """
+        if not ASYNC_AVAILABLE:
+            print("[WARNING] aiohttp not available - falling back to threaded scoring")
+            return self.score_jobs_batch(jobs, progress_callback, apply_pre_filters)
+
+        jobs_to_process = self.prepare_batch(jobs, apply_pre_filters)
+        if not jobs_to_process:
+            return []
+
+        parallelism = self.client.get_parallelism()
+        print(f"\n[INFO] Scoring {len(jobs_to_process)} jobs with AI (async, {parallelism} parallel)...\n")
+
+        return asyncio.run(self._score_jobs_async(jobs_to_process, progress_callback, parallelism, fused))
+
+    async def _score_jobs_async(
+        self, jobs: list, progress_callback: Optional[callable], parallelism: int, fused: bool = False
+    ) -> list:
+        """Fan out scoring requests and collect results as they complete"""
+        import aiohttp
+
+        semaphore = asyncio.Semaphore(parallelism)
+        total = len(jobs)
+
+        async def score_one(session, index: int, job: Dict[str, Any]):
+            return index, await self.score_job_async(session, job, semaphore, fused=fused)
+
+        connector = aiohttp.TCPConnector(limit=parallelism, limit_per_host=parallelism)
+        scored_jobs: List[Optional[Dict[str, Any]]] = [None] * total
+
+        async with aiohttp.ClientSession(connector=connector) as session:
+            tasks = [score_one(session, index, job) for index, job in enumerate(jobs)]
+            for completed, future in enumerate(asyncio.as_completed(tasks), 1):
+                index, job_with_score = await future
+                scored_jobs[index] = job_with_score
+                if progress_callback:
+                    progress_callback(completed, total, jobs[index])
+
+        return scored_jobs
+
+    async def score_job_async(
+        self, session, job: Dict[str, Any], semaphore: asyncio.Semaphore, fused: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Score one job over a shared aiohttp session
+
+        Failures are recorded (failure tracker, self.failed_jobs) and returned
+        as a zero-score job, so callers always get a result back.
+
+        Args:
+            session: aiohttp session to send the request on
+            job: Job dict
+            semaphore: Semaphore bounding concurrent LLM requests
+            fused: If True, also request gap analysis and resume recommendations
+
+        Returns:
+            Job dict with match_score, reasoning, etc.
+        """
+        import aiohttp
+
+        def failed_result(reasoning: str) -> Dict[str, Any]:
+            self.failed_jobs.append(job)
+            return {
+                **job,
+                "match_score": 0,
+                "reasoning": reasoning,
+                "matched_requirements": {},
+                "preference_checks": {},
+            }
+
+        title = job.get("title", "Unknown")
+        try:
+            # CPU work (deterministic score, prompt) stays outside the semaphore
+            deterministic_scores = self.comparison_engine.calculate_deterministic_score(job)
+            model = None
+            if fused:
+                # Fused requests also write the gap analysis, so they stay on the full model
+                prompt, schema, max_tokens = self._create_fused_prompt(job), FUSED_JSON_SCHEMA, 4096
+            else:
+                prompt, schema, max_tokens = self._create_scoring_prompt(job), SCORING_JSON_SCHEMA, 2048
+                model = self._scoring_model(deterministic_scores)
+                if model:
+                    self._register_content_key(job, prompt, max_tokens, schema, model)
+
+            async with semaphore:
+                response = await self.client.generate_json_async(
+                    session, prompt, temperature=0.2, max_tokens=max_tokens, json_schema=schema, model=model
+                )
+
+            score_result = self._finalize_score(job, deterministic_scores, response)
+            if score_result and fused:
+                score_result.update(self._fused_extras(response))
+            job_with_score = {**job, **score_result} if score_result else failed_result("Failed to score job")
+        except asyncio.TimeoutError:
+            if self.failure_tracker:
+                self.failure_tracker.record_failure(job, "scoring", ErrorType.TIMEOUT_ERROR, "Request timed out")
+            print(f"[WARNING] Timeout scoring job: {title}")
+            job_with_score = failed_result("Failed to score job")
+        except aiohttp.ClientConnectionError as e:
+            if self.failure_tracker:
+                self.failure_tracker.record_failure(job, "scoring", ErrorType.CONNECTION_ERROR, f"Connection error: {str(e)}")
+            print(f"[WARNING] Connection error scoring job: {title}")
+            job_with_score = failed_result("Failed to score job")
+        except Exception as e:
+            if self.failure_tracker:
+                self.failure_tracker.record_failure(job, "scoring", ErrorType.UNKNOWN_ERROR, f"Unexpected error: {str(e)}")
+            print(f"[WARNING] Unexpected error scoring job {title}: {e}")
+            job_with_score = failed_result(f"Error during processing: {str(e)}")
+
+        job_url = job.get("job_url", "")
+        if self.checkpoint_manager and job_url:
+            self.checkpoint_manager.mark_job_completed("scoring", job_url)
+
+        return job_with_score
+
+    def prepare_batch(self, jobs: list, apply_pre_filters: bool = True) -> list:
+        """
+        Reset per-batch tracking and select the jobs that need AI scoring
+
+        For callers that schedule score_job_async() themselves.
+
+        Args:
+            jobs: List of job dicts
+            apply_pre_filters: If True, applies deterministic filters before AI scoring
+
+        Returns:
+            Jobs to score with AI
+        """
+        self.failed_jobs = []
+        self.rejected_jobs = []
+        self.filtered_jobs = []
+        return self._select_jobs_for_scoring(jobs, apply_pre_filters)
+
     def get_failed_jobs(self) -> List[Dict[str, Any]]:
         """
         Get list of jobs that failed during the last batch scoring
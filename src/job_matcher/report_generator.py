@@ -63,11 +63,8 @@ class ReportGenerator:
 
         output_path = os.path.join(self.output_dir, filename)
 
-        # Store source for use in _generate_html
-        self._current_source = source
-
         # Generate HTML
-        html = self._generate_html(jobs, report_title, source_file)
+        html = self._generate_html(jobs, report_title, source_file, source)
 
         # Write to file
         with open(output_path, "w", encoding="utf-8") as f:
@@ -75,7 +72,9 @@ class ReportGenerator:
 
         return output_path
 
-    def _generate_html(self, jobs: List[Dict[str, Any]], report_title: str, source_file: Optional[str] = None) -> str:
+    def _generate_html(
+        self, jobs: List[Dict[str, Any]], report_title: str, source_file: Optional[str] = None, source: str = "indeed"
+    ) -> str:
         """Generate complete HTML document"""
 
         # Sort jobs by match score
@@ -92,9 +91,8 @@ class ReportGenerator:
         # Add source data metadata if provided
         source_meta = f'    <meta name="source-data" content="{source_file}">\n' if source_file else ''
 
-        # Get source from the generate_report call (passed via self during generation)
-        # Default to 'indeed' if not specified
-        source_name = getattr(self, '_current_source', 'indeed')
+        # Passed as an argument (not stored on self) so concurrent reports keep their own source
+        source_name = source
 
         # Complete HTML document
         html = f"""<!DOCTYPE html>
@@ -0,0 +1,364 @@
+"""
+ResponseCache - Persistent cache for parsed LLM responses
+
+Many postings share near-identical descriptions (reposts, templated JDs,
+staffing-agency duplicates), so the same prompt is often sent to the model
+more than once across runs. Responses are keyed by a hash of the
+whitespace-normalized prompt plus the generation parameters and the model
+identity (the routed model and the model the server has loaded); the prompt
+already embeds the job description, resume and instructions, so any change
+to those produces a new key.
+
+Callers can also register a content key for a request (e.g., the scoring
+prompt of a job keyed on its normalized title/company/description plus its
+compensation, work and company details), so the same posting re-crawled
+from another source, whose prompt differs only in source-specific fields,
+reuses the earlier response. While a response is
+being generated its key is marked in flight, so a duplicate request from
+another thread (e.g. the same posting in a concurrently processed source)
+waits for that response instead of sending its own.
+
+Thread-safe for multi-threaded job processing.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.database import get_database
+from src.utils import fast_json
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Lowercase and reduce punctuation/whitespace runs to single spaces (for content keys)"""
+    return _NON_WORD_RE.sub(" ", (text or "").lower()).strip()
+
+
+# Job fields the prompts show besides title/company/description. Source-specific
+# fields (job_url, site) are left out so re-crawled postings still match.
+_CONTENT_DETAIL_FIELDS = (
+    "skills", "requirements",
+    "salary_min", "salary_max", "salary_currency", "salary_period", "salary_source", "benefits",
+    "remote", "location", "job_type", "work_arrangements",
+    "company_size", "company_revenue", "company_description", "company_website", "company_rating",
+    "easy_apply", "occupation_code", "occupation_confidence", "is_sponsored", "sponsorship_level",
+)
+
+
+def job_content_id(
+    job: Dict[str, Any], candidate_context: str, stage: str = "", stage_inputs: Optional[tuple] = None
+) -> str:
+    """
+    Identify what an LLM response about a job depends on, independent of its source
+
+    Args:
+        job: Job dict
+        candidate_context: Shared candidate block the prompt starts with
+        stage: Pipeline stage the response is for ("" for scoring)
+        stage_inputs: Results of earlier stages the prompt embeds (e.g. match score and reasoning)
+
+    Returns:
+        Content identifier for ResponseCache.register_content_key()
+    """
+    parts = [
+        candidate_context,
+        normalize_text(job.get("title")),
+        normalize_text(job.get("company")),
+        normalize_text(job.get("description")),
+        json.dumps([job.get(field) for field in _CONTENT_DETAIL_FIELDS], sort_keys=True, default=str),
+    ]
+    if stage:
+        parts.insert(0, stage)
+    if stage_inputs is not None:
+        parts.append(json.dumps(list(stage_inputs), sort_keys=True, default=str))
+    return "\x00".join(parts)
+
+
+class ResponseCache:
+    """Cache parsed LLM JSON responses in DuckDB with an in-memory front"""
+
+    def __init__(
+        self,
+        profile_name: Optional[str] = None,
+        ttl_days: Optional[int] = None,
+        content_keys: bool = True,
+        model_id: Optional[str] = None,
+    ):
+        """
+        Initialize ResponseCache
+
+        Args:
+            profile_name: Profile name (default: from .env ACTIVE_PROFILE)
+            ttl_days: Days before a cached response expires (default: from .env, 30)
+            content_keys: Honor register_content_key(); False limits hits to identical prompts
+                          (e.g. while tuning prompts, where an edited template must not reuse old answers)
+            model_id: Identity of the model the server has loaded (e.g. LlamaClient.get_model_id()),
+                      so responses from a previously loaded model aren't reused after a swap
+        """
+        self.db = get_database(profile_name)
+        self.content_keys = content_keys
+        self.model_id = model_id
+        self.ttl_days = ttl_days if ttl_days is not None else int(os.getenv("LLM_CACHE_TTL_DAYS", "30"))
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._aliases: Dict[str, str] = {}
+        self._in_flight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.content_hits = 0
+        self.misses = 0
+
+    def make_key(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        json_schema: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+    ) -> str:
+        """
+        Build the cache key for a request
+
+        Args:
+            prompt: Prompt text (whitespace is normalized before hashing)
+            temperature: Generation temperature
+            max_tokens: Max tokens to generate
+            json_schema: Optional JSON schema sent with the request
+            model: Model the request was routed to (None = server default)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        normalized = _WHITESPACE_RE.sub(" ", prompt).strip()
+        # The routed model and the server's loaded model are only appended when known.
+        # Stays on stdlib json: the exact bytes are part of every stored key.
+        params = [temperature, max_tokens, json_schema] + ([model] if model else [])
+        if self.model_id:
+            params.append(f"server:{self.model_id}")
+        params = json.dumps(params, sort_keys=True)
+        return hashlib.sha256(f"{normalized}\x00{params}".encode("utf-8")).hexdigest()
+
+    def register_content_key(
+        self,
+        prompt: str,
+        content_id: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        json_schema: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+    ):
+        """
+        Let a request also match responses stored for the same content
+
+        Args:
+            prompt: Prompt text of the request
+            content_id: Identifier of what the response depends on (e.g., normalized job text)
+            temperature: Generation temperature of the request
+            max_tokens: Max tokens of the request
+            json_schema: JSON schema of the request
+            model: Model the request is routed to (None = server default)
+        """
+        if not self.content_keys:
+            return
+        key = self.make_key(prompt, temperature, max_tokens, json_schema, model)
+        content_key = self.make_key(f"content:{content_id}", temperature, max_tokens, json_schema, model)
+        with self._lock:
+            self._aliases[key] = content_key
+
+    def claim(self, key: str) -> Optional[threading.Event]:
+        """
+        Mark a request as being generated, unless an equivalent one already is
+
+        Requests sharing a content key count as equivalent. A caller that gets
+        None must call release() once it has stored (or failed to get) a response.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            None if the caller should generate the response, otherwise an Event
+            that is set when the in-flight equivalent finishes
+        """
+        with self._lock:
+            flight_key = self._aliases.get(key, key)
+            event = self._in_flight.get(flight_key)
+            if event is None:
+                self._in_flight[flight_key] = threading.Event()
+            return event
+
+    def release(self, key: str):
+        """
+        Finish a claim made with claim() and wake any waiting duplicates
+
+        Args:
+            key: Key passed to claim()
+        """
+        with self._lock:
+            event = self._in_flight.pop(self._aliases.get(key, key), None)
+        if event is not None:
+            event.set()
+
+    def _cutoff(self) -> datetime:
+        return datetime.now() - timedelta(days=self.ttl_days)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached response dict, or None on a miss
+        """
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Look up cached responses for several keys with one query
+
+        Args:
+            keys: Keys from make_key()
+
+        Returns:
+            Cached response dicts (or None for misses), in the same order as keys
+        """
+        with self._lock:
+            aliases = {key: self._aliases[key] for key in keys if key in self._aliases}
+            lookup = set(keys) | set(aliases.values())
+            found = {key: self._memory[key] for key in lookup if key in self._memory}
+
+        missing = list(lookup - found.keys())
+        if missing:
+            try:
+                rows = self.db.fetchall(
+                    """SELECT prompt_hash, response_json FROM llm_response_cache
+                       WHERE prompt_hash IN (SELECT unnest(?)) AND created_at >= ?""",
+                    (missing, self._cutoff())
+                )
+            except Exception as e:
+                print(f"[WARNING] LLM cache lookup failed: {e}")
+                rows = []
+
+            loaded = {}
+            for prompt_hash, response_json in rows:
+                try:
+                    loaded[prompt_hash] = fast_json.loads(response_json)
+                except (json.JSONDecodeError, TypeError):
+                    continue
+
+            with self._lock:
+                self._memory.update(loaded)
+            found.update(loaded)
+
+        results = []
+        content_hit_count = 0
+        for key in keys:
+            result = found.get(key)
+            if result is None and key in aliases:
+                result = found.get(aliases[key])
+                content_hit_count += result is not None
+            results.append(result)
+
+        hit_count = sum(1 for result in results if result is not None)
+        with self._lock:
+            self.hits += hit_count
+            self.content_hits += content_hit_count
+            self.misses += len(keys) - hit_count
+        return results
+
+    def put(self, key: str, response: Optional[Dict[str, Any]]):
+        """
+        Store a response (None/empty responses are not cached)
+
+        Args:
+            key: Key from make_key()
+            response: Parsed response dict
+        """
+        self.put_many([(key, response)])
+
+    def put_many(self, items: List[tuple]):
+        """
+        Store several responses in one batch
+
+        Args:
+            items: List of (key, response) tuples; None/empty responses are skipped
+        """
+        items = [(key, response) for key, response in items if response]
+        if not items:
+            return
+
+        with self._lock:
+            # Also store under the content key, if one was registered for the request
+            items += [(self._aliases[key], response) for key, response in items if key in self._aliases]
+            for key, response in items:
+                self._memory[key] = response
+
+        now = datetime.now()
+        try:
+            with self.db.batch_context() as batch:
+                batch.executemany(
+                    """INSERT INTO llm_response_cache (prompt_hash, response_json, created_at)
+                       VALUES (?, ?, ?)
+                       ON CONFLICT (prompt_hash) DO UPDATE SET
+                           response_json = excluded.response_json,
+                           created_at = excluded.created_at""",
+                    [(key, fast_json.dumps(response), now) for key, response in items]
+                )
+        except Exception as e:
+            print(f"[WARNING] LLM cache write failed: {e}")
+
+    def discard(self, key: str):
+        """
+        Forget the cached response for a request (and its content key, if registered)
+
+        Args:
+            key: Key from make_key()
+        """
+        with self._lock:
+            keys = [key] + ([self._aliases[key]] if key in self._aliases else [])
+            for k in keys:
+                self._memory.pop(k, None)
+
+        try:
+            self.db.execute("DELETE FROM llm_response_cache WHERE prompt_hash IN (SELECT unnest(?))", (keys,))
+        except Exception as e:
+            print(f"[WARNING] LLM cache delete failed: {e}")
+
+    def purge_expired(self) -> int:
+        """
+        Delete responses older than the TTL
+
+        Returns:
+            Number of cached responses deleted
+        """
+        cutoff = self._cutoff()
+        result = self.db.fetchone(
+            "SELECT COUNT(*) FROM llm_response_cache WHERE created_at < ?",
+            (cutoff,)
+        )
+        count = result[0] if result else 0
+        if count:
+            self.db.execute("DELETE FROM llm_response_cache WHERE created_at < ?", (cutoff,))
+        return count
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get hit/miss counters for this process
+
+        Returns:
+            Dict with hits (content_hits of them via a content key) and misses
+        """
+        with self._lock:
+            return {"hits": self.hits, "content_hits": self.content_hits, "misses": self.misses}
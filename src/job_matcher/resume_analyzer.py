@@ -65,6 +65,12 @@ class ResumeAnalyzer:
         self.candidate_profile = None
         self.preferences = None
 
+        # (path, mtime) of the files behind the loaded data; load_all() skips re-parsing while unchanged
+        self._loaded_signature = None
+        # Formatted candidate block and the data it was built from
+        self._candidate_context = None
+        self._candidate_context_key = None
+
     def load_resume(self, path: Optional[str] = None) -> str:
         """
         Load resume from file
@@ -80,6 +86,7 @@ class ResumeAnalyzer:
             ValueError: If file format is not supported
         """
         path = path or self.resume_path
+        self._loaded_signature = None
         file_path = Path(path)
 
         if not file_path.exists():
@@ -145,6 +152,7 @@ class ResumeAnalyzer:
             yaml.YAMLError: If YAML is invalid
         """
         path = path or self.requirements_path
+        self._loaded_signature = None
         file_path = Path(path)
 
         if not file_path.exists():
@@ -243,6 +251,42 @@ class ResumeAnalyzer:
 
         return "\n".join(lines)
 
+    def get_candidate_context(self) -> str:
+        """
+        Format the candidate block that opens every job prompt
+
+        Scoring, gap analysis and optimization prompts all start with this exact
+        text (resume, requirements, preferences) and put job-specific content
+        after it, so llama-server can reuse the cached prefix across jobs and passes.
+
+        Returns:
+            Candidate context text (ends with a separator line)
+        """
+        # Every prompt starts with this block; rebuild it only when the loaded data changes
+        context_key = (self.resume_text, id(self.candidate_profile), id(self.preferences))
+        if self._candidate_context is not None and context_key == self._candidate_context_key:
+            return self._candidate_context
+
+        resume_text = self.resume_text or "No resume provided"
+
+        self._candidate_context_key = context_key
+        self._candidate_context = f"""**CANDIDATE RESUME:**
+{resume_text}
+
+---
+
+**CANDIDATE'S REQUIREMENTS AND PREFERENCES:**
+
+{self.get_requirements_text()}
+
+**ADDITIONAL PREFERENCES (salary/location from filters):**
+{self.get_preferences_text()}
+
+---
+
+"""
+        return self._candidate_context
+
     def get_preferences_text(self) -> str:
         """
         Format preferences as readable text for AI prompts
@@ -330,17 +374,36 @@ class ResumeAnalyzer:
         """
         Load both resume and requirements
 
+        Files that haven't changed since the last successful load are not read
+        or parsed again, so repeated calls (each pipeline run/source) are cheap.
+
         Returns:
             True if both loaded successfully, False otherwise
         """
+        signature = self._file_signature()
+        if signature is not None and signature == self._loaded_signature:
+            return True
+
         try:
             self.load_resume()
             self.load_requirements()
-            return True
         except Exception as e:
             print(f"X Error loading files: {e}")
             return False
 
+        self._loaded_signature = signature
+        return True
+
+    def _file_signature(self) -> Optional[tuple]:
+        """(path, mtime) of the resume and requirements files, or None if either can't be read"""
+        try:
+            return tuple(
+                (str(path), os.stat(path).st_mtime_ns)
+                for path in (self.resume_path, self.requirements_path)
+            )
+        except OSError:
+            return None
+
 
 if __name__ == "__main__":
     # Test the analyzer
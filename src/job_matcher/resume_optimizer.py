@@ -6,6 +6,7 @@ including keywords, experience highlights, and cover letter talking points.
 Supports multi-threaded processing for faster batch optimization.
 """
 
+import asyncio
 import json
 import os
 import threading
@@ -15,6 +16,7 @@ from typing import Dict, Any, Optional, List
 from .llama_client import LlamaClient
 from .resume_analyzer import ResumeAnalyzer
 from .failure_tracker import FailureTracker, ErrorType
+from .response_cache import job_content_id
 from .smooth_batch_processor import SmoothBatchProcessor
 
 
@@ -76,30 +78,7 @@ class ResumeOptimizer:
                 print(f"[WARNING] JSON parse error optimizing job: {job.get('title', 'Unknown')}")
                 return None
 
-            if not response:
-                error_msg = "Empty response from AI"
-                if self.failure_tracker:
-                    self.failure_tracker.record_failure(job, "optimization", ErrorType.UNKNOWN_ERROR, error_msg)
-                print(f"[WARNING] Failed to optimize for job: {job.get('title', 'Unknown')}")
-                return None
-
-            # Validate required fields
-            required_fields = ["keywords", "experience_highlights", "sections_to_expand", "cover_letter_points", "resume_summary"]
-            missing_fields = [f for f in required_fields if f not in response]
-            if missing_fields:
-                error_msg = f"Missing required fields: {', '.join(missing_fields)}"
-                if self.failure_tracker:
-                    self.failure_tracker.record_failure(job, "optimization", ErrorType.VALIDATION_ERROR, error_msg)
-                print(f"[WARNING] Validation error optimizing job: {error_msg}")
-                return None
-
-            return {
-                "keywords": response.get("keywords", []),
-                "experience_highlights": response.get("experience_highlights", []),
-                "sections_to_expand": response.get("sections_to_expand", []),
-                "cover_letter_points": response.get("cover_letter_points", []),
-                "resume_summary": response.get("resume_summary", ""),
-            }
+            return self._optimization_from_response(job, response)
 
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
@@ -108,6 +87,91 @@ class ResumeOptimizer:
             print(f"[WARNING] Unexpected error optimizing job {job.get('title', 'Unknown')}: {e}")
             return None
 
+    async def optimize_for_job_async(
+        self, session, job: Dict[str, Any], semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """
+        Optimize for one job over a shared aiohttp session
+
+        Used by the pipelined pass runner. Failures are recorded and the job is
+        returned with empty optimization fields, like the batch methods do.
+
+        Args:
+            session: aiohttp session to send the request on
+            job: Job dict with match_score, analysis, etc. from previous passes
+            semaphore: Semaphore bounding concurrent LLM requests
+
+        Returns:
+            Job dict with the optimization fields added
+        """
+        import aiohttp
+
+        title = job.get("title", "Unknown")
+        result = None
+        try:
+            prompt = self._create_optimization_prompt(job)
+            async with semaphore:
+                response = await self.client.generate_json_async(
+                    session, prompt, temperature=0.5, max_tokens=2048
+                )
+            result = self._optimization_from_response(job, response)
+        except asyncio.TimeoutError:
+            if self.failure_tracker:
+                self.failure_tracker.record_failure(job, "optimization", ErrorType.TIMEOUT_ERROR, "Request timed out")
+            print(f"[WARNING] Timeout optimizing job: {title}")
+        except aiohttp.ClientConnectionError as e:
+            if self.failure_tracker:
+                self.failure_tracker.record_failure(job, "optimization", ErrorType.CONNECTION_ERROR, f"Connection error: {str(e)}")
+            print(f"[WARNING] Connection error optimizing job: {title}")
+        except Exception as e:
+            if self.failure_tracker:
+                self.failure_tracker.record_failure(job, "optimization", ErrorType.UNKNOWN_ERROR, f"Unexpected error: {str(e)}")
+            print(f"[WARNING] Unexpected error optimizing job {title}: {e}")
+
+        job_url = job.get("job_url", "")
+        if self.checkpoint_manager and job_url:
+            self.checkpoint_manager.mark_job_completed("optimization", job_url)
+
+        if result:
+            return {**job, **result}
+
+        self.failed_jobs.append(job)
+        return {
+            **job,
+            "keywords": [],
+            "experience_highlights": [],
+            "sections_to_expand": [],
+            "cover_letter_points": [],
+            "resume_summary": "",
+        }
+
+    def _optimization_from_response(self, job: Dict[str, Any], response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Validate an AI response and extract the optimization fields (None on failure)"""
+        if not response:
+            error_msg = "Empty response from AI"
+            if self.failure_tracker:
+                self.failure_tracker.record_failure(job, "optimization", ErrorType.UNKNOWN_ERROR, error_msg)
+            print(f"[WARNING] Failed to optimize for job: {job.get('title', 'Unknown')}")
+            return None
+
+        # Validate required fields
+        required_fields = ["keywords", "experience_highlights", "sections_to_expand", "cover_letter_points", "resume_summary"]
+        missing_fields = [f for f in required_fields if f not in response]
+        if missing_fields:
+            error_msg = f"Missing required fields: {', '.join(missing_fields)}"
+            if self.failure_tracker:
+                self.failure_tracker.record_failure(job, "optimization", ErrorType.VALIDATION_ERROR, error_msg)
+            print(f"[WARNING] Validation error optimizing job: {error_msg}")
+            return None
+
+        return {
+            "keywords": response.get("keywords", []),
+            "experience_highlights": response.get("experience_highlights", []),
+            "sections_to_expand": response.get("sections_to_expand", []),
+            "cover_letter_points": response.get("cover_letter_points", []),
+            "resume_summary": response.get("resume_summary", ""),
+        }
+
     def _create_optimization_prompt(self, job: Dict[str, Any]) -> str:
         """
         Create AI prompt for resume optimization
@@ -126,16 +190,14 @@ class ResumeOptimizer:
         gaps = job.get("gaps", [])
         assessment = job.get("assessment", "")
 
-        resume_text = self.analyzer.resume_text or "No resume provided"
-        profile_text = self.analyzer.get_requirements_text()
-
         # Format strengths and gaps
         strengths_text = "\n".join([f"  {s}" for s in strengths])
         gaps_text = "\n".join([f"  [WARNING] {g}" for g in gaps])
 
-        prompt = f"""CRITICAL: YOU MUST RESPOND WITH ONLY JSON. NO THINKING. NO EXPLANATION. NO TEXT BEFORE OR AFTER THE JSON. START YOUR RESPONSE WITH THE OPENING BRACE {{
+        # Shared candidate block first (cacheable prefix), job-specific content after
+        prompt = self.analyzer.get_candidate_context() + f"""CRITICAL: YOU MUST RESPOND WITH ONLY JSON. NO THINKING. NO EXPLANATION. NO TEXT BEFORE OR AFTER THE JSON. START YOUR RESPONSE WITH THE OPENING BRACE {{
 
-You are an expert resume writer and career coach. You've analyzed this job posting and identified the candidate's strengths and gaps.
+You are an expert resume writer and career coach. You've analyzed the job posting below and identified the candidate's strengths and gaps.
 
 **JOB POSTING:**
 Title: {job_title}
@@ -146,15 +208,6 @@ Description:
 
 ---
 
-**CANDIDATE RESUME:**
-{resume_text}
-
----
-
-**{profile_text}**
-
----
-
 **MATCH ANALYSIS:**
 Match Score: {match_score}/100
 
@@ -216,6 +269,15 @@ Using the candidate's profile (their core strengths, technical skills, and caree
 
 Be specific and actionable. Reference actual content from the resume where possible."""
 
+        cache = getattr(self.client, "response_cache", None)
+        if cache is not None:
+            # The same posting from another source reuses this response, as long as it was scored and analyzed the same
+            content_id = job_content_id(
+                job, self.analyzer.get_candidate_context(), "optimization",
+                stage_inputs=(match_score, strengths, gaps, assessment),
+            )
+            cache.register_content_key(prompt, content_id, temperature=0.5, max_tokens=2048)
+
         return prompt
 
     def optimize_jobs_batch(
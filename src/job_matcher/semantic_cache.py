@@ -0,0 +1,186 @@
+"""
+SemanticCache - Reuse scoring results for near-duplicate job postings
+
+Reposts, franchise listings and ATS-templated descriptions differ by a few
+words, so their prompts (and exact ResponseCache keys) differ while the
+answer would not. SemanticCache embeds each scored posting's title, company
+and description and returns the stored result of the most similar posting
+when the cosine similarity clears a threshold.
+
+Embeddings come from sentence-transformers (all-MiniLM-L6-v2) when it is
+installed; otherwise a hashed bag-of-words/bigrams vector is used, which is
+enough to catch reposts and templated descriptions. Results are grouped by
+a context id (candidate profile + scoring mode), so changing the resume or
+requirements never reuses an old result.
+"""
+
+import hashlib
+import importlib.util
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .response_cache import normalize_text
+
+# sentence-transformers pulls in torch, so only check for it here and load the model on first use
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_THRESHOLD = 0.92
+
+# Dimensions of the fallback hashed bag-of-words vectors
+_HASH_DIM = 4096
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _hash_embed(text: str) -> np.ndarray:
+    """Hashed word + bigram counts, L2-normalized (fallback embedding)"""
+    tokens = _TOKEN_RE.findall(text)
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    vector = np.zeros(_HASH_DIM, dtype=np.float32)
+    for feature in features:
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        vector[int.from_bytes(digest, "little") % _HASH_DIM] += 1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class SemanticCache:
+    """Nearest-neighbour cache of scoring results keyed on posting text"""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        threshold: float = DEFAULT_THRESHOLD,
+        model_name: str = DEFAULT_MODEL,
+    ):
+        """
+        Initialize SemanticCache
+
+        Args:
+            path: .npz file the cache is persisted to (created on first store)
+            threshold: Minimum cosine similarity for a hit
+            model_name: sentence-transformers model (ignored when it isn't installed)
+        """
+        self.path = Path(path)
+        self.threshold = threshold
+        self.model_name = model_name
+        self._model = None
+        self._lock = threading.Lock()
+        self.backend = "sentence-transformers" if SENTENCE_TRANSFORMERS_AVAILABLE else "hashed-bow"
+
+        self._vectors: Optional[np.ndarray] = None
+        self._contexts: List[str] = []
+        self._entries: List[Dict[str, Any]] = []
+        self._load()
+
+    def _load(self):
+        """Read the persisted cache, ignoring it if it was built with another embedding backend"""
+        if not self.path.exists():
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                if str(data["backend"]) != self.backend:
+                    return
+                self._vectors = data["vectors"].astype(np.float32)
+                self._contexts = data["contexts"].tolist()
+                self._entries = [json.loads(entry) for entry in data["entries"].tolist()]
+        except Exception as e:
+            print(f"[WARNING] Could not read semantic cache {self.path}: {e}")
+            self._vectors, self._contexts, self._entries = None, [], []
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.stem}.tmp.npz")
+        np.savez(
+            tmp_path,
+            backend=np.array(self.backend),
+            vectors=self._vectors,
+            contexts=np.array(self._contexts),
+            entries=np.array([json.dumps(entry, ensure_ascii=False) for entry in self._entries]),
+        )
+        tmp_path.replace(self.path)
+
+    @staticmethod
+    def job_text(job: Dict[str, Any]) -> str:
+        """Normalized text a posting is compared on"""
+        return " ".join(normalize_text(job.get(field)) for field in ("title", "company", "description"))
+
+    def embed(self, job: Dict[str, Any]) -> np.ndarray:
+        """
+        Embed a posting as an L2-normalized float32 vector
+
+        Args:
+            job: Job dict
+
+        Returns:
+            Unit vector for cosine comparisons
+        """
+        text = self.job_text(job)
+        if self.backend == "hashed-bow":
+            return _hash_embed(text)
+
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name)
+        return self._model.encode(text, normalize_embeddings=True).astype(np.float32)
+
+    def lookup(self, job: Dict[str, Any], context_id: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """
+        Find the stored result of the most similar posting scored under the same context
+
+        Args:
+            job: Job dict to score
+            context_id: Identifier of everything else the result depends on
+
+        Returns:
+            (similarity, entry) for the best match above the threshold, or None.
+            entry has job_url and result.
+        """
+        vector = self.embed(job)
+        with self._lock:
+            if self._vectors is None or not len(self._entries):
+                return None
+
+            mask = np.fromiter((context == context_id for context in self._contexts), dtype=bool, count=len(self._contexts))
+            if not mask.any():
+                return None
+
+            # Vectors are unit length, so one matrix-vector product gives every cosine similarity
+            similarities = np.where(mask, self._vectors @ vector, -1.0)
+            best = int(similarities.argmax())
+            if similarities[best] < self.threshold:
+                return None
+            return float(similarities[best]), self._entries[best]
+
+    def store(self, job: Dict[str, Any], context_id: str, result: Dict[str, Any]):
+        """
+        Remember a scoring result for a posting (replaces an earlier one for the same job_url and context)
+
+        Args:
+            job: Job dict that was scored
+            context_id: Identifier of everything else the result depends on
+            result: Scoring result to reuse for similar postings
+        """
+        vector = self.embed(job)[np.newaxis, :]
+        entry = {"job_url": job.get("job_url"), "result": result}
+
+        with self._lock:
+            for i, (context, existing) in enumerate(zip(self._contexts, self._entries)):
+                if context == context_id and existing.get("job_url") == entry["job_url"]:
+                    self._vectors[i] = vector[0]
+                    self._entries[i] = entry
+                    break
+            else:
+                self._vectors = vector if self._vectors is None else np.vstack([self._vectors, vector])
+                self._contexts.append(context_id)
+                self._entries.append(entry)
+
+            try:
+                self._save()
+            except OSError as e:
+                print(f"[WARNING] Could not save semantic cache {self.path}: {e}")
@@ -124,11 +124,10 @@ class MatcherFullPipelineTool(BaseTool):
         # Filter unprocessed jobs if requested
         original_count = len(jobs)
         if skip_processed:
-            unprocessed = []
-            for job in jobs:
-                if not tracker.is_processed(job.get("job_url", "")):
-                    unprocessed.append(job)
-            jobs = unprocessed
+            processed_urls = tracker.get_processed_urls(
+                [job.get("job_url", "") for job in jobs]
+            )
+            jobs = [job for job in jobs if job.get("job_url", "") not in processed_urls]
         skipped_count = original_count - len(jobs)
 
         if not jobs:
@@ -233,8 +232,7 @@ class MatcherFullPipelineTool(BaseTool):
                 email_recipients = [e.strip() for e in email_recipients_str.split(',') if e.strip()]
                 if email_recipients:
                     subject_prefix = os.getenv("EMAIL_SUBJECT_PREFIX", "[Job Matcher]")
-                    for recipient in email_recipients:
-                        email_service.send_report(recipient, optimized, report_path, subject_prefix)
+                    email_service.send_report_to_recipients(email_recipients, optimized, report_path, subject_prefix)
                     email_sent = True
 
         # Clear checkpoint
@@ -383,11 +381,10 @@ class MatcherScoreTool(BaseTool):
             jobs = json.load(f)
 
         # Filter unprocessed jobs
-        unprocessed = []
-        for job in jobs:
-            job_url = job.get("job_url", "")
-            if not tracker.is_processed(job_url):
-                unprocessed.append(job)
+        processed_urls = tracker.get_processed_urls(
+            [job.get("job_url", "") for job in jobs]
+        )
+        unprocessed = [job for job in jobs if job.get("job_url", "") not in processed_urls]
 
         skipped_count = len(jobs) - len(unprocessed)
 
@@ -633,10 +630,7 @@ class MatcherRetryFailedTool(BaseTool):
                 json.dump(retry_succeeded, f, indent=2, ensure_ascii=False)
 
             # Mark successful retries as resolved
-            for job in retry_succeeded:
-                job_url = job.get("job_url", "")
-                if job_url:
-                    failure_tracker.mark_resolved(job_url, stage)
+            failure_tracker.mark_resolved_bulk([job.get("job_url", "") for job in retry_succeeded], stage)
 
             # Update tracker for scoring stage
             if stage == "scoring":
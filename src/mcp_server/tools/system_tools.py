@@ -304,18 +304,17 @@ class SystemFullPipelineTool(BaseTool):
                     # - Multi-source subject: "30 Total Matches (Indeed: 20, Glassdoor: 10)"
                     # - Email body with sections for each source (color-coded with icons)
                     # - All reports attached (each color-coded by source)
-                    for recipient in email_recipients:
-                        try:
-                            email_service.send_multi_source_report(
-                                recipient,
-                                jobs_by_source,
-                                report_paths,
-                                subject_prefix
-                            )
-                            email_sent = True
-                        except Exception as e:
-                            # Log but don't fail the pipeline
-                            pass
+                    try:
+                        email_service.send_multi_source_report_to_recipients(
+                            email_recipients,
+                            jobs_by_source,
+                            report_paths,
+                            subject_prefix
+                        )
+                        email_sent = True
+                    except Exception as e:
+                        # Log but don't fail the pipeline
+                        pass
 
         # ====================================================================================
         # Build final comprehensive response (SINGLE response returned to LLM)
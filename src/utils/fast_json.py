@@ -0,0 +1,169 @@
+"""
+Fast JSON - JSON file helpers with optional orjson acceleration
+
+Job files can hold thousands of postings with long descriptions. orjson
+parses them directly from bytes (no intermediate str) and is several
+times faster than the stdlib json module. Falls back to json when orjson
+is not installed, and for documents orjson rejects (NaN/Infinity literals).
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, List, Union
+
+# Try to import orjson for faster parsing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If data isn't valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals json.dump writes for float NaN
+            # (e.g. NULL salaries), so retry those documents with the stdlib parser
+            pass
+    return json.loads(data)
+
+
+def load_json_file(path: Union[str, Path]) -> Any:
+    """
+    Read and parse a JSON file
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed Python object
+    """
+    return loads(Path(path).read_bytes())
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """
+    Serialize to indented (2-space) UTF-8 JSON
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_json_file(path: Union[str, Path], obj: Any) -> None:
+    """
+    Serialize and write a JSON file (indented, UTF-8)
+
+    The data is written to a temporary file, synced, and renamed over the
+    destination, so readers (and a resume after a crash) never see a
+    partially written file.
+
+    Args:
+        path: Destination path
+        obj: JSON-serializable object
+    """
+    path = Path(path)
+    data = dumps_pretty(obj)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def append_jsonl_file(path: Union[str, Path], objs: Iterable[Any]) -> None:
+    """
+    Append objects to a JSON Lines file, one compact document per line
+
+    Args:
+        path: Destination path (created if missing)
+        objs: JSON-serializable objects
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        data = b"".join(orjson.dumps(obj, option=option) for obj in objs)
+    else:
+        data = "".join(json.dumps(obj, ensure_ascii=False) + "\n" for obj in objs).encode("utf-8")
+    with open(path, "ab+") as f:
+        # Drop a partial line left by an interrupted append before adding to it
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.seek(0)
+                f.truncate(f.read().rfind(b"\n") + 1)
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def load_jsonl_file(path: Union[str, Path]) -> List[Any]:
+    """
+    Read and parse a JSON Lines file (blank lines are skipped)
+
+    A final line cut short by an interrupted append is ignored.
+
+    Args:
+        path: Path to the JSONL file
+
+    Returns:
+        List of parsed documents, in file order
+    """
+    with open(path, "rb") as f:
+        lines = [line for line in f if line.strip()]
+
+    docs = [loads(line) for line in lines[:-1]]
+    if lines:
+        try:
+            docs.append(loads(lines[-1]))
+        except ValueError:
+            if lines[-1].endswith(b"\n"):
+                raise
+    return docs
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> str:
+    """
+    Serialize to a compact JSON string
+
+    Args:
+        obj: JSON-serializable object
+        sort_keys: Emit object keys in sorted order (stable output for hashing)
+
+    Returns:
+        JSON document as str
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys)
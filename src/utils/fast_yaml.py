@@ -0,0 +1,67 @@
+"""
+Fast YAML - YAML file loading with libyaml acceleration and an mtime cache
+
+Profile files such as requirements.yaml are read by several loaders in one
+run. PyYAML's default SafeLoader is pure Python; CSafeLoader (libyaml) is
+several times faster and is used when PyYAML was built with it. Parsed
+documents are also memoized by (mtime, size), so an unchanged file is only
+parsed once per process.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+import yaml
+
+# Use libyaml's C loader when available
+try:
+    from yaml import CSafeLoader as _SafeLoader
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+    LIBYAML_AVAILABLE = False
+
+# path -> ((mtime_ns, size), parsed document)
+_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a YAML document (safe subset)
+
+    Args:
+        data: YAML document as bytes or str
+
+    Returns:
+        Parsed Python object (None for an empty document)
+    """
+    return yaml.load(data, Loader=_SafeLoader)
+
+
+def load_yaml_file(path: Union[str, Path]) -> Any:
+    """
+    Read and parse a YAML file, reusing the previous parse while the file is unchanged
+
+    The returned object is shared between callers; treat it as read-only.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed Python object (None for an empty file)
+
+    Raises:
+        OSError: If the file can't be read (FileNotFoundError if it doesn't exist)
+        yaml.YAMLError: If the file isn't valid YAML
+    """
+    path = Path(path)
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _CACHE.get(str(path))
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    data = loads(path.read_bytes())
+    _CACHE[str(path)] = (signature, data)
+    return data
@@ -0,0 +1,42 @@
+"""
+Progress - Rate-limited console progress output
+
+Per-job progress lines are one stdout write each; on large runs (or when
+stdout is a pipe/log file) that adds up. ThrottledProgress prints at most
+one line per interval while always letting the final line through.
+"""
+
+import time
+from typing import Optional
+
+
+class ThrottledProgress:
+    """Print progress lines at most once per interval"""
+
+    def __init__(self, min_interval: float = 0.1):
+        """
+        Initialize ThrottledProgress
+
+        Args:
+            min_interval: Minimum seconds between printed lines (default: 0.1, i.e. 10 Hz)
+        """
+        self.min_interval_ns = int(min_interval * 1_000_000_000)
+        self._last_emit_ns: Optional[int] = None
+
+    def emit(self, line: str, force: bool = False) -> bool:
+        """
+        Print a progress line unless one was printed too recently
+
+        Args:
+            line: Line to print
+            force: Print regardless of the interval (e.g., for the last item)
+
+        Returns:
+            True if the line was printed
+        """
+        now = time.monotonic_ns()
+        if not force and self._last_emit_ns is not None and now - self._last_emit_ns < self.min_interval_ns:
+            return False
+        self._last_emit_ns = now
+        print(line)
+        return True